@@ -1,12 +1,26 @@
 import React from 'react';
 import styles from './styles.module.css';
 import InteractiveTable from '@site/src/components/utils/InteractiveTable';
+import { sameTextInputs, useDpTrace } from '@site/src/utils/dpTrace';
 
 interface Dp05Props {
   children?: React.ReactNode;
 }
 
+const getStairValues = (costs: number[]): number[] => {
+  const values = Array(costs.length + 1).fill(0);
+  for (let i = 2; i < costs.length + 1; i++) {
+    values[i] = Math.min(values[i - 1] + costs[i - 1], values[i - 2] + costs[i - 2]);
+  }
+
+  return values;
+};
+
 const Dp05 = ({ children }: Dp05Props) => {
+  const initialTextInputs = ['1,5,2,4,3'];
+  // Table exported by the Python solver, for the initial inputs
+  const traceValues = useDpTrace('dp_05');
+
   return (
     <>
       <InteractiveTable
@@ -21,16 +35,14 @@ const Dp05 = ({ children }: Dp05Props) => {
         }}
         getValues={(textInputs) => {
           const costs = textInputs[0].split(',').map(v => parseInt(v.trim()));
-          const values = Array(costs.length + 1).fill(0);
+          const values = traceValues !== null && sameTextInputs(textInputs, initialTextInputs)
+            ? traceValues[0]
+            : getStairValues(costs);
           const path = Array(costs.length + 1).fill(false);
-          values[0] = 0;
-          values[1] = 0;
           for (let i = 2; i < costs.length + 1; i++) {
             if (values[i - 1] + costs[i - 1] < values[i - 2] + costs[i - 2]) {
-              values[i] = values[i - 1] + costs[i - 1];
               path[i - 1] = true;
             } else {
-              values[i] = values[i - 2] + costs[i - 2];
               path[i - 2] = true;
             }
           }
@@ -44,7 +56,7 @@ const Dp05 = ({ children }: Dp05Props) => {
 
           return [costStrings, pathValues, pathAdd];
         }}
-        initialTextInputs={['1,5,2,4,3']}
+        initialTextInputs={initialTextInputs}
         getRowHeaders={(textInputs) => ['cost', 'dp', 'cost + dp']}
         children={children}
       />
@@ -1,11 +1,16 @@
 import React, { useState } from 'react';
 import InteractiveTable from '@site/src/components/utils/InteractiveTable';
+import { sameTextInputs, useDpTrace } from '@site/src/utils/dpTrace';
 
 interface Dp06Props {
   children?: React.ReactNode;
 }
 
 const Dp06 = ({ children }: Dp06Props) => {
+  const initialTextInputs = ['3', '7'];
+  // Table exported by the Python solver, for the initial inputs
+  const traceValues = useDpTrace('dp_06');
+
   return (
     <InteractiveTable
       validate={(textInput, index) => {
@@ -24,6 +29,10 @@ const Dp06 = ({ children }: Dp06Props) => {
         return true;
       }}
       getValues={(textInputs) => {
+        if (traceValues !== null && sameTextInputs(textInputs, initialTextInputs)) {
+          return traceValues;
+        }
+
         const dim = textInputs.map(v => parseInt(v));
         const values = Array(dim[0]).fill(null).map(_ => Array(dim[1]).fill(0))
         
@@ -43,7 +52,7 @@ const Dp06 = ({ children }: Dp06Props) => {
 
         return values;
       }}
-      initialTextInputs={['3', '7']}
+      initialTextInputs={initialTextInputs}
       children={children}
     />
   );
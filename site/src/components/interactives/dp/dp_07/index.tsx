@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import styles from './styles.module.css';
 import InteractiveTable from '@site/src/components/utils/InteractiveTable';
+import { sameTextInputs, useDpTrace } from '@site/src/utils/dpTrace';
 
 interface Dp07Props {
   children?: React.ReactNode;
@@ -87,6 +88,12 @@ const Dp07 = ({ children }: Dp07Props) => {
     getPath(initialTextInputs, getValues(initialTextInputs))[0]
   );
 
+  // Table exported by the Python solver, for the initial inputs
+  const traceValues = useDpTrace('dp_07');
+  const tableValues = (textInputs: string[]) => (
+    traceValues !== null && sameTextInputs(textInputs, initialTextInputs) ? traceValues : values
+  );
+
   return (
     <>
       <InteractiveTable
@@ -100,7 +107,7 @@ const Dp07 = ({ children }: Dp07Props) => {
           return true;
         }}
         onChange={updateValues}
-        getValues={(textInputs) => getPath(textInputs, values)[1]}
+        getValues={(textInputs) => getPath(textInputs, tableValues(textInputs))[1]}
         initialTextInputs={initialTextInputs}
         getColumnHeaders={(textInputs) => ['', ...textInputs[1].split('')]}
         getRowHeaders={(textInputs) => ['', ...textInputs[0].split('')]}
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import styles from './styles.module.css';
 import InteractiveTable from '@site/src/components/utils/InteractiveTable';
+import { sameTextInputs, useDpTrace } from '@site/src/utils/dpTrace';
 
 interface Dp08Props {
   children?: React.ReactNode;
@@ -93,15 +94,21 @@ const Dp08 = ({ children }: Dp08Props) => {
   const initialTextInputs = ['5', '(2, 20), (1, 10), (4, 30), (3, 15)'];
   const [values, setValues] = useState<number[][]>(getValues(...parseTextInputs(initialTextInputs)));
 
+  // Table exported by the Python solver, for the initial inputs
+  const traceValues = useDpTrace('dp_08');
+  const tableValues = (textInputs: string[]) => (
+    traceValues !== null && sameTextInputs(textInputs, initialTextInputs) ? traceValues : values
+  );
+
   return (
     <>
       <InteractiveTable
         validate={validate}
         onChange={updateValues}
-        getValues={(textInputs) => getPath(...parseTextInputs(textInputs), values)[1]}
+        getValues={(textInputs) => getPath(...parseTextInputs(textInputs), tableValues(textInputs))[1]}
         initialTextInputs={initialTextInputs}
         getColumnHeaders={(textInputs) => Array(parseTextInputs(textInputs)[0] + 1).fill(null).map((_, index) => index)}
-        getRowHeaders={(textInputs) => getPath(...parseTextInputs(textInputs), values)[0]}
+        getRowHeaders={(textInputs) => getPath(...parseTextInputs(textInputs), tableValues(textInputs))[0]}
         children={children}
       />
       <div>
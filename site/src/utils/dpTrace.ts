@@ -0,0 +1,77 @@
+import { useEffect, useState } from 'react';
+import useBaseUrl from '@docusaurus/useBaseUrl';
+
+// Version of the NDJSON traces written by video/export_traces.py
+const TRACE_VERSION = 1;
+
+interface TraceHeader {
+  version: number;
+  shape: number[];
+  origin: number[];
+}
+
+// One `[cell, value, move, parent]` line of a trace
+type TraceStep = [number[], number, number, number[] | null];
+
+// Build the DP table of an NDJSON trace, one dimensional tables as a single row
+const parseTraceValues = (text: string): number[][] | null => {
+  const lines = text.split('\n').filter(line => line.trim() !== '');
+  if (lines.length === 0) {
+    return null;
+  }
+
+  const header = JSON.parse(lines[0]) as TraceHeader;
+  if (header.version !== TRACE_VERSION || header.shape.length > 2) {
+    return null;
+  }
+
+  const [rows, cols] = header.shape.length === 2 ? header.shape : [1, header.shape[0]];
+  const values = Array(rows).fill(null).map(_ => Array(cols).fill(0));
+  for (const line of lines.slice(1)) {
+    const [cell, value] = JSON.parse(line) as TraceStep;
+    const local = cell.map((x, i) => x - header.origin[i]);
+    if (local.length === 2) {
+      values[local[0]][local[1]] = value;
+    } else {
+      values[0][local[0]] = value;
+    }
+  }
+
+  return values;
+};
+
+// Load the trace exported for an interactive, null until loaded or if it is missing
+const useDpTrace = (name: string): number[][] | null => {
+  const url = useBaseUrl(`/dp/traces/${name}.ndjson`);
+  const [values, setValues] = useState<number[][] | null>(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    fetch(url)
+      .then(response => response.ok ? response.text() : Promise.reject(response.status))
+      .then(text => {
+        if (!cancelled) {
+          setValues(parseTraceValues(text));
+        }
+      })
+      // The interactive computes the table in the browser instead
+      .catch(() => {});
+
+    return () => {
+      cancelled = true;
+    };
+  }, [url]);
+
+  return values;
+};
+
+const sameTextInputs = (textInputs: string[], otherTextInputs: string[]) => {
+  return textInputs.length === otherTextInputs.length
+    && textInputs.every((textInput, index) => textInput === otherTextInputs[index]);
+};
+
+export {
+  parseTraceValues,
+  sameTextInputs,
+  useDpTrace,
+};
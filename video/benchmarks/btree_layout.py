@@ -0,0 +1,58 @@
+"""
+Benchmark the relayout of a BTree against building it again with the new spacing.
+
+Usage:
+    python benchmarks/btree_layout.py [--sizes 6 8 10] [--repeat 5]
+"""
+from typing import List, Optional
+import argparse
+import itertools
+
+import manim
+
+# Needed to have relative import
+import sys
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from utils.btree import BTree
+from utils.fib_tree import build_fib_tree
+from timing import best_time
+
+
+def node_mobject(label: str, **kwargs) -> manim.VMobject:
+    """
+    Draw a node as a square, so the benchmark needs neither LaTeX nor Pango.
+    """
+    return manim.Square(0.3, **kwargs)
+
+
+def build(n: int, hbuff: float) -> BTree:
+    return BTree(build_fib_tree(n), hbuff=hbuff, vbuff=1.5, element_to_mobject=node_mobject)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 8, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'n':>4} {'nodes':>6} {'rebuild':>11} {'set_hbuff':>11} {'set_vbuff':>11} {'speedup':>8}")
+    for n in args.sizes:
+        tree = build(n, 1.0)
+        # Alternate the spacings, so every call moves the whole tree
+        hbuffs = itertools.cycle([1.2, 1.0])
+        vbuffs = itertools.cycle([2.0, 1.5])
+        rebuild = best_time(build, n, 1.2, repeat=args.repeat)
+        set_hbuff = best_time(lambda: tree.set_hbuff(next(hbuffs)), repeat=args.repeat)
+        set_vbuff = best_time(lambda: tree.set_vbuff(next(vbuffs)), repeat=args.repeat)
+        print(
+            f"{n:>4} {len(tree.nodes):>6} {rebuild:>10.4f}s {set_hbuff:>10.4f}s {set_vbuff:>10.4f}s"
+            f" {rebuild / set_hbuff:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark the edit distance engines against the plain DP of the scenes.
+
+Usage:
+    python benchmarks/edit_distance.py [--sizes 10 100 1000 10000]
+"""
+from typing import List, Optional
+import argparse
+import random
+
+# Needed to have relative import
+import sys
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from utils.dynamic_programming import align, edit_distance, solve_edit_distance
+from timing import best_time
+
+
+def plain_edit_distance(x: str, y: str) -> int:
+    """
+    Edit distance with a Python double loop over a full table, as in `dp_07_01`.
+    """
+    dp = [[0] * (len(y) + 1) for _ in range(len(x) + 1)]
+    for i in range(len(x) + 1):
+        for j in range(len(y) + 1):
+            if i == 0:
+                dp[i][j] = j
+            elif j == 0:
+                dp[i][j] = i
+            elif x[i - 1] == y[j - 1]:
+                dp[i][j] = dp[i - 1][j - 1]
+            else:
+                dp[i][j] = min(dp[i - 1][j], dp[i][j - 1], dp[i - 1][j - 1]) + 1
+    return dp[-1][-1]
+
+
+ENGINES = {
+    "plain": (plain_edit_distance, 2_000),
+    "numpy table": (lambda x, y: solve_edit_distance(x, y).value, 5_000),
+    "hirschberg": (lambda x, y: align(x, y).distance, 5_000),
+    "bit-parallel": (edit_distance, None),
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 5_000, 20_000])
+    parser.add_argument("--alphabet", default="acgt")
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    print(f"{'size':>7} " + " ".join(f"{name:>13}" for name in ENGINES) + "  distance")
+    for size in args.sizes:
+        x = "".join(random.choices(args.alphabet, k=size))
+        y = "".join(random.choices(args.alphabet, k=size))
+
+        cells = []
+        distances = set()
+        for function, max_size in ENGINES.values():
+            if max_size is not None and size > max_size:
+                cells.append(f"{'-':>13}")
+                continue
+            distances.add(function(x, y))
+            cells.append(f"{best_time(function, x, y):>12.4f}s")
+
+        assert len(distances) == 1, f"engines disagree: {distances}"
+        print(f"{size:>7} " + " ".join(cells) + f"  {distances.pop()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark the Fibonacci methods, from the naive recursion to fast doubling.
+
+Usage:
+    python benchmarks/fibonacci.py [--sizes 10 100 1000 10000 100000 1000000] [--mod M]
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import math
+
+# Needed to have relative import
+import sys
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from utils.dynamic_programming.fibonacci import METHODS
+from timing import best_time
+
+
+# Largest n each method is run for, exponential calls or n big ints in memory past it
+MAX_SIZES: Dict[str, Optional[int]] = {
+    "naive": 25,
+    "memo": 10_000,
+    "bottom_up": 10_000,
+    "rolling": 100_000,
+    "fast_doubling": None,
+    "matrix": None,
+}
+
+
+def growth_exponent(measured: List[Tuple[int, float]]) -> str:
+    """
+    Get the slope of log(time) against log(n) between the two largest sizes,
+    e.g. about 1 for a linear number of steps.
+    """
+    if len(measured) < 2 or measured[-2][1] <= 0:
+        return "-"
+    (n0, t0), (n1, t1) = measured[-2:]
+    return f"{math.log(t1 / t0) / math.log(n1 / n0):.2f}"
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 100, 1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--mod", type=int, default=None, help="compute modulo M, to time the steps without big ints")
+    args = parser.parse_args(argv)
+
+    print(f"{'n':>8} " + " ".join(f"{name:>13}" for name in METHODS) + "  bits")
+    times: Dict[str, List[Tuple[int, float]]] = {name: [] for name in METHODS}
+    for n in args.sizes:
+        cells = []
+        values = set()
+        for name, function in METHODS.items():
+            max_size = MAX_SIZES[name]
+            if max_size is not None and n > max_size:
+                cells.append(f"{'-':>13}")
+                continue
+            values.add(function(n, args.mod))
+            elapsed = best_time(function, n, args.mod)
+            times[name].append((n, elapsed))
+            cells.append(f"{elapsed:>12.6f}s")
+
+        assert len(values) == 1, f"methods disagree for n = {n}"
+        print(f"{n:>8} " + " ".join(cells) + f"  {values.pop().bit_length()}")
+
+    print(f"{'exponent':>8} " + " ".join(f"{growth_exponent(measured):>13}" for measured in times.values()))
+
+
+if __name__ == "__main__":
+    main()
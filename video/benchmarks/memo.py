@@ -0,0 +1,80 @@
+"""
+Benchmark the memo cache backends on the memoized Fibonacci recursion.
+
+Usage:
+    python benchmarks/memo.py [--sizes 1000 10000 100000 1000000] [--maxsize 64] [--no-log]
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import functools
+
+# Needed to have relative import
+import sys
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from utils.dynamic_programming import ArrayCache, DictCache, LRUCache, MemoCache, memoize
+from timing import timed
+
+
+# Values modulo a prime, so the cost is the cache and not big int additions
+MOD = 1_000_000_007
+
+
+def memo_fibonacci(decorator: Callable[[Callable], Callable], n: int) -> int:
+    """
+    Compute `F(n)` by the memoized recursion, asking `F(0), ..., F(n)` in order
+    so the recursion stays two calls deep.
+    """
+
+    @decorator
+    def fib(k: int) -> int:
+        return k if k < 2 else (fib(k - 1) + fib(k - 2)) % MOD
+
+    for k in range(n + 1):
+        value = fib(k)
+    return value
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--maxsize", type=int, default=64, help="size of the LRU cache")
+    parser.add_argument("--no-log", action="store_true", help="only count, without the event log")
+    args = parser.parse_args(argv)
+    record = not args.no_log
+
+    backends: Dict[str, Callable[[int], Optional[MemoCache]]] = {
+        "dict": lambda n: DictCache(record),
+        f"lru({args.maxsize})": lambda n: LRUCache(args.maxsize, record),
+        "array": lambda n: ArrayCache(n + 1, record),
+        "functools": lambda n: None,
+    }
+
+    print(f"{'n':>8} {'backend':>10} {'time':>10} {'hits':>8} {'misses':>8} {'evictions':>9} {'size':>8} {'log':>9}")
+    for n in args.sizes:
+        values = set()
+        for name, make_cache in backends.items():
+            cache = make_cache(n)
+            decorator = memoize(cache) if cache is not None else functools.lru_cache(maxsize=None)
+
+            value, elapsed = timed(memo_fibonacci, decorator, n)
+            values.add(value)
+
+            if cache is None:
+                print(f"{n:>8} {name:>10} {elapsed:>9.4f}s")
+                continue
+            stats = cache.stats()
+            log = f"{cache.log.nbytes() / 1e6:.1f}MB" if cache.log is not None else "-"
+            print(
+                f"{n:>8} {name:>10} {elapsed:>9.4f}s {stats['hits']:>8} {stats['misses']:>8} "
+                f"{stats['evictions']:>9} {stats['size']:>8} {log:>9}"
+            )
+
+        assert len(values) == 1, f"backends disagree for n = {n}"
+
+
+if __name__ == "__main__":
+    main()
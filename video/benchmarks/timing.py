@@ -0,0 +1,36 @@
+"""
+Timing helpers shared by the benchmark scripts.
+"""
+from typing import Any, Callable, Tuple
+import time
+
+
+def timed(function: Callable, *args) -> Tuple[Any, float]:
+    """
+    Call the function once and measure it.
+
+    Arguments:
+        function: The function.
+        args: The arguments of the call.
+
+    Returns:
+        The return value of the call and its wall time.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def best_time(function: Callable, *args, repeat: int = 3) -> float:
+    """
+    Get the best wall time of a few calls of the function.
+
+    Arguments:
+        function: The function.
+        args: The arguments of each call.
+        repeat: The number of calls.
+
+    Returns:
+        The shortest wall time.
+    """
+    return min(timed(function, *args)[1] for _ in range(repeat))
@@ -9,19 +9,33 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
 from utils.btree import BTree, BNode
+from utils.fib_tree import build_fib_tree
+from utils.call_tree import CallTracer
+from utils.tex_cache import math_tex
+from utils.scene_profiler import ProfiledScene
 
-class dp_01_01(manim.Scene):
+class dp_01_01(ProfiledScene, manim.Scene):
     def construct(self):
         config = {
             "font_size": 36,
         }
 
+        # Record the calls of fib(4)
+        tracer = CallTracer()
+
+        @tracer.trace
+        def fib(n: int) -> int:
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        fib(4)
+        call_tree, calls = tracer.tree.to_compact_tree()
+
         # Initialize fib(4) tree
         tree = BTree(
-            build_fib_tree(4),
+            call_tree,
             hbuff=1.2,
             vbuff=1.5,
-            element_to_mobject=manim.MathTex,
+            element_to_mobject=math_tex,
             element_to_mobject_config=config,
             circle_buffer_factor=1.2,
         )
@@ -37,7 +51,7 @@ class dp_01_01(manim.Scene):
             def reduce_and_show(fib: int):
                 fib_node, fib_arrow = stack.pop()
                 stack.append(fib)
-                value_label = manim.MathTex(f"{fib}")
+                value_label = math_tex(f"{fib}")
                 value_label.move_to(fib_node.get_mobject())
                 value_label.set_color(manim.GREEN)
 
@@ -47,11 +61,9 @@ class dp_01_01(manim.Scene):
                     *(manim.FadeToColor(arrow, manim.GREEN) for arrow in [fib_arrow] if arrow is not None),
                 )
 
-            # Base cases
-            if node.label == "f(0)":
-                reduce_and_show(0)
-            elif node.label == "f(1)":
-                reduce_and_show(1)
+            # Base cases, the calls that made no call
+            if node.left is None and node.right is None:
+                reduce_and_show(tracer.tree.results[calls[node.index]])
             else:
                 continue
             
@@ -73,11 +85,11 @@ class dp_01_01(manim.Scene):
             (tree.root, 2, None),
         ]
         for node, value, arrow in wrong_path:
-            wrong_label = manim.MathTex(f"{value}")
+            wrong_label = math_tex(f"{value}")
             wrong_label.move_to(node.get_mobject())
             wrong_label.set_color(manim.RED)
 
-            error_label = manim.MathTex(
+            error_label = math_tex(
                 r"\text{Error} \implies \text{Wrong!}" if value == 0 else r"\text{Wrong!}",
                 font_size=(28 if value == 0 else manim.DEFAULT_FONT_SIZE)
             )
@@ -96,7 +108,7 @@ class dp_01_01(manim.Scene):
 
         self.play(*[manim.FadeOut(mob)for mob in self.mobjects])
 
-class dp_01_02(manim.Scene):
+class dp_01_02(ProfiledScene, manim.Scene):
     def construct(self):
         config = {
             "font_size": 30,
@@ -107,7 +119,7 @@ class dp_01_02(manim.Scene):
             build_fib_tree(5),
             hbuff=0.9,
             vbuff=1.4,
-            element_to_mobject=manim.MathTex,
+            element_to_mobject=math_tex,
             element_to_mobject_config=config,
             circle_buffer_factor=1.2,
         )
@@ -115,7 +127,7 @@ class dp_01_02(manim.Scene):
         # Show tree
         vgroup = manim.VGroup()
         arrows = []
-        for layers in BTree.bfs_layer_by_layer(tree.root):
+        for layers in tree.levels.layers():
             subtree_layer = manim.VGroup()
             subtree_layer.add(*arrows)
 
@@ -194,22 +206,3 @@ def dfs_groups(tree: BTree) -> Generator[Tuple[manim.VGroup, BNode, manim.Line |
             parent_arrow[node.left] = node.get_left_arrow()
         if node.right is not None:
             parent_arrow[node.right] = node.get_right_arrow()
-
-def build_fib_tree(n: int) -> BNode:
-    """
-    Build a Fibonacci tree with `f(n)` as root.
-
-    Arguments:
-        n: the Fibonacci number
-    Returns:
-        root: root of the tree
-    """
-    if n == 0:
-        return BNode(f"f({n})")
-    elif n == 1:
-        return BNode(f"f({n})")
-    else:
-        root = BNode(f"f({n})")
-        root.left = build_fib_tree(n-1)
-        root.right = build_fib_tree(n-2)
-        return root
\ No newline at end of file
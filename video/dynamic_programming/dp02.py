@@ -10,19 +10,24 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
 from utils.btree import BTree, BNode
+from utils.fib_tree import build_fib_dag, build_fib_tree
+from utils.tex_cache import math_tex
+from utils.scene_profiler import ProfiledScene
+from utils.dynamic_programming import DictCache, MemoLog, memoize
+from utils.dynamic_programming.memo import HIT
 
-class dp_02_01(manim.Scene):
+class dp_02_01(ProfiledScene, manim.Scene):
     def construct(self):
         config = {
             "font_size": 36,
         }
 
-        # Initialize fib(12)
+        # Initialize fib(12), sharing the mobjects of repeated subproblems
         tree = BTree(
-            build_fib_tree(12),
+            build_fib_dag(12),
             hbuff=1.2,
             vbuff=1.5,
-            element_to_mobject=manim.MathTex,
+            element_to_mobject=math_tex,
             element_to_mobject_config=config,
             circle_buffer_factor=1.2,
         )
@@ -32,7 +37,7 @@ class dp_02_01(manim.Scene):
         subtree = self._play_subtree(tree, subtree_root)
         self.wait()
 
-        label = manim.MathTex(r"n = 4 \implies \text{No. of nodes} = 9")
+        label = math_tex(r"n = 4 \implies \text{No. of nodes} = 9")
         label.next_to(subtree_root.get_mobject().get_center(), manim.UP * 4)
         self.play(manim.Write(label))
 
@@ -75,11 +80,11 @@ class dp_02_01(manim.Scene):
             rate_func=manim.rate_functions.ease_in_out_sine,
         ))
 
-        label = manim.MathTex(r"n \implies \text{No. of nodes} = O(2^n)")
+        label = math_tex(r"n \implies \text{No. of nodes} = O(2^n)")
         label.next_to(tree.root.get_mobject().get_center(), manim.UP * 2)
         self.play(manim.Write(label))
         self.wait(3)
-        time_label = manim.MathTex(r"\text{Time complexity} = O(2^n)")
+        time_label = math_tex(r"\text{Time complexity} = O(2^n)")
         time_label.next_to(tree.root.get_mobject().get_center(), manim.UP * 2)
         self.play(manim.Transform(label, time_label))
         self.wait(3)
@@ -165,7 +170,7 @@ class dp_02_01(manim.Scene):
         
         return vgroup
 
-class dp_02_02(manim.Scene):
+class dp_02_02(ProfiledScene, manim.Scene):
     def construct(self):
         config = {
             "font_size": 28,
@@ -176,7 +181,7 @@ class dp_02_02(manim.Scene):
             build_fib_tree(5),
             hbuff=1,
             vbuff=1.2,
-            element_to_mobject=manim.MathTex,
+            element_to_mobject=math_tex,
             element_to_mobject_config=config,
             circle_buffer_factor=1.2,
         )
@@ -193,16 +198,25 @@ class dp_02_02(manim.Scene):
         tree.shift(-vgroup.get_center())
         tree.shift(manim.DOWN * 0.5)
 
+        # Run the memoized recursion, to replay its cache hits
+        cache = DictCache()
+
+        @memoize(cache)
+        def fib(n: int) -> int:
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        fib(5)
+
         # Show nodes by dfs, color repeated nodes, with a dp[n] node blow
-        for v in self._play_dfs_memoized(tree):
+        for v in self._play_dfs_memoized(tree, cache.log):
             vgroup.add(v)
 
         # Show O(n)
-        label = manim.MathTex(r"n \implies \text{No. of nodes} = O(n)")
+        label = math_tex(r"n \implies \text{No. of nodes} = O(n)")
         label.next_to(vgroup, manim.UP * 2)
         self.play(manim.Write(label))
         self.wait(3)
-        time_label = manim.MathTex(r"\text{Time complexity} = O(n)")
+        time_label = math_tex(r"\text{Time complexity} = O(n)")
         time_label.next_to(vgroup, manim.UP * 2)
         self.play(manim.Transform(label, time_label))
         self.wait(3)
@@ -211,18 +225,20 @@ class dp_02_02(manim.Scene):
         self.play(manim.FadeOut(vgroup))
         self.wait()
 
-    def _play_dfs_memoized(self, tree: BTree) -> Generator[manim.VGroup, None, None]:
+    def _play_dfs_memoized(self, tree: BTree, log: MemoLog) -> Generator[manim.VGroup, None, None]:
         """
-        Play the tree by DFS, color repeated nodes, with a dp[n] node blow.
+        Play the tree by DFS, color the nodes that were cache hits, with a dp[n] node blow.
 
         Arguments:
             tree: The tree.
+            log: The cache log of the recursion, its calls in the order of the DFS.
         """
-        encountered = set()
+        calls = log.calls()
         parent_arrow = {}
         for node in BTree.dfs(tree.root):
             if node != tree.root and node not in parent_arrow:
                 continue
+            hit = next(calls).kind == HIT
 
             # Add nodes and arrows
             vgroup = manim.VGroup()
@@ -232,7 +248,7 @@ class dp_02_02(manim.Scene):
             vgroup.add(node.get_mobject())
 
             # Color repeated nodes
-            if node.label in encountered:
+            if hit:
                 node.get_mobject().set_color(manim.YELLOW) # type: ignore
                 node.get_circle().set_color(manim.YELLOW) # type: ignore
 
@@ -240,7 +256,7 @@ class dp_02_02(manim.Scene):
             yield vgroup
 
             # Add dp[n] node
-            if node.label in encountered:
+            if hit:
                 dp_n = manim.VGroup()
 
                 # Node
@@ -273,9 +289,7 @@ class dp_02_02(manim.Scene):
 
                 continue
 
-            # Else add to encountered
-            encountered.add(node.label)
-        
+            # Else the children were computed
             if node.left is not None:
                 parent_arrow[node.left] = node.get_left_arrow()
             if node.right is not None:
@@ -293,22 +307,3 @@ def get_all_nodes(root: BNode, n: int) -> Generator[BNode, None, None]:
         nodes: The generator of nodes.
     """
     return (node for node in BTree.dfs(root) if node.label == f"f({n})")
-
-def build_fib_tree(n: int) -> BNode:
-    """
-    Build a Fibonacci tree with `f(n)` as root.
-
-    Arguments:
-        n: the Fibonacci number
-    Returns:
-        root: root of the tree
-    """
-    if n == 0:
-        return BNode(f"f({n})")
-    elif n == 1:
-        return BNode(f"f({n})")
-    else:
-        root = BNode(f"f({n})")
-        root.left = build_fib_tree(n-1)
-        root.right = build_fib_tree(n-2)
-        return root
@@ -11,11 +11,14 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
 from utils.btree import BTree, BNode
+from utils.fib_tree import build_fib_tree
 from utils.sized_container import SizedContainer
-from utils.table import set_table_mobject
+from utils.table_utils import cell_center, set_table_mobject
+from utils.tex_cache import math_tex, tex
+from utils.scene_profiler import ProfiledScene
 
 
-class dp_03_01(manim.Scene):
+class dp_03_01(ProfiledScene, manim.Scene):
     def construct(self):
         config = {
             "font_size": 36,
@@ -26,7 +29,7 @@ class dp_03_01(manim.Scene):
             build_fib_tree(4),
             hbuff=1.2,
             vbuff=1.5,
-            element_to_mobject=manim.MathTex,
+            element_to_mobject=math_tex,
             element_to_mobject_config=config,
             circle_buffer_factor=1.2,
         )
@@ -43,7 +46,7 @@ class dp_03_01(manim.Scene):
 
                 # Reduce and show value
                 stack.append(fib)
-                value_label = manim.MathTex(f"{fib}")
+                value_label = math_tex(f"{fib}")
                 value_label.move_to(fib_node.get_mobject())
 
                 self.play(
@@ -101,7 +104,7 @@ class dp_03_01(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_03_02(manim.Scene):
+class dp_03_02(ProfiledScene, manim.Scene):
     def construct(self):
         config = {
             "font_size": 36,
@@ -112,7 +115,7 @@ class dp_03_02(manim.Scene):
             build_fib_tree(4),
             hbuff=1.2,
             vbuff=1.5,
-            element_to_mobject=manim.MathTex,
+            element_to_mobject=math_tex,
             element_to_mobject_config=config,
             circle_buffer_factor=1.2,
         )
@@ -144,7 +147,7 @@ class dp_03_02(manim.Scene):
 
             # Show value
             def show_value(value):
-                value_label = manim.MathTex(f"{value}")
+                value_label = math_tex(f"{value}")
                 value_label.move_to(node.get_mobject())
                 self.play(
                     manim.Transform(node.get_mobject(), value_label), run_time=0.66
@@ -166,17 +169,17 @@ class dp_03_02(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_03_03(manim.Scene):
+class dp_03_03(ProfiledScene, manim.Scene):
     def construct(self):
         # Initialize table from 0 to 4 representing fib(0) to fib(4)
         table = manim.MathTable(
             [["0", "1", "1", "2", "3"]],
-            row_labels=[manim.MathTex(r"\text{dp}")],
+            row_labels=[math_tex(r"\text{dp}")],
             col_labels=[
                 SizedContainer(
                     width=1,
                     height=0,
-                    mobject=manim.MathTex(f"f({i})"),
+                    mobject=math_tex(f"f({i})"),
                 )
                 for i in range(5)
             ],
@@ -193,8 +196,8 @@ class dp_03_03(manim.Scene):
         self.wait()
 
         # Write base cases
-        set_table_mobject(table, (2, 2), manim.MathTex("0"))
-        set_table_mobject(table, (2, 3), manim.MathTex("1"))
+        set_table_mobject(table, (2, 2), math_tex("0"))
+        set_table_mobject(table, (2, 3), math_tex("1"))
         self.play(
             manim.Write(table.get_entries((2, 2))),
             manim.Write(table.get_entries((2, 3))),
@@ -245,7 +248,7 @@ class dp_03_03(manim.Scene):
             # Write recursive case
             value = values[i - 3] + values[i - 2]
             values.append(value)
-            set_table_mobject(table, (2, i + 1), manim.MathTex(f"{value}"))
+            set_table_mobject(table, (2, i + 1), math_tex(f"{value}"))
             self.play(manim.Write(table.get_entries((2, i + 1))))
             self.wait(0.34)
 
@@ -259,7 +262,7 @@ class dp_03_03(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_03_04(manim.Scene):
+class dp_03_04(ProfiledScene, manim.Scene):
     def construct(self):
         # Initialize table
         table = manim.Table(
@@ -268,14 +271,14 @@ class dp_03_04(manim.Scene):
                 ["0", "1", "1"],
             ],
             col_labels=[
-                manim.Tex("prev"),
-                manim.Tex("curr"),
-                manim.MathTex(r"\text{next} = \text{prev} + \text{curr}"),
+                tex("prev"),
+                tex("curr"),
+                math_tex(r"\text{next} = \text{prev} + \text{curr}"),
             ],
             element_to_mobject=lambda el: SizedContainer(
                 width=1,
                 height=1,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             include_outer_lines=True,
         )
@@ -307,8 +310,8 @@ class dp_03_04(manim.Scene):
 
         # Indicate the two values being added and show next value
         positions = [
-            [table.get_cell((2, i)).get_center().copy() for i in range(1, 4)],
-            [table.get_cell((3, i)).get_center().copy() for i in range(1, 4)],
+            [cell_center(table, (2, i)).copy() for i in range(1, 4)],
+            [cell_center(table, (3, i)).copy() for i in range(1, 4)],
         ]
         prev = [0, table.get_entries((2, 1)), table.get_entries((3, 1))]
         curr = [1, table.get_entries((2, 2)), table.get_entries((3, 2))]
@@ -370,12 +373,12 @@ class dp_03_04(manim.Scene):
             next[1] = SizedContainer(
                 width=1,
                 height=1,
-                mobject=manim.MathTex(f"f({i})"),
+                mobject=math_tex(f"f({i})"),
             )
             next[2] = SizedContainer(
                 width=1,
                 height=1,
-                mobject=manim.MathTex(f"{next[0]}"),
+                mobject=math_tex(f"{next[0]}"),
             )
             next[1].move_to(positions[0][2])
             next[2].move_to(positions[1][2])
@@ -387,7 +390,7 @@ class dp_03_04(manim.Scene):
         remain.add(curr[1][0])
         remain.add(curr[2][0])
 
-        target = manim.MathTex(f"f(4)", "=", f"{curr[0]}", font_size=72)
+        target = math_tex(f"f(4)", "=", f"{curr[0]}", font_size=72)
         target.center()
 
         self.play(
@@ -464,23 +467,3 @@ def dfs_groups(
         if node.right is not None:
             parent_arrow[node.right] = node.get_right_arrow()
             parent[node.right] = node
-
-
-def build_fib_tree(n: int) -> BNode:
-    """
-    Build a Fibonacci tree with `f(n)` as root.
-
-    Arguments:
-        n: the Fibonacci number
-    Returns:
-        root: root of the tree
-    """
-    if n == 0:
-        return BNode(f"f({n})")
-    elif n == 1:
-        return BNode(f"f({n})")
-    else:
-        root = BNode(f"f({n})")
-        root.left = build_fib_tree(n - 1)
-        root.right = build_fib_tree(n - 2)
-        return root
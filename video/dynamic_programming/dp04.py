@@ -10,28 +10,35 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
 from utils.sized_container import SizedContainer
-from utils.table_utils import set_table_mobject
+from utils.table_utils import cell_center, set_table_mobject
+from utils.tex_cache import math_tex, tex
+from utils.scene_profiler import ProfiledScene
+from utils.dynamic_programming import count_stairs, solve_stairs
 
 
-class dp_04_01(manim.Scene):
+class dp_04_01(ProfiledScene, manim.Scene):
+    STAIRS: int = 5
+
     def construct(self):
+        stairs = solve_stairs(self.STAIRS)
+
         # Initialize table from 1 to 5 representing f(1) to f(5)
         table = manim.MathTable(
-            [["1", "2", "3", "5", "8"]],
-            row_labels=[manim.MathTex(r"\text{dp}")],
+            [[str(value) for value in stairs.table[1:]]],
+            row_labels=[math_tex(r"\text{dp}")],
             col_labels=[
                 SizedContainer(
                     width=1,
                     height=0,
-                    mobject=manim.MathTex(f"f({i})"),
+                    mobject=math_tex(f"f({i})"),
                 )
-                for i in range(1, 6)
+                for i in range(1, self.STAIRS + 1)
             ],
             include_outer_lines=True,
         )
 
         # Hide all values
-        for i in range(2, 7):
+        for i in range(2, self.STAIRS + 2):
             table.get_entries((2, i)).set_opacity(0)
 
         # Show table
@@ -40,8 +47,8 @@ class dp_04_01(manim.Scene):
         self.wait()
 
         # Write base cases
-        set_table_mobject(table, (2, 2), manim.MathTex("1"))
-        set_table_mobject(table, (2, 3), manim.MathTex("2"))
+        set_table_mobject(table, (2, 2), math_tex(str(stairs.table[1])))
+        set_table_mobject(table, (2, 3), math_tex(str(stairs.table[2])))
         self.play(
             manim.Write(table.get_entries((2, 2))),
             manim.Write(table.get_entries((2, 3))),
@@ -49,8 +56,7 @@ class dp_04_01(manim.Scene):
         self.wait()
 
         # Write arrows and recursive cases
-        values = [1, 2]
-        for i in range(3, 6):
+        for i in range(3, self.STAIRS + 1):
             # Write curved arrows and indicate the two values being added
             sec_last = table.get_entries((2, i - 1))
             last = table.get_entries((2, i))
@@ -90,9 +96,7 @@ class dp_04_01(manim.Scene):
             )
 
             # Write recursive case
-            value = values[i - 3] + values[i - 2]
-            values.append(value)
-            set_table_mobject(table, (2, i + 1), manim.MathTex(f"{value}"))
+            set_table_mobject(table, (2, i + 1), math_tex(f"{stairs.table[i]}"))
             self.play(manim.Write(table.get_entries((2, i + 1))))
             self.wait(0.34)
 
@@ -106,7 +110,7 @@ class dp_04_01(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_04_02(manim.Scene):
+class dp_04_02(ProfiledScene, manim.Scene):
     def construct(self):
         # Initialize table
         table = manim.Table(
@@ -115,14 +119,14 @@ class dp_04_02(manim.Scene):
                 ["1", "2", "3"],
             ],
             col_labels=[
-                manim.Tex("prev"),
-                manim.Tex("curr"),
-                manim.MathTex(r"\text{next} = \text{prev} + \text{curr}"),
+                tex("prev"),
+                tex("curr"),
+                math_tex(r"\text{next} = \text{prev} + \text{curr}"),
             ],
             element_to_mobject=lambda el: SizedContainer(
                 width=1,
                 height=1,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             include_outer_lines=True,
         )
@@ -154,12 +158,12 @@ class dp_04_02(manim.Scene):
 
         # Indicate the two values being added and show next value
         positions = [
-            [table.get_cell((2, i)).get_center().copy() for i in range(1, 4)],
-            [table.get_cell((3, i)).get_center().copy() for i in range(1, 4)],
+            [cell_center(table, (2, i)).copy() for i in range(1, 4)],
+            [cell_center(table, (3, i)).copy() for i in range(1, 4)],
         ]
-        prev = [1, table.get_entries((2, 1)), table.get_entries((3, 1))]
-        curr = [2, table.get_entries((2, 2)), table.get_entries((3, 2))]
-        next = [prev[0] + curr[0], table.get_entries((2, 3)), table.get_entries((3, 3))]
+        prev = [count_stairs(1), table.get_entries((2, 1)), table.get_entries((3, 1))]
+        curr = [count_stairs(2), table.get_entries((2, 2)), table.get_entries((3, 2))]
+        next = [count_stairs(3), table.get_entries((2, 3)), table.get_entries((3, 3))]
         for i in range(4, 7):
             # Indicate the two value and show next value
             self.play(
@@ -211,18 +215,18 @@ class dp_04_02(manim.Scene):
             curr = next.copy()
 
             # Compute next value
-            next[0] = prev[0] + curr[0]
+            next[0] = count_stairs(i)
 
             # Set next
             next[1] = SizedContainer(
                 width=1,
                 height=1,
-                mobject=manim.MathTex(f"f({i})"),
+                mobject=math_tex(f"f({i})"),
             )
             next[2] = SizedContainer(
                 width=1,
                 height=1,
-                mobject=manim.MathTex(f"{next[0]}"),
+                mobject=math_tex(f"{next[0]}"),
             )
             next[1].move_to(positions[0][2])
             next[2].move_to(positions[1][2])
@@ -234,7 +238,7 @@ class dp_04_02(manim.Scene):
         remain.add(curr[1][0])
         remain.add(curr[2][0])
 
-        target = manim.MathTex(f"f(5)", "=", f"{curr[0]}", font_size=72)
+        target = math_tex(f"f(5)", "=", f"{curr[0]}", font_size=72)
         target.center()
 
         self.play(
@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Sequence
 import manim
 import numpy as np
@@ -10,35 +11,41 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
 from utils.sized_container import SizedContainer
-from utils.table_utils import set_table_mobject
+from utils.table_utils import cell_center, set_table_mobject
+from utils.tex_cache import math_tex
+from utils.scene_profiler import ProfiledScene
+from utils.dynamic_programming import min_cost_stairs_rows, solve_min_cost_stairs
 
 
-class dp_05_01(manim.Scene):
+class dp_05_01(ProfiledScene, manim.Scene):
     ADD_BUFF = 1.3
+    COST: list = [1, 5, 2, 4, 3]
 
     def construct(self):
+        stairs = solve_min_cost_stairs(self.COST)
+
         # Initialize table from 1 to 8 representing f(1) to f(8)
         table = manim.MathTable(
             [
-                ["1", "5", "2", "4", "3", ""],
-                ["0", "0", "1", "3", "3", "6"],
+                [*[str(c) for c in self.COST], ""],
+                [str(value) for value in stairs.table],
             ],
             row_labels=[
                 SizedContainer(
                     width=1.8,
                     height=0,
-                    mobject=manim.MathTex(r"\text{cost}"),
+                    mobject=math_tex(r"\text{cost}"),
                 ),
                 SizedContainer(
                     width=1.8,
                     height=0,
-                    mobject=manim.MathTex(r"\text{dp}"),
+                    mobject=math_tex(r"\text{dp}"),
                 ),
             ],
             element_to_mobject=lambda el: SizedContainer(
                 width=0.8,
                 height=0.8,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             v_buff=0.6,
             h_buff=0.8,
@@ -48,7 +55,7 @@ class dp_05_01(manim.Scene):
         # Hide all values
         hidden = manim.VGroup()
         for i in range(2, 3):
-            for j in range(2, 8):
+            for j in range(2, len(self.COST) + 3):
                 hidden.add(table.get_entries((i, j)))
                 table.get_entries((i, j)).set_opacity(0)
 
@@ -67,20 +74,20 @@ class dp_05_01(manim.Scene):
         self.wait()
 
         # Write base cases
-        set_table_mobject(table, (2, 2), manim.MathTex("0"))
-        set_table_mobject(table, (2, 3), manim.MathTex("0"))
+        set_table_mobject(table, (2, 2), math_tex(str(stairs.table[0])))
+        set_table_mobject(table, (2, 3), math_tex(str(stairs.table[1])))
         self.play(
             manim.Write(table.get_entries((2, 2))),
             manim.Write(table.get_entries((2, 3))),
         )
 
         # Show addition of cost and dp
-        add_label = manim.MathTex(r"\text{cost}+\text{dp}")
+        add_label = math_tex(r"\text{cost}+\text{dp}")
         add_label.next_to(table.get_cell((2, 1)), manim.DOWN * self.ADD_BUFF)
 
-        last = manim.MathTex("1")
+        last = math_tex(str(self.COST[0] + stairs.table[0]))
         last.next_to(table.get_cell((2, 2)), manim.DOWN * self.ADD_BUFF)
-        curr = manim.MathTex("5")
+        curr = math_tex(str(self.COST[1] + stairs.table[1]))
         curr.next_to(table.get_cell((2, 3)), manim.DOWN * self.ADD_BUFF)
         self.play(
             manim.AnimationGroup(
@@ -97,18 +104,17 @@ class dp_05_01(manim.Scene):
         self.wait()
 
         # Write arrows and recursive cases
-        cost = [1, 5, 2, 4, 3]
-        values = [0, 0]
-        add = [1, 5]
+        cost = self.COST
+        add = [cost[0] + stairs.table[0], cost[1] + stairs.table[1]]
         froms = []
-        for i in range(3, 7):
+        for i in range(3, len(cost) + 2):
             if i > 3:
                 # Show add
-                add = [cost[i - 3] + values[-2], cost[i - 2] + values[-1]]
+                add = [cost[i - 3] + stairs.table[i - 3], cost[i - 2] + stairs.table[i - 2]]
 
-                last = manim.MathTex(f"{add[-2]}")
+                last = math_tex(f"{add[-2]}")
                 last.next_to(table.get_cell((2, i - 1)), manim.DOWN * self.ADD_BUFF)
-                curr = manim.MathTex(f"{add[-1]}")
+                curr = math_tex(f"{add[-1]}")
                 curr.next_to(table.get_cell((2, i)), manim.DOWN * self.ADD_BUFF)
 
                 self.play(
@@ -116,8 +122,8 @@ class dp_05_01(manim.Scene):
                     manim.FadeIn(curr, shift=manim.DOWN),
                 )
 
-            # Indicate the two values being compared
-            froms.append(-1 if add[-1] <= add[-2] else -2)
+            # Indicate the two values being compared, the move is the number of steps back
+            froms.append(-int(stairs.provenance[i - 1]))
             min_add = curr if froms[-1] == -1 else last
 
             indicate_anim = manim.AnimationGroup(
@@ -137,9 +143,8 @@ class dp_05_01(manim.Scene):
             self.play(indicate_anim)
 
             # Write recursive case and delete greater value
-            value = min(add[-1], add[-2])
-            values.append(value)
-            set_table_mobject(table, (2, i + 1), manim.MathTex(f"{value}"))
+            value = stairs.table[i - 1]
+            set_table_mobject(table, (2, i + 1), math_tex(f"{value}"))
             self.play(
                 manim.FadeOut(last if froms[-1] == -1 else curr),
                 manim.Transform(
@@ -162,7 +167,7 @@ class dp_05_01(manim.Scene):
                 + (entry.get_height() + vbuff) * manim.DOWN / 2
             )
 
-        i = len(values) - 1
+        i = len(cost)
         while i > 1:
             # Show arrow from current value to the value it came from
             f = froms[i - 2]
@@ -188,16 +193,22 @@ class dp_05_01(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_05_02(manim.Scene):
+class dp_05_02(ProfiledScene, manim.Scene):
+    COST: list = [1, 5, 2, 4, 3]
+
     def construct(self):
+        # Costs to reach each stair, computed as the cost table is read
+        cost = self.COST
+        values = (value for value, _ in min_cost_stairs_rows(cost))
+
         # Initialize the cost table
         cost_table = manim.MathTable(
-            [["1", "5", "2", "4", "3"]],
-            row_labels=[manim.MathTex(r"\text{cost}")],
+            [[str(c) for c in cost]],
+            row_labels=[math_tex(r"\text{cost}")],
             element_to_mobject=lambda el: SizedContainer(
                 width=0.6,
                 height=0.6,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             include_outer_lines=True,
         )
@@ -214,7 +225,7 @@ class dp_05_02(manim.Scene):
             element_to_mobject=lambda el: SizedContainer(
                 width=0.6,
                 height=0.6,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             include_outer_lines=True,
         )
@@ -224,7 +235,7 @@ class dp_05_02(manim.Scene):
         zoomed_cost_table.scale_to_fit_width(initial_cost_width)  # type: ignore
 
         zoomed_cost_table.shift(
-            table.get_cell((1, 1)).get_center()
+            cell_center(table, (1, 1))
             + manim.UP * table.get_cell((1, 1)).height
             - zoomed_cost_table.get_cell((1, 2)).get_center()
         )
@@ -233,17 +244,17 @@ class dp_05_02(manim.Scene):
         self.play(manim.FadeIn(table))
 
         # Indicate the two values being compared and show next value
-        cost = [1, 5, 2, 4, 3]
-        positions = [table.get_cell((1, i)).get_center().copy() for i in range(1, 4)]
-        prev = [0, table.get_entries((1, 1))]
-        curr = [0, table.get_entries((1, 2))]
-        next = [1, table.get_entries((1, 3))]
-        for i in range(2, 6):
+        positions = [cell_center(table, (1, i)).copy() for i in range(1, 4)]
+        start = list(islice(values, 2))
+        prev = [start[0], table.get_entries((1, 1))]
+        curr = [start[1], table.get_entries((1, 2))]
+        next = [None, table.get_entries((1, 3))]
+        for i, value in zip(range(2, len(cost) + 1), values):
             # Add cost and prev/curr
             prev_add = prev[0] + cost[i - 2]
             curr_add = curr[0] + cost[i - 1]
-            prev_add_mob = manim.MathTex(f"{prev_add}")
-            curr_add_mob = manim.MathTex(f"{curr_add}")
+            prev_add_mob = math_tex(f"{prev_add}")
+            curr_add_mob = math_tex(f"{curr_add}")
             prev_add_mob.next_to(
                 positions[0], manim.DOWN * table.get_cell((1, 1)).height * 3.6
             )
@@ -302,7 +313,7 @@ class dp_05_02(manim.Scene):
             )
 
             # Compute next value
-            next[0] = min(prev[0] + cost[i - 2], curr[0] + cost[i - 1])
+            next[0] = value
 
             # Update values
             prev = curr.copy()
@@ -314,7 +325,7 @@ class dp_05_02(manim.Scene):
         remain = manim.VGroup()
         remain.add(curr[1])
 
-        target = manim.MathTex(f"{curr[0]}", font_size=72)
+        target = math_tex(f"{curr[0]}", font_size=72)
         target.center()
 
         self.play(
@@ -9,163 +9,125 @@ import os
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
+from utils.dp_grid import DPGrid
 from utils.sized_container import SizedContainer
-from utils.table_utils import set_table_mobject
+from utils.table_utils import cell_center, set_table_mobject, set_table_values
+from utils.tex_cache import math_tex
+from utils.scene_profiler import ProfiledScene
+from utils.dynamic_programming import solution_trace, solve_unique_paths
 
 
-class dp_06_01(manim.Scene):
+class dp_06_01(ProfiledScene, manim.Scene):
+    ROWS: int = 3
+    COLS: int = 7
+
     def construct(self):
-        # Initialize table
-        table = manim.MathTable(
-            [
-                ["1", "1", "1", "1", "1", "1", "1"],
-                ["1", "2", "3", "4", "5", "6", "7"],
-                ["1", "3", "6", "10", "15", "21", "28"],
-            ],
-            element_to_mobject=lambda el: SizedContainer(
-                width=0.8,
-                height=0.8,
-                mobject=manim.MathTex(el),
-            ),
-            v_buff=0.6,
-            h_buff=0.8,
-            include_outer_lines=True,
-        )
+        solution = solve_unique_paths(self.ROWS, self.COLS)
 
-        # Hide all values
-        hidden = manim.VGroup()
-        for i in range(1, 4):
-            for j in range(1, 8):
-                hidden.add(table.get_entries((i, j)))
-                table.get_entries((i, j)).set_opacity(0)
+        # Initialize table, the cells of the MathTable of the other scenes
+        grid = DPGrid(self.ROWS, self.COLS, cell_width=1.6, cell_height=1.4)
+        grid.set_values(solution.table)
 
         # Show table
-        self.play(
-            manim.Create(
-                manim.VGroup(
-                    *[mobj for mobj in table.get_entries() if mobj not in hidden],
-                    table.get_horizontal_lines(),
-                    table.get_vertical_lines(),
-                )
-            ),
-        )
+        self.play(manim.Create(grid))
 
         # Show top left
-        set_table_mobject(table, (1, 1), manim.MathTex("1"))
-        self.play(manim.FadeIn(table.get_entries((1, 1))))
+        self.play(manim.FadeIn(grid.get_entries((1, 1))))
 
         self.wait()
 
         # Add the 3 indication box
-        box_curr = manim.Rectangle(
-            color=manim.YELLOW,
-            width=table.get_cell((1, 1)).get_width(),
-            height=table.get_cell((1, 1)).get_height(),
-        )
+        box_curr = grid.get_cell((1, 1), color=manim.YELLOW)
 
         box_left = box_curr.copy()
-        box_left.shift(manim.LEFT * table.get_cell((1, 1)).get_width())
+        box_left.shift(manim.LEFT * box_curr.get_width())
 
         box_top = box_curr.copy()
-        box_top.shift(manim.UP * table.get_cell((1, 1)).get_height())
+        box_top.shift(manim.UP * box_curr.get_height())
 
         # Loop through everything
-        dp = np.zeros((3, 7), dtype=np.int32)
-        dp[0][0] = 1
-        for i in range(1, 4):
-            for j in range(1, 8):
-                # Skip
-                if i == 1 and j == 1:
-                    continue
+        for step in solution_trace(solution):
+            i, j = step.cell[0] + 1, step.cell[1] + 1
+
+            # Skip
+            if i == 1 and j == 1:
+                continue
+
+            # Show current box
+            if i == 1 and j == 2:
+                box_curr.move_to(grid.get_cell_center((i, j)))
+                box_left.next_to(
+                    box_curr, manim.LEFT * box_curr.get_width(), buff=0
+                )
+                box_top.next_to(box_curr, manim.UP * box_curr.get_height(), buff=0)
+                self.play(
+                    manim.FadeIn(box_curr),
+                    manim.FadeIn(box_left),
+                    run_time=0.33,
+                )
 
-                # Show current box
-                if i == 1 and j == 2:
-                    box_curr.move_to(table.get_cell((i, j)).get_center())
-                    box_left.next_to(
-                        box_curr, manim.LEFT * box_curr.get_width(), buff=0
-                    )
-                    box_top.next_to(box_curr, manim.UP * box_curr.get_height(), buff=0)
-                    self.play(
-                        manim.FadeIn(box_curr),
-                        manim.FadeIn(box_left),
-                        run_time=0.33,
-                    )
+                self.play(manim.FadeIn(grid.get_entries((i, j))), run_time=0.33)
 
-                    dp[0][1] = 1
-                    set_table_mobject(
-                        table, (i, j), manim.MathTex(str(dp[i - 1][j - 1]))
-                    )
-                    self.play(manim.FadeIn(table.get_entries((i, j))), run_time=0.33)
+                self.wait(0.67)
 
-                    self.wait(0.67)
+                continue
 
-                    continue
+            # Move to position
+            box_curr.generate_target()
+            box_curr.target.move_to(grid.get_cell_center((i, j)))
 
-                # Move to position
-                box_curr.generate_target()
-                box_curr.target.move_to(table.get_cell((i, j)).get_center())
+            box_left.generate_target()
+            box_left.target.next_to(
+                grid.get_cell((i, j)),
+                manim.LEFT,
+                buff=0,
+            )
 
-                box_left.generate_target()
-                box_left.target.next_to(
-                    table.get_cell((i, j)),
-                    manim.LEFT,
+            # Include top if not first row
+            if i == 2 and j == 1:
+                box_top.generate_target()
+                box_top.target.set_stroke(opacity=1)
+                box_top.target.next_to(
+                    grid.get_cell((i, j)),
+                    manim.UP,
+                    buff=0,
+                )
+            elif i != 1:
+                box_top.generate_target()
+                box_top.target.next_to(
+                    grid.get_cell((i, j)),
+                    manim.UP,
+                    buff=0,
+                )
+            elif i == 1 and j == self.COLS:
+                box_top.set_opacity(0)
+                box_top.next_to(
+                    grid.get_cell((i, j)),
+                    manim.UP,
                     buff=0,
                 )
 
-                # Include top if not first row
-                if i == 2 and j == 1:
-                    box_top.generate_target()
-                    box_top.target.set_stroke(opacity=1)
-                    box_top.target.next_to(
-                        table.get_cell((i, j)),
-                        manim.UP,
-                        buff=0,
-                    )
-                elif i != 1:
-                    box_top.generate_target()
-                    box_top.target.next_to(
-                        table.get_cell((i, j)),
-                        manim.UP,
-                        buff=0,
-                    )
-                elif i == 1 and j == 7:
-                    box_top.set_opacity(0)
-                    box_top.next_to(
-                        table.get_cell((i, j)),
-                        manim.UP,
-                        buff=0,
-                    )
-
-                # Hide left if first column
-                if j == 1:
-                    box_left.target.set_opacity(0)
-                elif j == 2:
-                    box_left.target.set_stroke(opacity=1)
-
-                # Play animation
-                anim_group = [
-                    manim.MoveToTarget(box_curr),
-                    manim.MoveToTarget(box_left),
-                ]
+            # Hide left if first column
+            if j == 1:
+                box_left.target.set_opacity(0)
+            elif j == 2:
+                box_left.target.set_stroke(opacity=1)
 
-                if i != 1:
-                    anim_group.append(manim.MoveToTarget(box_top))
+            # Play animation
+            anim_group = [
+                manim.MoveToTarget(box_curr),
+                manim.MoveToTarget(box_left),
+            ]
 
-                self.play(*anim_group, run_time=0.33)
+            if i != 1:
+                anim_group.append(manim.MoveToTarget(box_top))
 
-                # Calculate dp
-                if i == 1:
-                    dp[i - 1][j - 1] = dp[i - 1][j - 2]
-                elif j == 1:
-                    dp[i - 1][j - 1] = dp[i - 2][j - 1]
-                else:
-                    dp[i - 1][j - 1] = dp[i - 1][j - 2] + dp[i - 2][j - 1]
+            self.play(*anim_group, run_time=0.33)
 
-                # Show dp
-                set_table_mobject(table, (i, j), manim.MathTex(str(dp[i - 1][j - 1])))
-                self.play(manim.FadeIn(table.get_entries((i, j))), run_time=0.33)
+            # Show dp
+            self.play(manim.FadeIn(grid.get_entries((i, j))), run_time=0.33)
 
-                self.wait(0.67)
+            self.wait(0.67)
 
         # Fade out boxes
         self.play(
@@ -178,20 +140,23 @@ class dp_06_01(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_06_02(manim.Scene):
+class dp_06_02(ProfiledScene, manim.Scene):
+    ROWS: int = 3
+    COLS: int = 7
+
     def construct(self):
+        # Paths padded with a row and a column of zeros, seeded with a 1 above the start
+        dp = np.zeros((self.ROWS + 1, self.COLS + 1), dtype=np.int64)
+        dp[0][1] = 1
+        dp[1:, 1:] = solve_unique_paths(self.ROWS, self.COLS).table
+
         # Initialize table
         table = manim.MathTable(
-            [
-                ["0", "1", "0", "0", "0", "0", "0", "0"],
-                ["0", "1", "1", "1", "1", "1", "1", "1"],
-                ["0", "1", "2", "3", "4", "5", "6", "7"],
-                ["0", "1", "3", "6", "10", "15", "21", "28"],
-            ],
+            [[str(value) for value in row] for row in dp],
             element_to_mobject=lambda el: SizedContainer(
                 width=0.8,
                 height=0.8,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             v_buff=0.6,
             h_buff=0.8,
@@ -200,8 +165,8 @@ class dp_06_02(manim.Scene):
 
         # Hide all values
         hidden = manim.VGroup()
-        for i in range(1, 5):
-            for j in range(1, 9):
+        for i in range(1, self.ROWS + 2):
+            for j in range(1, self.COLS + 2):
                 hidden.add(table.get_entries((i, j)))
                 table.get_entries((i, j)).set_opacity(0)
 
@@ -217,16 +182,14 @@ class dp_06_02(manim.Scene):
         )
 
         # Show top left
-        anim_group = []
-        for i, c in enumerate(["0", "1", "0", "0", "0", "0", "0", "0"]):
-            set_table_mobject(table, (1, i + 1), manim.MathTex(c))
-            anim_group.append(manim.FadeIn(table.get_entries((1, i + 1))))
-
-        for j in range(2, 5):
-            set_table_mobject(table, (j, 1), manim.MathTex("0"))
-            anim_group.append(manim.FadeIn(table.get_entries((j, 1))))
-
-        self.play(*anim_group)
+        edges = set_table_values(
+            table,
+            {
+                **{(1, i + 1): c for i, c in enumerate(dp[0])},
+                **{(j, 1): dp[j - 1][0] for j in range(2, self.ROWS + 2)},
+            },
+        )
+        self.play(*[manim.FadeIn(mob) for mob in edges.values()])
 
         self.wait()
 
@@ -244,13 +207,11 @@ class dp_06_02(manim.Scene):
         box_top.shift(manim.UP * table.get_cell((1, 1)).get_height())
 
         # Loop through everything
-        dp = np.zeros((4, 8), dtype=np.int32)
-        dp[0][1] = 1
-        for i in range(2, 5):
-            for j in range(2, 9):
+        for i in range(2, self.ROWS + 2):
+            for j in range(2, self.COLS + 2):
                 # Show current box
                 if i == 2 and j == 2:
-                    box_curr.move_to(table.get_cell((i, j)).get_center())
+                    box_curr.move_to(cell_center(table, (i, j)))
                     box_left.next_to(
                         box_curr, manim.LEFT * box_curr.get_width(), buff=0
                     )
@@ -262,9 +223,8 @@ class dp_06_02(manim.Scene):
                         run_time=0.33,
                     )
 
-                    dp[i - 1][j - 1] = dp[i - 1][j - 2] + dp[i - 2][j - 1]
                     set_table_mobject(
-                        table, (i, j), manim.MathTex(str(dp[i - 1][j - 1]))
+                        table, (i, j), math_tex(str(dp[i - 1][j - 1]))
                     )
                     self.play(manim.FadeIn(table.get_entries((i, j))), run_time=0.33)
 
@@ -274,7 +234,7 @@ class dp_06_02(manim.Scene):
 
                 # Move to position
                 box_curr.generate_target()
-                box_curr.target.move_to(table.get_cell((i, j)).get_center())
+                box_curr.target.move_to(cell_center(table, (i, j)))
 
                 box_left.generate_target()
                 box_left.target.next_to(
@@ -299,11 +259,8 @@ class dp_06_02(manim.Scene):
 
                 self.play(*anim_group, run_time=0.33)
 
-                # Calculate dp
-                dp[i - 1][j - 1] = dp[i - 1][j - 2] + dp[i - 2][j - 1]
-
                 # Show dp
-                set_table_mobject(table, (i, j), manim.MathTex(str(dp[i - 1][j - 1])))
+                set_table_mobject(table, (i, j), math_tex(str(dp[i - 1][j - 1])))
                 self.play(manim.FadeIn(table.get_entries((i, j))), run_time=0.33)
 
                 self.wait(0.67)
@@ -319,7 +276,7 @@ class dp_06_02(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_06_03(manim.Scene):
+class dp_06_03(ProfiledScene, manim.Scene):
     def construct(self):
         # Initialize table
         table = manim.MathTable(
@@ -329,7 +286,7 @@ class dp_06_03(manim.Scene):
             element_to_mobject=lambda el: SizedContainer(
                 width=0.8,
                 height=0.8,
-                mobject=manim.MathTex(el),
+                mobject=math_tex(el),
             ),
             v_buff=0.6,
             h_buff=0.8,
@@ -356,7 +313,7 @@ class dp_06_03(manim.Scene):
         # Show top
         anim_group = []
         for i, c in enumerate(["0", "1", "0", "0", "0", "0", "0", "0"]):
-            set_table_mobject(table, (1, i + 1), manim.MathTex(c))
+            set_table_mobject(table, (1, i + 1), math_tex(c))
             anim_group.append(manim.FadeIn(table.get_entries((1, i + 1))))
 
         self.play(*anim_group)
@@ -379,13 +336,13 @@ class dp_06_03(manim.Scene):
         # Loop through everything
         dp = np.zeros((8,), dtype=np.int32)
         dp[1] = 1
-        i_label = manim.MathTex("i=", str(1))
+        i_label = math_tex("i=", str(1))
         for i in range(2, 5):
             for j in range(2, 9):
                 # Show current box
                 if i == 2 and j == 2:
                     # Boxes
-                    box_top.move_to(table.get_cell((1, j)).get_center())
+                    box_top.move_to(cell_center(table, (1, j)))
                     box_left.next_to(box_top, manim.LEFT * box_top.get_width(), buff=0)
 
                     # i label
@@ -405,7 +362,7 @@ class dp_06_03(manim.Scene):
                     dp[j - 1] = dp[j - 2] + dp[j - 1]
 
                     # Show new value
-                    value = manim.MathTex(str(dp[j - 1]))
+                    value = math_tex(str(dp[j - 1]))
                     value.next_to(
                         table.get_cell((1, j)),
                         manim.DOWN * table.get_cell((1, j)).get_height(),
@@ -417,7 +374,7 @@ class dp_06_03(manim.Scene):
 
                     # Overwrite value
                     value.generate_target()
-                    value.target.move_to(table.get_cell((1, j)).get_center())
+                    value.target.move_to(cell_center(table, (1, j)))
                     self.play(
                         manim.FadeOut(table.get_entries((1, j)), shift=manim.UP),
                         manim.MoveToTarget(value),
@@ -429,7 +386,7 @@ class dp_06_03(manim.Scene):
 
                 # Move to position
                 box_top.generate_target()
-                box_top.target.move_to(table.get_cell((1, j)).get_center())
+                box_top.target.move_to(cell_center(table, (1, j)))
 
                 box_left.generate_target()
                 box_left.target.next_to(
@@ -439,7 +396,7 @@ class dp_06_03(manim.Scene):
                 )
 
                 # i label
-                new_i_label = manim.MathTex("i=", str(i - 1))
+                new_i_label = math_tex("i=", str(i - 1))
                 new_i_label.move_to(
                     table.get_cell((1, 1)).get_left()
                     + manim.RIGHT * new_i_label.width / 2
@@ -463,7 +420,7 @@ class dp_06_03(manim.Scene):
                 dp[j - 1] = dp[j - 2] + dp[j - 1]
 
                 # Show new value
-                value = manim.MathTex(str(dp[j - 1]))
+                value = math_tex(str(dp[j - 1]))
                 value.next_to(
                     table.get_cell((1, j)),
                     manim.DOWN * table.get_cell((1, j)).get_height(),
@@ -475,7 +432,7 @@ class dp_06_03(manim.Scene):
 
                 # Overwrite value
                 value.generate_target()
-                value.target.move_to(table.get_cell((1, j)).get_center())
+                value.target.move_to(cell_center(table, (1, j)))
                 self.play(
                     manim.FadeOut(table.get_entries((1, j)), shift=manim.UP),
                     manim.MoveToTarget(value),
@@ -1,5 +1,4 @@
 import manim
-import numpy as np
 
 # Needed to have relative import
 import sys
@@ -8,11 +7,16 @@ import os
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
+from utils.dependency_graph import DependencyGraph
 from utils.sized_container import SizedContainer
-from utils.table_utils import set_table_mobject
+from utils.table_utils import cell_center, set_table_mobject
+from utils.tex_cache import math_tex, tex
+from utils.scene_profiler import ProfiledScene
+from utils.dynamic_programming import solution_trace, solve_edit_distance
+from utils.dynamic_programming.edit_distance import INSERT, REPLACE, DELETE
 
 
-class dp_07_01(manim.Scene):
+class dp_07_01(ProfiledScene, manim.Scene):
     WORD_X: str = "sunny"
     WORD_Y: str = "snowy"
     LINE_BUFFER: float = 0.25
@@ -26,23 +30,19 @@ class dp_07_01(manim.Scene):
         )
 
     def construct(self):
+        solution = solve_edit_distance(self.WORD_X, self.WORD_Y)
+        dp = solution.table
+
         # Initialize table
         table = manim.MathTable(
-            [
-                ["0", "1", "2", "3", "4", "5"],
-                ["1", "0", "1", "2", "3", "4"],
-                ["2", "1", "1", "2", "3", "4"],
-                ["3", "2", "1", "2", "3", "4"],
-                ["4", "3", "2", "2", "3", "4"],
-                ["5", "4", "3", "3", "3", "3"],
-            ],
+            [[str(value) for value in row] for row in dp],
             row_labels=[
-                self.contained_element(manim.Tex(c)) for c in ["", *self.WORD_X]
+                self.contained_element(tex(c)) for c in ["", *self.WORD_X]
             ],
             col_labels=[
-                self.contained_element(manim.Tex(c)) for c in ["", *self.WORD_Y]
+                self.contained_element(tex(c)) for c in ["", *self.WORD_Y]
             ],
-            element_to_mobject=lambda el: self.contained_element(manim.MathTex(el)),
+            element_to_mobject=lambda el: self.contained_element(math_tex(el)),
             v_buff=0.4,
             h_buff=0.8,
             include_outer_lines=True,
@@ -67,7 +67,7 @@ class dp_07_01(manim.Scene):
         )
 
         # Show top left
-        set_table_mobject(table, (2, 2), manim.MathTex("0"))
+        set_table_mobject(table, (2, 2), math_tex("0"))
         self.play(manim.FadeIn(table.get_entries((2, 2))))
 
         self.wait()
@@ -80,216 +80,190 @@ class dp_07_01(manim.Scene):
         )
 
         # Loop through everything
-        dp = np.zeros((6, 6), dtype=np.int32)
-        lines = [[None] * 6 for _ in range(6)]
-        dp[0][0] = 0
-        for i in range(1, len(self.WORD_X) + 2):
-            for j in range(1, len(self.WORD_Y) + 2):
-                # Skip
-                if i == 1 and j == 1:
-                    continue
+        graph = DependencyGraph(buff=self.LINE_BUFFER)
+        for step in solution_trace(solution):
+            i, j = step.cell[0] + 1, step.cell[1] + 1
 
-                # Show current box
-                if i == 1 and j == 2:
-                    box_curr.move_to(table.get_cell((1 + i, 1 + j)).get_center())
-                    self.play(
-                        manim.FadeIn(box_curr),
-                        run_time=0.33,
-                    )
+            # Skip
+            if i == 1 and j == 1:
+                continue
 
-                    # Add a line from previous to curr
-                    lines[i - 1][j - 1] = manim.Line(
-                        table.get_cell((1 + i, 1 + j - 1)).get_center(),
-                        table.get_cell((1 + i, 1 + j)).get_center(),
-                        buff=self.LINE_BUFFER,
-                        color=manim.GREY,
-                    )
+            # Show current box
+            if i == 1 and j == 2:
+                box_curr.move_to(cell_center(table, (1 + i, 1 + j)))
+                self.play(
+                    manim.FadeIn(box_curr),
+                    run_time=0.33,
+                )
 
-                    dp[0][1] = 1
-                    set_table_mobject(
-                        table, (1 + i, 1 + j), manim.MathTex(str(dp[i - 1][j - 1]))
-                    )
+                # Add a line from previous to curr
+                graph.add_edge(
+                    (i - 1, j - 1),
+                    cell_center(table, (1 + i, 1 + j - 1)),
+                    cell_center(table, (1 + i, 1 + j)),
+                )
 
-                    self.play(
-                        manim.Create(lines[i - 1][j - 1]),
-                        manim.FadeIn(table.get_entries((1 + i, 1 + j))),
-                        manim.Indicate(
-                            table.get_entries((1 + i, j)), color=manim.GREEN
-                        ),
-                        run_time=0.66,
-                    )
+                set_table_mobject(
+                    table, (1 + i, 1 + j), math_tex(str(step.value))
+                )
 
-                    self.wait(0.33)
+                self.play(
+                    graph.create([(i - 1, j - 1)]),
+                    manim.FadeIn(table.get_entries((1 + i, 1 + j))),
+                    manim.Indicate(
+                        table.get_entries((1 + i, j)), color=manim.GREEN
+                    ),
+                    run_time=0.66,
+                )
 
-                    continue
+                self.wait(0.33)
 
-                # Move to position
-                box_curr.generate_target()
-                box_curr.target.move_to(table.get_cell((1 + i, 1 + j)).get_center())
+                continue
 
-                self.play(manim.MoveToTarget(box_curr), run_time=0.33)
+            # Move to position
+            box_curr.generate_target()
+            box_curr.target.move_to(cell_center(table, (1 + i, 1 + j)))
 
-                anim_group = []
+            self.play(manim.MoveToTarget(box_curr), run_time=0.33)
 
-                # Calculate dp
-                if i == 1:
-                    dp[i - 1][j - 1] = dp[i - 1][j - 2] + 1
+            anim_group = []
 
-                    # Indicate the previous box
-                    anim_group.append(
-                        manim.Indicate(
-                            table.get_entries((1 + i, 1 + j - 1)),
-                            color=manim.GREEN,
-                        )
+            # Show where dp comes from
+            if i == 1:
+                # Indicate the previous box
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1 + i, 1 + j - 1)),
+                        color=manim.GREEN,
                     )
+                )
 
-                    # Add line
-                    lines[i - 1][j - 1] = manim.Line(
-                        table.get_cell((1 + i, 1 + j - 1)).get_center(),
-                        table.get_cell((1 + i, 1 + j)).get_center(),
-                        buff=self.LINE_BUFFER,
-                        color=manim.GREY,
+                # Add line
+                graph.add_edge(
+                    (i - 1, j - 1),
+                    cell_center(table, (1 + i, 1 + j - 1)),
+                    cell_center(table, (1 + i, 1 + j)),
+                )
+                anim_group.append(graph.create([(i - 1, j - 1)]))
+            elif j == 1:
+                # Indicate the previous box
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1 + i - 1, 1 + j)),
+                        color=manim.GREEN,
                     )
-                    anim_group.append(manim.Create(lines[i - 1][j - 1]))
-                elif j == 1:
-                    dp[i - 1][j - 1] = dp[i - 2][j - 1] + 1
+                )
 
-                    # Indicate the previous box
-                    anim_group.append(
-                        manim.Indicate(
-                            table.get_entries((1 + i - 1, 1 + j)),
-                            color=manim.GREEN,
-                        )
+                # Add line
+                graph.add_edge(
+                    (i - 1, j - 1),
+                    cell_center(table, (1 + i - 1, 1 + j)),
+                    cell_center(table, (1 + i, 1 + j)),
+                )
+                anim_group.append(graph.create([(i - 1, j - 1)]))
+            elif self.WORD_X[i - 2] == self.WORD_Y[j - 2]:
+                # Indicate the previous box
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1 + i - 1, 1 + j - 1)),
+                        color=manim.GREEN,
                     )
+                )
 
-                    # Add line
-                    lines[i - 1][j - 1] = manim.Line(
-                        table.get_cell((1 + i - 1, 1 + j)).get_center(),
-                        table.get_cell((1 + i, 1 + j)).get_center(),
-                        buff=self.LINE_BUFFER,
-                        color=manim.GREY,
+                # Indicate the words
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1 + i, 1)),
+                        color=manim.GREEN,
                     )
-                    anim_group.append(manim.Create(lines[i - 1][j - 1]))
-                elif self.WORD_X[i - 2] == self.WORD_Y[j - 2]:
-                    dp[i - 1][j - 1] = dp[i - 2][j - 2]
-
-                    # Indicate the previous box
-                    anim_group.append(
-                        manim.Indicate(
-                            table.get_entries((1 + i - 1, 1 + j - 1)),
-                            color=manim.GREEN,
-                        )
+                )
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1, 1 + j)),
+                        color=manim.GREEN,
                     )
+                )
 
-                    # Indicate the words
-                    anim_group.append(
-                        manim.Indicate(
-                            table.get_entries((1 + i, 1)),
-                            color=manim.GREEN,
-                        )
+                # Add line
+                graph.add_edge(
+                    (i - 1, j - 1),
+                    cell_center(table, (1 + i - 1, 1 + j - 1)),
+                    cell_center(table, (1 + i, 1 + j)),
+                )
+                anim_group.append(graph.create([(i - 1, j - 1)]))
+            else:
+                # Indicate the word
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1 + i, 1)),
+                        color=manim.RED,
                     )
-                    anim_group.append(
-                        manim.Indicate(
-                            table.get_entries((1, 1 + j)),
-                            color=manim.GREEN,
-                        )
+                )
+                anim_group.append(
+                    manim.Indicate(
+                        table.get_entries((1, 1 + j)),
+                        color=manim.RED,
                     )
+                )
+
+                prev_pos = [
+                    (1 + i - 1, 1 + j - 1),
+                    (1 + i - 1, 1 + j),
+                    (1 + i, 1 + j - 1),
+                ]
+                prev_colors = [manim.RED, manim.RED, manim.RED]
+                move = step.move
+                if move == INSERT:
+                    prev_colors[2] = manim.YELLOW
 
                     # Add line
-                    lines[i - 1][j - 1] = manim.Line(
-                        table.get_cell((1 + i - 1, 1 + j - 1)).get_center(),
-                        table.get_cell((1 + i, 1 + j)).get_center(),
-                        buff=self.LINE_BUFFER,
-                        color=manim.GREY,
+                    graph.add_edge(
+                        (i - 1, j - 1),
+                        cell_center(table, (1 + i, 1 + j - 1)),
+                        cell_center(table, (1 + i, 1 + j)),
                     )
-                    anim_group.append(manim.Create(lines[i - 1][j - 1]))
-                else:
-                    # Indicate the word
-                    anim_group.append(
-                        manim.Indicate(
-                            table.get_entries((1 + i, 1)),
-                            color=manim.RED,
-                        )
+                    anim_group.append(graph.create([(i - 1, j - 1)]))
+                elif move == REPLACE:
+                    prev_colors[0] = manim.YELLOW
+
+                    # Add line
+                    graph.add_edge(
+                        (i - 1, j - 1),
+                        cell_center(table, (1 + i - 1, 1 + j - 1)),
+                        cell_center(table, (1 + i, 1 + j)),
                     )
+                    anim_group.append(graph.create([(i - 1, j - 1)]))
+                elif move == DELETE:
+                    prev_colors[1] = manim.YELLOW
+
+                    # Add line
+                    graph.add_edge(
+                        (i - 1, j - 1),
+                        cell_center(table, (1 + i - 1, 1 + j)),
+                        cell_center(table, (1 + i, 1 + j)),
+                    )
+                    anim_group.append(graph.create([(i - 1, j - 1)]))
+
+                # Indicate the previous boxes
+                for k in range(3):
                     anim_group.append(
                         manim.Indicate(
-                            table.get_entries((1, 1 + j)),
-                            color=manim.RED,
+                            table.get_entries(prev_pos[k]),
+                            color=prev_colors[k],
                         )
                     )
 
-                    prev_pos = [
-                        (1 + i - 1, 1 + j - 1),
-                        (1 + i - 1, 1 + j),
-                        (1 + i, 1 + j - 1),
-                    ]
-                    prev_colors = [manim.RED, manim.RED, manim.RED]
-                    if (
-                        dp[i - 1][j - 2] <= dp[i - 2][j - 2]
-                        and dp[i - 1][j - 2] <= dp[i - 2][j - 1]
-                    ):
-                        dp[i - 1][j - 1] = dp[i - 1][j - 2] + 1
-                        prev_colors[2] = manim.YELLOW
-
-                        # Add line
-                        lines[i - 1][j - 1] = manim.Line(
-                            table.get_cell((1 + i, 1 + j - 1)).get_center(),
-                            table.get_cell((1 + i, 1 + j)).get_center(),
-                            buff=self.LINE_BUFFER,
-                            color=manim.GREY,
-                        )
-                        anim_group.append(manim.Create(lines[i - 1][j - 1]))
-                    elif (
-                        dp[i - 2][j - 2] <= dp[i - 2][j - 1]
-                        and dp[i - 2][j - 2] <= dp[i - 1][j - 2]
-                    ):
-                        dp[i - 1][j - 1] = dp[i - 2][j - 2] + 1
-                        prev_colors[0] = manim.YELLOW
-
-                        # Add line
-                        lines[i - 1][j - 1] = manim.Line(
-                            table.get_cell((1 + i - 1, 1 + j - 1)).get_center(),
-                            table.get_cell((1 + i, 1 + j)).get_center(),
-                            buff=self.LINE_BUFFER,
-                            color=manim.GREY,
-                        )
-                        anim_group.append(manim.Create(lines[i - 1][j - 1]))
-                    elif (
-                        dp[i - 2][j - 1] <= dp[i - 2][j - 2]
-                        and dp[i - 2][j - 1] <= dp[i - 1][j - 2]
-                    ):
-                        dp[i - 1][j - 1] = dp[i - 2][j - 1] + 1
-                        prev_colors[1] = manim.YELLOW
-
-                        # Add line
-                        lines[i - 1][j - 1] = manim.Line(
-                            table.get_cell((1 + i - 1, 1 + j)).get_center(),
-                            table.get_cell((1 + i, 1 + j)).get_center(),
-                            buff=self.LINE_BUFFER,
-                            color=manim.GREY,
-                        )
-                        anim_group.append(manim.Create(lines[i - 1][j - 1]))
-
-                    # Indicate the previous boxes
-                    for k in range(3):
-                        anim_group.append(
-                            manim.Indicate(
-                                table.get_entries(prev_pos[k]),
-                                color=prev_colors[k],
-                            )
-                        )
-
-                # Show dp
-                set_table_mobject(
-                    table, (1 + i, 1 + j), manim.MathTex(str(dp[i - 1][j - 1]))
-                )
-                self.play(
-                    manim.FadeIn(table.get_entries((1 + i, 1 + j))),
-                    *anim_group,
-                    run_time=0.67,
-                )
+            # Show dp
+            set_table_mobject(
+                table, (1 + i, 1 + j), math_tex(str(step.value))
+            )
+            self.play(
+                manim.FadeIn(table.get_entries((1 + i, 1 + j))),
+                *anim_group,
+                run_time=0.67,
+            )
 
-                self.wait(0.33)
+            self.wait(0.33)
 
         # Fade out boxes
         self.play(
@@ -297,35 +271,10 @@ class dp_07_01(manim.Scene):
         )
 
         # Backtrack
-        i = dp.shape[0] - 1
-        j = dp.shape[1] - 1
-        path = [(i, j)]
-        while i > 0 and j > 0:
-            if self.WORD_X[i - 1] == self.WORD_Y[j - 1]:
-                path.append((i - 1, j - 1))
-                i -= 1
-                j -= 1
-            elif dp[i][j - 1] <= dp[i - 1][j] and dp[i][j - 1] <= dp[i - 1][j - 1]:
-                path.append((i, j - 1))
-                j -= 1
-            elif dp[i - 1][j - 1] <= dp[i - 1][j] and dp[i - 1][j - 1] <= dp[i][j - 1]:
-                path.append((i - 1, j - 1))
-                i -= 1
-                j -= 1
-            elif dp[i - 1][j] <= dp[i][j - 1] and dp[i - 1][j] <= dp[i - 1][j - 1]:
-                path.append((i - 1, j))
-                i -= 1
-
-        path.reverse()
+        path = solution.traceback()
 
         # Highlight path
-        anim_group = []
-        for i, j in path[1:]:
-            lines[i][j].generate_target()
-            lines[i][j].target.set_color(manim.GREEN)
-            anim_group.append(
-                manim.MoveToTarget(lines[i][j]),
-            )
+        anim_group = [graph.fade_to_color(path[1:], manim.GREEN)]
 
         for i, j in path:
             table.get_entries((i + 2, j + 2)).generate_target()
@@ -340,7 +289,7 @@ class dp_07_01(manim.Scene):
         self.play(*[manim.FadeOut(mob) for mob in self.mobjects])
 
 
-class dp_07_02(manim.Scene):
+class dp_07_02(ProfiledScene, manim.Scene):
     WORD_X: str = "sunny"
     WORD_Y: str = "snowy"
     LINE_BUFFER: float = 0.25
@@ -365,9 +314,9 @@ class dp_07_02(manim.Scene):
                 # ["5", "4", "3", "3", "3", "3"],
             ],
             col_labels=[
-                self.contained_element(manim.Tex(c)) for c in ["", *self.WORD_Y]
+                self.contained_element(tex(c)) for c in ["", *self.WORD_Y]
             ],
-            element_to_mobject=lambda el: self.contained_element(manim.MathTex(el)),
+            element_to_mobject=lambda el: self.contained_element(math_tex(el)),
             v_buff=0.4,
             h_buff=0.8,
             include_outer_lines=True,
@@ -376,7 +325,7 @@ class dp_07_02(manim.Scene):
         # Initialize word x table
         word_x_table = manim.MathTable(
             [[""]] + [[c] for c in self.WORD_X],
-            element_to_mobject=lambda el: self.contained_element(manim.MathTex(el)),
+            element_to_mobject=lambda el: self.contained_element(math_tex(el)),
             v_buff=0.4,
             h_buff=0.8,
             include_outer_lines=True,
@@ -399,7 +348,7 @@ class dp_07_02(manim.Scene):
             table.get_entries((2, j)).set_opacity(0)
 
         # Show table
-        top_left_label = manim.MathTex(r"\text{top left}", "=", "0")
+        top_left_label = math_tex(r"\text{top left}", "=", "0")
         top_left_label.move_to(
             table.get_cell((1, 1)).get_left()
             + table.get_cell((1, 1)).height * manim.UP
@@ -418,7 +367,7 @@ class dp_07_02(manim.Scene):
         )
 
         # Show (0, 0)
-        set_table_mobject(table, (2, 1), manim.MathTex("0"))
+        set_table_mobject(table, (2, 1), math_tex("0"))
         self.play(manim.FadeIn(table.get_entries((2, 1))))
 
         # Add the 3 indication box
@@ -441,18 +390,18 @@ class dp_07_02(manim.Scene):
                 # Show current box
                 if i == 1:
                     if j == 2:
-                        box_curr.move_to(table.get_cell((2, j)).get_center())
+                        box_curr.move_to(cell_center(table, (2, j)))
                         self.play(
                             manim.FadeIn(box_curr),
                             run_time=0.33,
                         )
                     else:
                         box_curr.generate_target()
-                        box_curr.target.move_to(table.get_cell((2, j)).get_center())
+                        box_curr.target.move_to(cell_center(table, (2, j)))
                         self.play(manim.MoveToTarget(box_curr), run_time=0.33)
 
                     dp[j - 1] = j - 1
-                    set_table_mobject(table, (2, j), manim.MathTex(str(dp[j - 1])))
+                    set_table_mobject(table, (2, j), math_tex(str(dp[j - 1])))
 
                     self.play(
                         manim.FadeIn(table.get_entries((2, j))),
@@ -466,7 +415,7 @@ class dp_07_02(manim.Scene):
                 anim_group = []
                 # Move to position
                 box_curr.generate_target()
-                box_curr.target.move_to(table.get_cell((2, j)).get_center())
+                box_curr.target.move_to(cell_center(table, (2, j)))
 
                 anim_group.append(manim.MoveToTarget(box_curr))
 
@@ -580,7 +529,7 @@ class dp_07_02(manim.Scene):
 
                 # Show dp
                 original = table.get_entries((2, j))
-                new_dp = manim.MathTex(str(dp[j - 1]))
+                new_dp = math_tex(str(dp[j - 1]))
                 new_dp.move_to(
                     original.get_center() + table.get_cell((2, j)).height * manim.DOWN,
                 )
@@ -592,7 +541,7 @@ class dp_07_02(manim.Scene):
                 )
 
                 # Update top_left and dp mobjects
-                new_top_left_label = manim.MathTex(
+                new_top_left_label = math_tex(
                     r"\text{top left}", "=", str(top_left)
                 )
                 new_top_left_label.move_to(top_left_label)
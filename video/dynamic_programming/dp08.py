@@ -8,11 +8,16 @@ import os
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
+from utils.dependency_graph import DependencyGraph
 from utils.sized_container import SizedContainer
-from utils.table_utils import set_table_mobject
+from utils.table_utils import cell_center, set_table_mobject, set_table_values
+from utils.tex_cache import math_tex, tex
+from utils.scene_profiler import ProfiledScene
+from utils.dynamic_programming import knapsack_rows, solve_knapsack
+from utils.dynamic_programming.knapsack import TAKE
 
 
-class dp_08_01(manim.Scene):
+class dp_08_01(ProfiledScene, manim.Scene):
     CAPACITY: int = 5
     WEIGHTS: list = [2, 1, 4, 3]
     VALUES: list = [20, 10, 30, 15]
@@ -28,36 +33,32 @@ class dp_08_01(manim.Scene):
         )
 
     def construct(self):
+        solution = solve_knapsack(self.WEIGHTS, self.VALUES, self.CAPACITY)
+
         # Initialize table
         table = manim.MathTable(
-            [
-                ["0", "0", "0", "0", "0", "0"],
-                ["0", "0", "20", "20", "20", "20"],
-                ["0", "10", "20", "30", "30", "30"],
-                ["0", "10", "20", "30", "30", "40"],
-                ["0", "10", "20", "30", "30", "40"],
-            ],
+            [[str(value) for value in row] for row in solution.table],
             row_labels=[
                 SizedContainer(
                     width=0.8,
                     height=0.6,
-                    mobject=manim.Tex(""),
+                    mobject=tex(""),
                 ),
                 *[
                     SizedContainer(
                         width=0.8,
                         height=0.6,
-                        mobject=manim.Tex("(", f"{w}", ", ", f"{v}", ")"),
+                        mobject=tex("(", f"{w}", ", ", f"{v}", ")"),
                     )
                     for w, v in zip(self.WEIGHTS, self.VALUES)
                 ],
             ],
             col_labels=[
-                self.contained_element(manim.Tex(i))
+                self.contained_element(tex(i))
                 for i in range(self.CAPACITY + 1)
             ],
             element_to_mobject=lambda el: self.contained_element(
-                manim.MathTex(el)
+                math_tex(el)
             ),
             v_buff=0.4,
             h_buff=0.8,
@@ -87,38 +88,35 @@ class dp_08_01(manim.Scene):
         )
 
         # Show all base cases
-        mobjects = []
-        lines = [
-            [None] * (self.CAPACITY + 1) for _ in range(len(self.WEIGHTS) + 1)
-        ]
+        mobjects = list(
+            set_table_values(
+                table,
+                {
+                    **{(1 + i, 2): 0 for i in range(1, len(self.WEIGHTS) + 2)},
+                    **{(2, 1 + i): 0 for i in range(2, self.CAPACITY + 2)},
+                },
+            ).values()
+        )
+        graph = DependencyGraph(buff=self.LINE_BUFFER)
         for i in range(1, len(self.WEIGHTS) + 2):
-            mob = manim.MathTex("0")
-            set_table_mobject(table, (1 + i, 2), mob)
-            mobjects.append(mob)
-
             if i == 1:
                 continue
 
-            lines[i - 1][0] = manim.Line(
-                table.get_cell((1 + i - 1, 2)).get_center(),
-                table.get_cell((1 + i, 2)).get_center(),
-                buff=self.LINE_BUFFER,
-                color=manim.GREY,
+            graph.add_edge(
+                (i - 1, 0),
+                cell_center(table, (1 + i - 1, 2)),
+                cell_center(table, (1 + i, 2)),
+                visible=True,
             )
-            mobjects.append(lines[i - 1][0])
 
         for i in range(2, self.CAPACITY + 2):
-            mob = manim.MathTex("0")
-            set_table_mobject(table, (2, 1 + i), mob)
-            mobjects.append(mob)
-
-            lines[0][i - 1] = manim.Line(
-                table.get_cell((2, 1 + i - 1)).get_center(),
-                table.get_cell((2, 1 + i)).get_center(),
-                buff=self.LINE_BUFFER,
-                color=manim.GREY,
+            graph.add_edge(
+                (0, i - 1),
+                cell_center(table, (2, 1 + i - 1)),
+                cell_center(table, (2, 1 + i)),
+                visible=True,
             )
-            mobjects.append(lines[0][i - 1])
+        mobjects.append(graph)
 
         self.play(
             *[manim.FadeIn(mob) for mob in mobjects],
@@ -146,9 +144,7 @@ class dp_08_01(manim.Scene):
         prev_entry_restore = None
 
         # Loop through everything
-        dp = np.zeros(
-            (len(self.WEIGHTS) + 1, self.CAPACITY + 1), dtype=np.int32
-        )
+        dp = solution.table
         for i in range(2, len(self.WEIGHTS) + 2):
             for j in range(2, self.CAPACITY + 2):
                 # Current weight and value
@@ -163,10 +159,10 @@ class dp_08_01(manim.Scene):
                 # Show current box
                 if i == 2 and j == 2:
                     box_curr.move_to(
-                        table.get_cell((1 + i, 1 + j)).get_center()
+                        cell_center(table, (1 + i, 1 + j))
                     )
                     box_top.move_to(
-                        table.get_cell((1 + i - 1, 1 + j)).get_center()
+                        cell_center(table, (1 + i - 1, 1 + j))
                     )
                     self.play(
                         manim.FadeIn(box_curr),
@@ -175,22 +171,20 @@ class dp_08_01(manim.Scene):
                     )
 
                     # Add a line from previous to curr
-                    lines[i - 1][j - 1] = manim.Line(
+                    graph.add_edge(
+                        (i - 1, j - 1),
                         box_top.get_center(),
                         box_curr.get_center(),
-                        buff=self.LINE_BUFFER,
-                        color=manim.GREY,
                     )
 
-                    dp[0][1] = 0
                     set_table_mobject(
                         table,
                         (1 + i, 1 + j),
-                        manim.MathTex(str(dp[i - 1][curr_capacity])),
+                        math_tex(str(dp[i - 1][curr_capacity])),
                     )
 
                     self.play(
-                        manim.Create(lines[i - 1][j - 1]),
+                        graph.create([(i - 1, j - 1)]),
                         manim.Indicate(
                             table.get_entries((1 + i - 1, 1 + j)),
                             color=manim.GREEN,
@@ -213,12 +207,12 @@ class dp_08_01(manim.Scene):
 
                 box_curr.generate_target()
                 box_curr.target.move_to(
-                    table.get_cell((1 + i, 1 + j)).get_center()
+                    cell_center(table, (1 + i, 1 + j))
                 )
 
                 box_top.generate_target()
                 box_top.target.move_to(
-                    table.get_cell((1 + i - 1, 1 + j)).get_center()
+                    cell_center(table, (1 + i - 1, 1 + j))
                 )
 
                 # Restore previous entry left
@@ -327,13 +321,9 @@ class dp_08_01(manim.Scene):
 
                 anim_group = []
 
-                # Calculate dp
+                # Show where dp comes from
                 if curr_weight <= curr_capacity:
-                    not_take = dp[i - 2][curr_capacity]
-                    take = dp[i - 2][curr_capacity - curr_weight] + curr_value
-
-                    if take > not_take:
-                        dp[i - 1][curr_capacity] = take
+                    if solution.provenance[i - 1][curr_capacity] == TAKE:
                         anim_group.append(
                             manim.Indicate(
                                 manim.VGroup(
@@ -359,14 +349,12 @@ class dp_08_01(manim.Scene):
                         )
 
                         # Add a line from previous to curr
-                        lines[i - 1][j - 1] = manim.Line(
+                        graph.add_edge(
+                            (i - 1, j - 1),
                             box_left.get_center(),
                             box_curr.get_center(),
-                            buff=self.LINE_BUFFER,
-                            color=manim.GREY,
                         )
                     else:
-                        dp[i - 1][curr_capacity] = not_take
                         anim_group.append(
                             manim.Indicate(
                                 manim.VGroup(
@@ -386,14 +374,12 @@ class dp_08_01(manim.Scene):
                         )
 
                         # Add a line from previous to curr
-                        lines[i - 1][j - 1] = manim.Line(
+                        graph.add_edge(
+                            (i - 1, j - 1),
                             box_top.get_center(),
                             box_curr.get_center(),
-                            buff=self.LINE_BUFFER,
-                            color=manim.GREY,
                         )
                 else:
-                    dp[i - 1][curr_capacity] = dp[i - 2][curr_capacity]
                     anim_group.append(
                         manim.Indicate(
                             table.get_entries((1 + i - 1, 1 + j)),
@@ -402,21 +388,20 @@ class dp_08_01(manim.Scene):
                     )
 
                     # Add a line from previous to curr
-                    lines[i - 1][j - 1] = manim.Line(
+                    graph.add_edge(
+                        (i - 1, j - 1),
                         box_top.get_center(),
                         box_curr.get_center(),
-                        buff=self.LINE_BUFFER,
-                        color=manim.GREY,
                     )
 
                 # Show dp
                 set_table_mobject(
                     table,
                     (1 + i, 1 + j),
-                    manim.MathTex(str(dp[i - 1][curr_capacity])),
+                    math_tex(str(dp[i - 1][curr_capacity])),
                 )
                 self.play(
-                    manim.Create(lines[i - 1][j - 1]),
+                    graph.create([(i - 1, j - 1)]),
                     *anim_group,
                     run_time=0.67,
                 )
@@ -438,6 +423,7 @@ class dp_08_01(manim.Scene):
 
         # Backtrack
         anim_group = []
+        path = []
         i = len(self.WEIGHTS)
         j = self.CAPACITY
         while i > 0:
@@ -447,16 +433,12 @@ class dp_08_01(manim.Scene):
                     color=manim.GREEN,
                 )
             )
-            anim_group.append(
-                manim.FadeToColor(
-                    lines[i][j],
-                    color=manim.GREEN,
-                )
-            )
-            if dp[i][j] != dp[i - 1][j]:
+            path.append((i, j))
+            if solution.provenance[i][j] == TAKE:
                 j -= self.WEIGHTS[i - 1]
             i -= 1
 
+        anim_group.append(graph.fade_to_color(path, manim.GREEN))
         anim_group.append(
             manim.FadeToColor(
                 table.get_entries((2, 2)),
@@ -484,7 +466,7 @@ class dp_08_01(manim.Scene):
         j,
         old_v_left=None,
     ):
-        target_v_left = manim.MathTex(
+        target_v_left = math_tex(
             f"{curr_value}",
             "+",
             f"{dp[i - 2][curr_capacity - curr_weight]}",
@@ -513,7 +495,7 @@ class dp_08_01(manim.Scene):
             (1 + i - 1, 1 + j - curr_weight),
             entry_left.copy(),
         )
-        target_entry_left = manim.MathTex(
+        target_entry_left = math_tex(
             f"{dp[i - 2][curr_capacity - curr_weight] + curr_value}",
         )
         target_entry_left.move_to(entry_left.get_center())
@@ -527,7 +509,7 @@ class dp_08_01(manim.Scene):
         return v_left, prev_entry_restore
 
 
-class dp_08_02(manim.Scene):
+class dp_08_02(ProfiledScene, manim.Scene):
     CAPACITY: int = 5
     WEIGHTS: list = [2, 1, 4, 3]
     VALUES: list = [20, 10, 30, 15]
@@ -543,21 +525,21 @@ class dp_08_02(manim.Scene):
         )
 
     def construct(self):
-        # Initialize table
+        # Only the previous and current rows of the table are kept
+        rows = knapsack_rows(self.WEIGHTS, self.VALUES, self.CAPACITY)
+        previous = np.zeros(self.CAPACITY + 1, dtype=np.int64)
+        current, take = next(rows)
+        current = current.copy()
+
+        # Initialize table with the first two rows, the next ones scroll in
         table = manim.MathTable(
-            [
-                ["0", "0", "0", "0", "0", "0"],
-                ["0", "0", "20", "20", "20", "20"],
-                # ["0", "10", "20", "30", "30", "30"],
-                # ["0", "10", "20", "30", "30", "40"],
-                # ["0", "10", "20", "30", "30", "40"],
-            ],
+            [[str(value) for value in row] for row in [previous, current]],
             col_labels=[
-                self.contained_element(manim.Tex(i))
+                self.contained_element(tex(i))
                 for i in range(self.CAPACITY + 1)
             ],
             element_to_mobject=lambda el: self.contained_element(
-                manim.MathTex(el)
+                math_tex(el)
             ),
             v_buff=0.4,
             h_buff=0.8,
@@ -566,7 +548,7 @@ class dp_08_02(manim.Scene):
 
         items_table = manim.MathTable(
             [
-                [manim.MathTex("(", f"{w}", ", ", f"{v}", ")")]
+                [math_tex("(", f"{w}", ", ", f"{v}", ")")]
                 for w, v in zip(self.WEIGHTS, self.VALUES)
             ],
             element_to_mobject=lambda el: SizedContainer(
@@ -611,22 +593,16 @@ class dp_08_02(manim.Scene):
         )
 
         # Show all base cases
-        mobjects = []
-        for i in range(1, 1 + 2):
-            mob = manim.MathTex("0")
-            set_table_mobject(table, (1 + i, 1), mob)
-            mobjects.append(mob)
-
-            if i == 1:
-                continue
-
-        for i in range(1, self.CAPACITY + 2):
-            mob = manim.MathTex("0")
-            set_table_mobject(table, (2, 1 + i), mob)
-            mobjects.append(mob)
+        mobjects = set_table_values(
+            table,
+            {
+                **{(1 + i, 1): 0 for i in range(1, 1 + 2)},
+                **{(2, 1 + i): 0 for i in range(1, self.CAPACITY + 2)},
+            },
+        )
 
         self.play(
-            *[manim.FadeIn(mob) for mob in mobjects],
+            *[manim.FadeIn(mob) for mob in mobjects.values()],
         )
 
         self.wait()
@@ -651,10 +627,15 @@ class dp_08_02(manim.Scene):
         prev_entry_restore = None
 
         # Loop through everything
-        dp = np.zeros(
-            (len(self.WEIGHTS) + 1, self.CAPACITY + 1), dtype=np.int32
-        )
         for i in range(2, len(self.WEIGHTS) + 2):
+            if i > 2:
+                previous = current
+                current, take = next(rows)
+                current = current.copy()
+
+            # The two rows, indexed as in the full table
+            dp = {i - 2: previous, i - 1: current}
+
             for j in range(1, self.CAPACITY + 1):
                 # Current weight and value
                 curr_weight = self.WEIGHTS[i - 2]
@@ -667,9 +648,9 @@ class dp_08_02(manim.Scene):
 
                 # Show current box
                 if i == 2 and j == 1:
-                    box_curr.move_to(table.get_cell((3, 1 + j)).get_center())
+                    box_curr.move_to(cell_center(table, (3, 1 + j)))
                     box_top.move_to(
-                        table.get_cell((3 - 1, 1 + j)).get_center()
+                        cell_center(table, (3 - 1, 1 + j))
                     )
                     self.play(
                         manim.FadeIn(box_curr),
@@ -677,11 +658,10 @@ class dp_08_02(manim.Scene):
                         run_time=0.33,
                     )
 
-                    dp[0][1] = 0
                     set_table_mobject(
                         table,
                         (3, 1 + j),
-                        manim.MathTex(str(dp[i - 1][curr_capacity])),
+                        math_tex(str(dp[i - 1][curr_capacity])),
                     )
 
                     self.play(
@@ -707,12 +687,12 @@ class dp_08_02(manim.Scene):
 
                 box_curr.generate_target()
                 box_curr.target.move_to(
-                    table.get_cell((3, 1 + j)).get_center()
+                    cell_center(table, (3, 1 + j))
                 )
 
                 box_top.generate_target()
                 box_top.target.move_to(
-                    table.get_cell((3 - 1, 1 + j)).get_center()
+                    cell_center(table, (3 - 1, 1 + j))
                 )
 
                 # Next row
@@ -761,7 +741,7 @@ class dp_08_02(manim.Scene):
                         # Box left
                         box_left.generate_target()
                         box_left.target.move_to(
-                            table.get_cell(left_index).get_center()
+                            cell_center(table, left_index)
                         )
 
                         (
@@ -790,7 +770,7 @@ class dp_08_02(manim.Scene):
 
                         # Box left
                         box_left.move_to(
-                            table.get_cell(left_index).get_center()
+                            cell_center(table, left_index)
                         )
                         box_left.generate_target()
                         box_left.target.set_stroke(opacity=1)
@@ -818,7 +798,7 @@ class dp_08_02(manim.Scene):
                         # Box left
                         box_left.generate_target()
                         box_left.target.move_to(
-                            table.get_cell(left_index).get_center()
+                            cell_center(table, left_index)
                         )
 
                         (
@@ -855,13 +835,9 @@ class dp_08_02(manim.Scene):
 
                 anim_group = []
 
-                # Calculate dp
+                # Show where dp comes from
                 if curr_weight <= curr_capacity:
-                    not_take = dp[i - 2][curr_capacity]
-                    take = dp[i - 2][curr_capacity - curr_weight] + curr_value
-
-                    if take > not_take:
-                        dp[i - 1][curr_capacity] = take
+                    if take[curr_capacity]:
                         anim_group.append(
                             manim.Indicate(
                                 manim.VGroup(
@@ -880,7 +856,6 @@ class dp_08_02(manim.Scene):
                             )
                         )
                     else:
-                        dp[i - 1][curr_capacity] = not_take
                         anim_group.append(
                             manim.Indicate(
                                 manim.VGroup(
@@ -899,7 +874,6 @@ class dp_08_02(manim.Scene):
                             )
                         )
                 else:
-                    dp[i - 1][curr_capacity] = dp[i - 2][curr_capacity]
                     anim_group.append(
                         manim.Indicate(
                             table.get_entries((3 - 1, 1 + j)),
@@ -913,7 +887,7 @@ class dp_08_02(manim.Scene):
                 set_table_mobject(
                     table,
                     (3, 1 + j),
-                    manim.MathTex(str(dp[i - 1][curr_capacity])),
+                    math_tex(str(dp[i - 1][curr_capacity])),
                 )
 
                 self.play(
@@ -949,14 +923,14 @@ class dp_08_02(manim.Scene):
         left_index,
         old_v_left=None,
     ):
-        target_v_left = manim.MathTex(
+        target_v_left = math_tex(
             f"{curr_value}",
             "+",
             f"{dp[i - 2][curr_capacity - curr_weight]}",
             font_size=24,
         )
         target_v_left.move_to(
-            table.get_cell(left_index).get_center()
+            cell_center(table, left_index)
             + self.OVERSET_BUFFER * manim.UP
         )
 
@@ -975,12 +949,12 @@ class dp_08_02(manim.Scene):
         )
 
         # Entry left
-        target_entry_left = manim.MathTex(
+        target_entry_left = math_tex(
             f"{dp[i - 2][curr_capacity - curr_weight] + curr_value}",
         )
-        target_entry_left.move_to(table.get_cell(left_index).get_center())
+        target_entry_left.move_to(cell_center(table, left_index))
         entry_restore = entry_left.copy()
-        entry_restore.move_to(table.get_cell(left_index).get_center())
+        entry_restore.move_to(cell_center(table, left_index))
         prev_entry_restore = (
             (3 - 1, 1 + j - curr_weight),
             entry_restore,
@@ -0,0 +1,105 @@
+"""
+Export the DP traces of the problems of the site's interactive tables.
+
+Usage:
+    python export_traces.py [-o OUTPUT_DIR] [--columnar] [-k PATTERN] [--check]
+
+Each problem of `site/src/components/interactives/dp` is solved once
+with its initial inputs, and its trace is streamed to
+`site/static/dp/traces/<name>.ndjson`, or `.dptrace` with `--columnar`,
+see `utils/dynamic_programming/trace.py` for the formats.
+
+The NDJSON traces are committed, so the site build publishes them
+without running Python, and the interactives show them until their
+inputs are edited, see `site/src/utils/dpTrace.ts`. Run this script
+again when a solver changes, `--check` fails if a trace is out of date.
+"""
+from __future__ import annotations
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+import argparse
+import sys
+import tempfile
+
+from utils.dynamic_programming import (
+    DPSolution,
+    solve_edit_distance,
+    solve_knapsack,
+    solve_min_cost_stairs,
+    solve_unique_paths,
+    write_trace,
+)
+
+
+VIDEO_DIR = Path(__file__).resolve().parent
+TRACES_DIR = VIDEO_DIR.parent / "site" / "static" / "dp" / "traces"
+
+
+def _knapsack(capacity: int, items: Sequence[Tuple[int, int]]) -> DPSolution:
+    return solve_knapsack([weight for weight, _ in items], [value for _, value in items], capacity)
+
+
+# Problem and inputs of each interactive, the same as its initial text inputs
+PROBLEMS: Dict[str, Tuple[str, Callable[..., DPSolution], Dict[str, Any]]] = {
+    "dp_05": ("min_cost_stairs", solve_min_cost_stairs, {"cost": [1, 5, 2, 4, 3]}),
+    "dp_06": ("unique_paths", solve_unique_paths, {"rows": 3, "cols": 7}),
+    "dp_07": ("edit_distance", solve_edit_distance, {"x": "sunny", "y": "snowy"}),
+    "dp_08": ("knapsack", _knapsack, {"capacity": 5, "items": [[2, 20], [1, 10], [4, 30], [3, 15]]}),
+}
+
+
+def export(name: str, path: Path, columnar: bool = False) -> DPSolution:
+    """
+    Solve the problem of an interactive and write its trace.
+
+    Arguments:
+        name: The name of the interactive.
+        path: The path of the trace.
+        columnar: Whether to use the columnar format instead of NDJSON.
+
+    Returns:
+        The solution.
+    """
+    problem, solve, inputs = PROBLEMS[name]
+    solution = solve(**inputs)
+    write_trace(path, solution, columnar=columnar, problem=problem, inputs=inputs)
+    return solution
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the DP traces of the site's interactive tables.")
+    parser.add_argument("-o", "--output-dir", type=Path, default=TRACES_DIR, help="directory of the traces")
+    parser.add_argument("--columnar", action="store_true", help="write the binary columnar format instead of NDJSON")
+    parser.add_argument("-k", "--pattern", default="*", help="glob pattern on the interactive names")
+    parser.add_argument("--check", action="store_true", help="only check that the traces are up to date")
+    args = parser.parse_args(argv)
+
+    names = [name for name in PROBLEMS if fnmatchcase(name, args.pattern)]
+    if not names:
+        print(f"No interactive matches {args.pattern!r}", file=sys.stderr)
+        return 1
+
+    suffix = ".dptrace" if args.columnar else ".ndjson"
+    if args.check:
+        stale = []
+        with tempfile.TemporaryDirectory() as temp:
+            for name in names:
+                path = args.output_dir / f"{name}{suffix}"
+                export(name, Path(temp) / path.name, args.columnar)
+                if not path.exists() or path.read_bytes() != (Path(temp) / path.name).read_bytes():
+                    stale.append(name)
+        for name in stale:
+            print(f"{name}: trace out of date, run python export_traces.py", file=sys.stderr)
+        return 1 if stale else 0
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        path = args.output_dir / f"{name}{suffix}"
+        solution = export(name, path, args.columnar)
+        print(f"{name}: {solution.table.size} cells to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,14 @@
-from ...utils.linked_list import LinkedList
 from manim import *
 
+# Needed to have relative import
+import sys
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(os.path.dirname(SCRIPT_DIR)))
+
+from utils.linked_list import LinkedList
+
 
 class Visualization(Scene):
     def construct(self):
@@ -0,0 +1,292 @@
+"""
+Render every scene of the course in parallel.
+
+Usage:
+    python render_all.py [-j JOBS] [-k PATTERN] [--list] [--force] [-- MANIM_ARGS...]
+
+Every `manim.Scene` subclass defined in a module under `video/` is rendered
+by its own manim process, with as many processes as cores by default.
+The output of each render goes to its own log file, and a summary of the
+wall times is printed at the end. The exit code is 1 if any render failed.
+
+Scenes whose module, imported `video/utils` modules and render config
+did not change since their last successful render, and whose output
+still exists, are skipped, see `render_manifest.py`.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+
+from render_manifest import RenderManifest, render_config
+
+
+VIDEO_DIR = Path(__file__).resolve().parent
+MEDIA_DIR = VIDEO_DIR / "media"
+
+# Files written by manim for a scene
+OUTPUT_SUFFIXES = {".mp4", ".mov", ".webm", ".gif", ".png"}
+
+# Directories which never hold scenes
+EXCLUDED_DIRS = {"utils", "media", "__pycache__"}
+
+# Base classes of scenes, as written in the modules
+SCENE_BASES = {
+    "Scene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "ThreeDScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+
+class SceneSpec(NamedTuple):
+    """
+    A scene class and the module defining it.
+    """
+
+    path: Path
+    name: str
+
+    @property
+    def id(self) -> str:
+        """
+        The identifier of the scene, e.g. `dynamic_programming/dp01.py::dp_01_01`.
+        """
+        return f"{self.path.relative_to(VIDEO_DIR).as_posix()}::{self.name}"
+
+
+class RenderResult(NamedTuple):
+    """
+    The outcome of rendering a scene.
+    """
+
+    scene: SceneSpec
+    returncode: int
+    wall_time: float
+    log_path: Path
+    outputs: List[Path]
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+def _base_name(base: ast.expr) -> Optional[str]:
+    """
+    Get the name of a base class expression, `Scene` for both
+    `Scene` and `manim.Scene`.
+    """
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    return None
+
+
+def find_scenes(path: Path) -> List[SceneSpec]:
+    """
+    Find the scene classes defined in a module, without importing it.
+
+    A class is a scene if one of its bases is a manim scene class,
+    or another scene of the same module.
+
+    Arguments:
+        path: The path of the module.
+
+    Returns:
+        The scenes, in order of definition.
+    """
+    tree = ast.parse(path.read_text(), filename=str(path))
+    scene_names = set(SCENE_BASES)
+    scenes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if any(_base_name(base) in scene_names for base in node.bases):
+            scene_names.add(node.name)
+            scenes.append(SceneSpec(path, node.name))
+    return scenes
+
+
+def discover_scenes(root: Path = VIDEO_DIR, pattern: str = "*") -> List[SceneSpec]:
+    """
+    Find the scene classes of all the modules under a directory.
+
+    Arguments:
+        root: The directory.
+        pattern: A glob pattern the scene names or ids must match.
+
+    Returns:
+        The scenes, sorted by module and in order of definition.
+    """
+    scenes = []
+    for path in sorted(root.rglob("*.py")):
+        if EXCLUDED_DIRS.intersection(path.relative_to(root).parts[:-1]):
+            continue
+        if path.resolve() == Path(__file__).resolve():
+            continue
+        for scene in find_scenes(path):
+            if fnmatchcase(scene.name, pattern) or fnmatchcase(scene.id, pattern):
+                scenes.append(scene)
+    return scenes
+
+
+def find_outputs(scene: SceneSpec, since: float) -> List[Path]:
+    """
+    Find the files a render of the scene wrote to the media directory.
+
+    Arguments:
+        scene: The scene.
+        since: The time the render started, as given by `time.time`.
+
+    Returns:
+        The paths of the files.
+    """
+    return [
+        path
+        for path in MEDIA_DIR.glob(f"*/{scene.path.stem}/**/{scene.name}*")
+        if path.is_file()
+        and path.suffix in OUTPUT_SUFFIXES
+        and path.stat().st_mtime >= since
+    ]
+
+
+def render_scene(scene: SceneSpec, log_dir: Path, manim_args: Sequence[str]) -> RenderResult:
+    """
+    Render a scene in its own manim process.
+
+    The process runs in `video/`, so `manim.cfg` applies to every scene.
+
+    Arguments:
+        scene: The scene.
+        log_dir: The directory of the log files.
+        manim_args: Extra arguments of `manim render`, e.g. `-ql`.
+
+    Returns:
+        The result of the render.
+    """
+    log_path = log_dir / f"{scene.path.stem}.{scene.name}.log"
+    command = [sys.executable, "-m", "manim", "render", *manim_args, str(scene.path), scene.name]
+
+    since = time.time()
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        log.write(" ".join(command) + "\n\n")
+        log.flush()
+        returncode = subprocess.call(
+            command,
+            cwd=VIDEO_DIR,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+        )
+    wall_time = time.perf_counter() - start
+
+    outputs = find_outputs(scene, since) if returncode == 0 else []
+    return RenderResult(scene, returncode, wall_time, log_path, outputs)
+
+
+def format_summary(results: Sequence[RenderResult], wall_time: float, skipped: int = 0) -> str:
+    """
+    Format the results as a table of wall times, slowest first.
+
+    Arguments:
+        results: The results of the renders.
+        wall_time: The wall time of the whole batch.
+        skipped: The number of scenes skipped as up to date.
+
+    Returns:
+        The table.
+    """
+    rows = [
+        (result.scene.id, "ok" if result.ok else f"FAILED ({result.returncode})", f"{result.wall_time:.1f}s")
+        for result in sorted(results, key=lambda result: -result.wall_time)
+    ]
+    header = ("scene", "status", "time")
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(3)]
+
+    def line(row) -> str:
+        return f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  {row[2]:>{widths[2]}}"
+
+    failed = sum(not result.ok for result in results)
+    total = sum(result.wall_time for result in results)
+    return "\n".join(
+        [
+            line(header),
+            "  ".join("-" * width for width in widths),
+            *(line(row) for row in rows),
+            "",
+            f"{len(results) - failed} rendered, {failed} failed, {skipped} up to date, "
+            f"{wall_time:.1f}s wall time, {total:.1f}s total render time",
+        ]
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render every scene under video/ in parallel.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of parallel renders")
+    parser.add_argument("-k", "--pattern", default="*", help="glob pattern on the scene names or ids")
+    parser.add_argument("--log-dir", type=Path, default=MEDIA_DIR / "logs", help="directory of the per-scene logs")
+    parser.add_argument("--manifest", type=Path, default=MEDIA_DIR / "render_manifest.json", help="build manifest of the renders")
+    parser.add_argument("--force", action="store_true", help="render the scenes even if they are up to date")
+    parser.add_argument("--list", action="store_true", help="list the scenes without rendering them")
+    parser.add_argument("manim_args", nargs=argparse.REMAINDER, help="extra arguments of manim render, after --")
+    args = parser.parse_args(argv)
+
+    manim_args = args.manim_args[1:] if args.manim_args[:1] == ["--"] else args.manim_args
+    scenes = discover_scenes(pattern=args.pattern)
+
+    if args.list:
+        for scene in scenes:
+            print(scene.id)
+        return 0
+    if not scenes:
+        print(f"No scene matches {args.pattern!r}", file=sys.stderr)
+        return 1
+
+    manifest = RenderManifest(args.manifest)
+    config = render_config(manim_args)
+    hashes = {scene: manifest.scene_hash(scene.path, scene.name, config) for scene in scenes}
+    stale = [
+        scene
+        for scene in scenes
+        if args.force or not manifest.is_up_to_date(scene.id, hashes[scene])
+    ]
+    skipped = len(scenes) - len(stale)
+    if not stale:
+        print(f"All {len(scenes)} scenes are up to date")
+        return 0
+
+    args.log_dir.mkdir(parents=True, exist_ok=True)
+    jobs = max(1, min(args.jobs, len(stale)))
+    print(f"Rendering {len(stale)} scenes with {jobs} jobs, {skipped} up to date, logs in {args.log_dir}")
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(render_scene, scene, args.log_dir, manim_args) for scene in stale]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result.ok:
+                manifest.record(result.scene.id, hashes[result.scene], result.outputs, result.wall_time)
+            status = "ok" if result.ok else f"FAILED, see {result.log_path}"
+            print(f"[{len(results)}/{len(stale)}] {result.scene.id} {result.wall_time:.1f}s {status}")
+    wall_time = time.perf_counter() - start
+
+    print()
+    print(format_summary(results, wall_time, skipped))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
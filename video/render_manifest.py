@@ -0,0 +1,195 @@
+"""
+Build manifest of the batch renderer, to skip the scenes that did not change.
+"""
+from __future__ import annotations
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+import ast
+import hashlib
+import json
+import os
+import tempfile
+
+
+VIDEO_DIR = Path(__file__).resolve().parent
+UTILS_DIR = VIDEO_DIR / "utils"
+
+
+def imported_utils(path: Path) -> Set[Path]:
+    """
+    Find the `video/utils` modules a module imports, directly or not.
+
+    Arguments:
+        path: The path of the module.
+
+    Returns:
+        The paths of the utils modules.
+    """
+    found: Set[Path] = set()
+    stack = [path]
+    while stack:
+        module = stack.pop()
+        in_utils = module.parent == UTILS_DIR
+        for node in ast.walk(ast.parse(module.read_text(), filename=str(module))):
+            names: List[str] = []
+            if isinstance(node, ast.Import):
+                names = [
+                    alias.name.split(".")[1]
+                    for alias in node.names
+                    if alias.name.startswith("utils.")
+                ]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level == 0 and node.module == "utils" or node.level == 1 and in_utils and node.module is None:
+                    # from utils import btree, from . import btree
+                    names = [alias.name for alias in node.names]
+                elif node.level == 0 and node.module and node.module.startswith("utils."):
+                    names = [node.module.split(".")[1]]
+                elif node.level == 1 and in_utils and node.module:
+                    names = [node.module.split(".")[0]]
+
+            for name in names:
+                for utils_path in _utils_sources(name):
+                    if utils_path not in found:
+                        found.add(utils_path)
+                        stack.append(utils_path)
+    return found
+
+
+def _utils_sources(name: str) -> List[Path]:
+    """
+    Get the source files of a `video/utils` module or package.
+
+    Arguments:
+        name: The name of the module or package.
+
+    Returns:
+        The paths of the module, or of all the modules of the package.
+    """
+    if (UTILS_DIR / name).is_dir():
+        return sorted((UTILS_DIR / name).rglob("*.py"))
+    path = UTILS_DIR / f"{name}.py"
+    return [path] if path.exists() else []
+
+
+def render_config(manim_args: Sequence[str]) -> str:
+    """
+    Describe everything outside of the sources that changes the render.
+
+    Arguments:
+        manim_args: The extra arguments of `manim render`.
+
+    Returns:
+        The description.
+    """
+    try:
+        manim_version = metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        manim_version = None
+    config_path = VIDEO_DIR / "manim.cfg"
+    return json.dumps(
+        {
+            "manim.cfg": config_path.read_text() if config_path.exists() else None,
+            "manim_args": list(manim_args),
+            "manim": manim_version,
+        },
+        sort_keys=True,
+    )
+
+
+class RenderManifest:
+    """
+    Record of the last successful render of each scene.
+
+    Each entry holds a hash of the scene's module, of the `video/utils`
+    modules it imports and of the render config, with the files
+    the render produced. A scene is up to date if its hash did not change
+    and its files still exist.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text())
+            except ValueError:
+                self.entries = {}
+        self._file_hashes: Dict[Path, str] = {}
+
+    def _file_hash(self, path: Path) -> str:
+        if path not in self._file_hashes:
+            self._file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self._file_hashes[path]
+
+    def scene_hash(self, path: Path, name: str, config: str) -> str:
+        """
+        Hash the inputs of the render of a scene.
+
+        Arguments:
+            path: The path of the module of the scene.
+            name: The name of the scene.
+            config: The render config, as given by `render_config`.
+
+        Returns:
+            The hex digest.
+        """
+        digest = hashlib.sha256()
+        digest.update(name.encode())
+        digest.update(config.encode())
+        for source in [path, *sorted(imported_utils(path))]:
+            digest.update(source.relative_to(VIDEO_DIR).as_posix().encode())
+            digest.update(self._file_hash(source).encode())
+        return digest.hexdigest()
+
+    def is_up_to_date(self, scene_id: str, scene_hash: str) -> bool:
+        """
+        Check whether a scene needs no render.
+
+        Arguments:
+            scene_id: The identifier of the scene.
+            scene_hash: The current hash of the scene.
+
+        Returns:
+            True if the last render had the same hash and its outputs exist.
+        """
+        entry = self.entries.get(scene_id)
+        return (
+            entry is not None
+            and entry["hash"] == scene_hash
+            and bool(entry["outputs"])
+            and all((VIDEO_DIR / output).exists() for output in entry["outputs"])
+        )
+
+    def record(self, scene_id: str, scene_hash: str, outputs: Sequence[Path], wall_time: Optional[float] = None):
+        """
+        Record a successful render, and save the manifest.
+
+        Arguments:
+            scene_id: The identifier of the scene.
+            scene_hash: The hash of the scene when it was rendered.
+            outputs: The files produced by the render.
+            wall_time: The wall time of the render.
+        """
+        self.entries[scene_id] = {
+            "hash": scene_hash,
+            "outputs": sorted(
+                Path(os.path.relpath(output, VIDEO_DIR)).as_posix() for output in outputs
+            ),
+            "wall_time": wall_time,
+        }
+        self.save()
+
+    def save(self):
+        """
+        Write the manifest atomically, so an interrupted batch keeps the previous one.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(temp, self.path)
+        except BaseException:
+            os.unlink(temp)
+            raise
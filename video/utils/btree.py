@@ -3,8 +3,25 @@ from typing import Optional, Callable, Dict, Any, Generator, List
 import numpy as np
 import manim
 
+from utils.compact_tree import CompactTree
+from utils import traversal
+from utils.mobject_cache import cached_mobject
+from utils.tree_layout import TreeLayout, HalvingLayout, LayeredLayout
+# Module import, as dag_tree imports this module back
+from utils import dag_tree
+
+
+class BNode:
+    __slots__ = (
+        "label",
+        "left",
+        "right",
+        "mobject",
+        "circle",
+        "left_arrow",
+        "right_arrow",
+    )
 
-class BNode(manim.VMobject):
     def __init__(
         self,
         label: str,
@@ -49,25 +66,47 @@ class BTree(manim.VGroup):
     and assign the mobjects to each BNodes associated with this tree.
 
     You can either play this object directly, or play each node separately.
+
+    The tree can either be given as linked `BNode`s, or as a `CompactTree`,
+    in which case the nodes are `CompactNode` views into its arrays.
+
+    It can also be given as a `DagTree` with shared subtrees. By default it is
+    drawn expanded, with one mobject per distinct subproblem copied for each
+    of its occurrences. With `collapse`, every shared node is drawn once.
+
+    The positions of the nodes are computed by a `TreeLayout`, by default
+    `HalvingLayout` for trees and `LayeredLayout` for collapsed DAGs.
+    `TidyLayout` packs unbalanced trees much tighter.
     """
 
     def __init__(
         self,
-        root: BNode,
+        root: BNode | CompactTree | dag_tree.DagTree,
         vbuff: float = 1,
         hbuff: float = 1,
         element_to_mobject: Callable[..., manim.VMobject] = manim.Paragraph,  # first arg is str, remaining is config
         element_to_mobject_config: Dict[str, Any] = {},
         circle_config: Dict[str, Any] = {},
         circle_buffer_factor: float = 2,
+        collapse: bool = False,
+        layout: Optional[TreeLayout] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.root = root
         self.vbuff = vbuff
         self.hbuff = hbuff
         self.element_to_mobject = element_to_mobject
         self.element_to_mobject_config = element_to_mobject_config
+        self.collapse = collapse
+        if layout is None:
+            layout = LayeredLayout() if collapse else HalvingLayout()
+        self.layout = layout
+
+        if isinstance(root, CompactTree):
+            root = root.node(root.root)
+        elif isinstance(root, dag_tree.DagTree):
+            root = root.root if collapse else self._instance_dag(root.root)
+        self.root = root
 
         self.circle_config = circle_config
         if "color" not in self.circle_config:
@@ -78,7 +117,11 @@ class BTree(manim.VGroup):
         self.nodes = manim.VGroup()
         self.circles = manim.VGroup()
         self.arrows = manim.VGroup()
-        self.tree_depth: int = BTree._compute_depth(self.root)
+        if self.collapse:
+            self.levels = traversal.DagLevelIndex(self.root)
+        else:
+            self.levels = traversal.LevelIndex(self.root)
+        self.tree_depth: int = self.levels.depth
         self.tree_breadth: int = 2 ** (self.tree_depth - 1)
         self.grid = manim.VGroup()
 
@@ -87,14 +130,41 @@ class BTree(manim.VGroup):
     def setup(self):
         """
         Setup the tree.
+
+        The node mobjects, circles and arrows are created once here,
+        then positioned by the layout. Later spacing changes only
+        move what has to move, see `_apply_layout`.
         """
-        # Add nodes
-        self._add_node_mobject(self.root, None, self.tree_breadth)
-        self._add_arrow_mobject(self.root)
+        self._compute_offsets()
+
+        # Add nodes and circles, laid out at the origin for now
+        for node in self._order:
+            if node.mobject is None:
+                node.mobject = cached_mobject(
+                    self.element_to_mobject, node.label, **self.element_to_mobject_config
+                )
+            node.circle = self._get_circle(node.get_mobject())
+            self.nodes.add(node.get_mobject())
+            self.circles.add(node.circle)
+
+        self._centers = np.array([node.get_mobject().get_center() for node in self._order])
+        self._apply_layout()
+
+        # Add arrows
+        for (i, j), direction in zip(self._edges, self.levels.edge_directions):
+            parent = self._order[i]
+            arrow = self._get_arrow(parent, self._order[j])
+            if direction < 0:
+                parent.left_arrow = arrow
+            else:
+                parent.right_arrow = arrow
+            self.arrows.add(arrow)
+        self._measure_arrows()
+
         self.add(self.circles, self.nodes, self.arrows)
 
         self.center()
-    
+
     def set_hbuff(self, hbuff: float):
         """
         Set the horizontal buffer of the tree.
@@ -103,8 +173,9 @@ class BTree(manim.VGroup):
             hbuff: The horizontal buffer.
         """
         self.hbuff = hbuff
-        self.setup()
-    
+        self._apply_layout()
+        self.center()
+
     def set_vbuff(self, vbuff: float):
         """
         Set the vertical buffer of the tree.
@@ -113,7 +184,20 @@ class BTree(manim.VGroup):
             vbuff: The vertical buffer.
         """
         self.vbuff = vbuff
-        self.setup()
+        self._apply_layout()
+        self.center()
+
+    def set_layout(self, layout: TreeLayout):
+        """
+        Set the layout of the tree.
+
+        Arguments:
+            layout: The layout.
+        """
+        self.layout = layout
+        self._offsets = layout.compute(self.levels)
+        self._apply_layout()
+        self.center()
 
     @staticmethod
     def bfs_layer_by_layer(root: BNode) -> Generator[List[BNode], None, None]:
@@ -126,17 +210,7 @@ class BTree(manim.VGroup):
         Returns:
             A generator of layers.
         """
-        queue = [root]
-        while queue:
-            layer = []
-            for _ in range(len(queue)):
-                node = queue.pop(0)
-                layer.append(node)
-                if node.left is not None:
-                    queue.append(node.left)
-                if node.right is not None:
-                    queue.append(node.right)
-            yield layer
+        return traversal.bfs_layer_by_layer(root)
 
     @staticmethod
     def bfs(root: BNode) -> Generator[BNode, None, None]:
@@ -150,9 +224,7 @@ class BTree(manim.VGroup):
         Returns:
             A generator of nodes.
         """
-        for layer in BTree.bfs_layer_by_layer(root):
-            for node in layer:
-                yield node
+        return traversal.bfs(root)
 
     @staticmethod
     def dfs(root: BNode) -> Generator[BNode, None, None]:
@@ -166,14 +238,7 @@ class BTree(manim.VGroup):
         Returns:
             A generator of nodes.
         """
-        stack = [root]
-        while stack:
-            node = stack.pop()
-            yield node
-            if node.right is not None:
-                stack.append(node.right)
-            if node.left is not None:
-                stack.append(node.left)
+        return traversal.dfs(root)
     
     @staticmethod
     def dfs_right_to_left(root: BNode) -> Generator[BNode, None, None]:
@@ -187,121 +252,189 @@ class BTree(manim.VGroup):
         Returns:
             A generator of nodes.
         """
-        stack = [root]
-        while stack:
-            node = stack.pop()
-            yield node
-            if node.left is not None:
-                stack.append(node.left)
-            if node.right is not None:
-                stack.append(node.right)
+        return traversal.dfs_right_to_left(root)
 
-    def _add_node_mobject(
-        self,
-        node: Optional[BNode],
-        parent: Optional[BNode],
-        width: float,
-        direction: np.ndarray = manim.RIGHT,
-    ):
+    def _compute_offsets(self):
         """
-        Process position of node and add to self.nodes recursively.
-        This node will be positioned at the middle of the width,
-        and to the specified direction of the parent.
+        Compute the position of every node relative to the root with the layout,
+        in units of `hbuff` and `vbuff`, in level order.
+        """
+        self._order: List[BNode] = self.levels.order
+        self._edges = self.levels.edges
+        self._offsets = self.layout.compute(self.levels)
 
-        Arguments:
-            node: The node to add.
-            parent: The parent node of the node to add.
-            width: The width of the subtree to add.
-            direction: The direction of the node to add.
+    def _measure_arrows(self):
         """
-        if node is None:
+        Read the geometry of the arrows into arrays, in the order of the edges:
+        the start of each line, the point of its tip, the length of the tip
+        and the buffer of the line.
+        """
+        self._arrow_list: List[manim.Line] = []
+        for (i, _), direction in zip(self._edges, self.levels.edge_directions):
+            parent = self._order[i]
+            if direction < 0:
+                self._arrow_list.append(parent.get_left_arrow())
+            else:
+                self._arrow_list.append(parent.get_right_arrow())
+
+        self._arrow_ends = np.zeros((len(self._arrow_list), 2, 3))
+        self._tip_lengths = np.zeros(len(self._arrow_list))
+        self._arrow_buffs = np.zeros(len(self._arrow_list))
+        for k, arrow in enumerate(self._arrow_list):
+            self._arrow_ends[k] = arrow.points[0], arrow.tip.tip_point
+            self._tip_lengths[k] = np.linalg.norm(arrow.tip.tip_point - arrow.tip.base)
+            self._arrow_buffs[k] = arrow.buff
+
+    def _current_centers(self) -> np.ndarray:
+        """
+        Get the centers of the nodes, from the arrays of the last layout.
+
+        The arrays follow the tree when it was only shifted since, which is
+        checked on the first and last nodes. Otherwise, like when the tree
+        was scaled or transformed, the nodes and arrows are measured again.
+
+        Returns:
+            The centers of the nodes, in level order.
+        """
+        ends = [self._order[0], self._order[-1]]
+        current = np.array([node.get_mobject().get_center() for node in ends])
+        shift = current[0] - self._centers[0]
+        if np.allclose(current[1] - self._centers[-1], shift):
+            if self.arrows.submobjects:
+                self._arrow_ends += shift
+            return self._centers + shift
+
+        if self.arrows.submobjects:
+            self._measure_arrows()
+        return np.array([node.get_mobject().get_center() for node in self._order])
+
+    def _apply_layout(self):
+        """
+        Move the nodes, circles and arrows to the positions given by the
+        offsets, the buffers and the current position of the root.
+
+        The node centers and the arrow ends are kept in arrays, so only
+        the nodes that moved are shifted, and the new ends of the arrows
+        are computed all at once. Each moved arrow gets its line points
+        written directly, and its tip is rotated and shifted to the new end.
+        """
+        scale = np.array([self.hbuff, self.vbuff, 0])
+        centers = self._current_centers()
+        targets = centers[0] + self._offsets * scale
+        deltas = targets - centers
+        moved = np.any(np.abs(deltas) > 1e-8, axis=1)
+        self._centers = targets
+
+        for i in np.flatnonzero(moved):
+            node = self._order[i]
+            node.get_mobject().shift(deltas[i])
+            node.get_circle().shift(deltas[i])
+
+        if not self.arrows.submobjects:
             return
 
-        # Add node
-        is_new = node.mobject is None
-
-        if is_new:
-            node.mobject = self.element_to_mobject(
-                node.label, **self.element_to_mobject_config
-            )
-        if parent is not None:
-            node.get_mobject().move_to(
-                parent.get_mobject().get_center()
-                + manim.DOWN * self.vbuff
-                + direction * (width / 2 * self.hbuff)
-            )
-        if is_new:
-            self.nodes.add(node.get_mobject())
+        parents, children = self._edges[:, 0], self._edges[:, 1]
+        edges = np.flatnonzero(moved[parents] | moved[children])
+        if len(edges) == 0:
+            return
 
-        # Add circle
-        if is_new:
-            circle = self._get_circle(node.get_mobject())
-            node.circle = circle
-            self.circles.add(circle)
-        else:
-            node.get_circle().surround(node.get_mobject(), buffer_factor=self.circle_buffer_factor)
+        # New ends, shortened by the buffer unless too short, like `manim.Line`
+        starts = targets[parents[edges]]
+        vectors = targets[children[edges]] - starts
+        lengths = np.linalg.norm(vectors, axis=1)
+        units = vectors / np.maximum(lengths, 1e-12)[:, np.newaxis]
+        buffs = self._arrow_buffs[edges]
+        buffs = np.where(lengths < 2 * buffs, 0, buffs)[:, np.newaxis]
+        starts = starts + units * buffs
+        tips = starts + units * (lengths[:, np.newaxis] - 2 * buffs)
+        bases = tips - units * self._tip_lengths[edges, np.newaxis]
+
+        # Turn of each tip, from the old direction of its arrow to the new one
+        old_starts, old_tips = self._arrow_ends[edges, 0], self._arrow_ends[edges, 1]
+        old_vectors = old_tips - old_starts
+        angles = np.arctan2(vectors[:, 1], vectors[:, 0]) - np.arctan2(old_vectors[:, 1], old_vectors[:, 0])
+        rotations = np.zeros((len(edges), 3, 3))
+        rotations[:, 0, 0] = rotations[:, 1, 1] = np.cos(angles)
+        rotations[:, 1, 0] = np.sin(angles)
+        rotations[:, 0, 1] = -rotations[:, 1, 0]
+        rotations[:, 2, 2] = 1
+
+        # Anchors and handles at thirds, like `manim.Line.set_points_as_corners`
+        t = np.linspace(0, 1, 4)[np.newaxis, :, np.newaxis]
+        lines = starts[:, np.newaxis] + t * (bases - starts)[:, np.newaxis]
+        for n, k in enumerate(edges):
+            arrow = self._arrow_list[k]
+            arrow.points = lines[n]
+            tip = arrow.tip
+            tip.points = (tip.points - old_tips[n]) @ rotations[n].T + tips[n]
+        self._arrow_ends[edges, 0] = starts
+        self._arrow_ends[edges, 1] = tips
+
+    def _get_arrow(self, parent: BNode, node: BNode) -> manim.Line:
+        """
+        Get the arrow from the parent to the node.
+
+        Arguments:
+            parent: The parent node.
+            node: The child node.
 
-        self._add_node_mobject(node.left, node, width / 2, manim.LEFT)
-        self._add_node_mobject(node.right, node, width / 2, manim.RIGHT)
+        Returns:
+            The arrow mobject.
+        """
+        buff = np.sqrt(parent.get_mobject().width ** 2 + parent.get_mobject().height ** 2) / 2 * self.circle_buffer_factor
+        arrow = manim.Line(
+            parent.get_mobject().get_center(),
+            node.get_mobject().get_center(),
+            stroke_width=4,
+            buff=buff,
+        )
+        self._add_tip(arrow)
+        return arrow
 
-    def _add_arrow_mobject(self, node: Optional[BNode]):
+    @staticmethod
+    def _add_tip(arrow: manim.Line):
         """
-        Add arrow mobjects recursively.
+        Add the arrow tip to the end of the line.
 
         Arguments:
-            node: The node to add arrow mobjects to.
+            arrow: The line to add the tip to.
         """
-        if node is None:
-            return
+        arrow.add_tip(
+            tip_shape=manim.ArrowTriangleFilledTip,
+            tip_length=0.2,
+            tip_width=0.2,
+            at_start=False,
+        )
+
+    def _instance_dag(self, root: BNode) -> BNode:
+        """
+        Expand a DAG with shared nodes into a tree.
 
-        # Function to construct arrow
-        def get_arrow(start: np.ndarray, end: np.ndarray) -> manim.Line:
-            buff = np.sqrt(node.get_mobject().width ** 2 + node.get_mobject().height ** 2) / 2 * self.circle_buffer_factor
-            arrow = manim.Line(
-                start,
-                end,
-                stroke_width=4,
-                buff=buff,
-            )
-            add_tip(arrow)
-            return arrow
-
-        def add_tip(arrow: manim.Line):
-            arrow.add_tip(
-                tip_shape=manim.ArrowTriangleFilledTip,
-                tip_length=0.2,
-                tip_width=0.2,
-                at_start=False,
-            )
-
-        # Add left arrow
-        if node.left is not None:
-            start = node.get_circle().get_center()
-            end = node.left.get_circle().get_center()
-            if node.left_arrow is None:
-                arrow = get_arrow(start, end)
-                node.left_arrow = arrow
-                self.arrows.add(arrow)
-            else:
-                node.left_arrow.put_start_and_end_on(start, end) # type: ignore
-                node.left_arrow.pop_tips()
-                add_tip(node.left_arrow)
-
-        # Add right arrow
-        if node.right is not None:
-            start = node.get_circle().get_center()
-            end = node.right.get_circle().get_center()
-            if node.right_arrow is None:
-                arrow = get_arrow(start, end)
-                node.right_arrow = arrow
-                self.arrows.add(arrow)
+        The mobject of each distinct node is created once, then copied
+        for each of its other occurrences.
+
+        Arguments:
+            root: The root of the DAG.
+
+        Returns:
+            The root of the expanded tree.
+        """
+        templates: Dict[BNode, manim.VMobject] = {}
+
+        def instance(node: Optional[BNode]) -> Optional[BNode]:
+            if node is None:
+                return None
+            copy = BNode(node.label, instance(node.left), instance(node.right))
+            if node in templates:
+                copy.mobject = templates[node].copy()
             else:
-                node.right_arrow.put_start_and_end_on(start, end) # type: ignore
-                node.right_arrow.pop_tips()
-                add_tip(node.right_arrow)
+                copy.mobject = cached_mobject(
+                    self.element_to_mobject, node.label, **self.element_to_mobject_config
+                )
+                templates[node] = copy.mobject
+            return copy
 
-        self._add_arrow_mobject(node.left)
-        self._add_arrow_mobject(node.right)
+        return instance(root)
 
     def _get_circle(self, node: manim.VMobject) -> manim.Circle:
         """
@@ -316,19 +449,3 @@ class BTree(manim.VGroup):
         circle = manim.Circle(**self.circle_config)
         circle.surround(node, buffer_factor=self.circle_buffer_factor)
         return circle
-
-    @staticmethod
-    def _compute_depth(root: BNode) -> int:
-        """
-        Compute the depth of the tree using BFS.
-
-        Arguments:
-            root: The root of the tree.
-
-        Returns:
-            The depth of the tree.
-        """
-        depth = 0
-        for _ in BTree.bfs_layer_by_layer(root):
-            depth += 1
-        return depth
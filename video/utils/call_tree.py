@@ -0,0 +1,253 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Any, Callable, List, Optional, Tuple
+import functools
+
+from utils.compact_tree import CompactTree, NIL
+from utils.dynamic_programming.memo import MemoCache
+
+
+# Flag bits of the calls of a `CallTree`, distinct from the memo event kinds
+FLAG_HIT = 1
+FLAG_TRUNCATED = 2
+
+
+class CallTree:
+    """
+    Tree of the calls of a function, stored as parallel arrays.
+
+    Each call is an index into the `parents`, `first_child`, `next_sibling`,
+    `depths` and `flags` arrays, with its arguments and return value
+    in `args` and `results`. The children of a call are the calls it made,
+    in order. The calls made at the top level are the `roots`.
+
+    A call is flagged `FLAG_HIT` if its value came from the memo cache,
+    and `FLAG_TRUNCATED` if some of its children were not recorded.
+    """
+
+    __slots__ = (
+        "parents",
+        "first_child",
+        "next_sibling",
+        "last_child",
+        "depths",
+        "flags",
+        "args",
+        "results",
+        "roots",
+        "label",
+    )
+
+    def __init__(self, label: Optional[Callable[..., str]] = None):
+        self.parents = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.last_child = array("i")
+        self.depths = array("i")
+        self.flags = array("b")
+        self.args: List[Tuple] = []
+        self.results: List[Any] = []
+        self.roots: List[int] = []
+        self.label = label if label is not None else lambda *args: f"f({', '.join(map(str, args))})"
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def add_call(self, parent: int, depth: int, args: Tuple) -> int:
+        """
+        Add a call, as the last child of its parent.
+
+        Arguments:
+            parent: The index of the calling call, `NIL` for a root.
+            depth: The depth of the call, 0 for a root.
+            args: The arguments of the call.
+
+        Returns:
+            The index of the call.
+        """
+        index = len(self)
+        self.parents.append(parent)
+        self.first_child.append(NIL)
+        self.next_sibling.append(NIL)
+        self.last_child.append(NIL)
+        self.depths.append(depth)
+        self.flags.append(0)
+        self.args.append(args)
+        self.results.append(None)
+
+        if parent == NIL:
+            self.roots.append(index)
+        elif self.last_child[parent] == NIL:
+            self.first_child[parent] = index
+        else:
+            self.next_sibling[self.last_child[parent]] = index
+        if parent != NIL:
+            self.last_child[parent] = index
+        return index
+
+    def children(self, index: int) -> List[int]:
+        """
+        Get the calls made by a call.
+
+        Arguments:
+            index: The index of the call.
+
+        Returns:
+            The indices of the children, in call order.
+        """
+        children = []
+        child = self.first_child[index]
+        while child != NIL:
+            children.append(child)
+            child = self.next_sibling[child]
+        return children
+
+    def to_compact_tree(
+        self,
+        root: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+    ) -> Tuple[CompactTree, array]:
+        """
+        Build a binary `CompactTree` of the top of the call tree, the first call
+        of each node being its left child and the second its right child.
+
+        Arguments:
+            root: The index of the root call, the first root by default.
+            max_nodes: The number of nodes to keep, level by level from the root.
+            max_depth: The depth to keep, from the root.
+
+        Returns:
+            The compact tree, labelled by `label`, and the index of the call
+            of each of its nodes.
+
+        Raises:
+            ValueError: If a kept call made more than two calls.
+        """
+        if root is None:
+            root = self.roots[0]
+
+        # Level order from the root, so the budget keeps whole top levels
+        kept = set()
+        queue = deque([root])
+        while queue and (max_nodes is None or len(kept) < max_nodes):
+            index = queue.popleft()
+            if max_depth is not None and self.depths[index] - self.depths[root] > max_depth:
+                break
+            kept.add(index)
+            queue.extend(self.children(index))
+
+        tree = CompactTree()
+        calls = array("i")
+
+        # Post-order, so children are added before their parent
+        stack = [(root, False)]
+        indices: List[int] = []
+        while stack:
+            index, visited = stack.pop()
+            children = self.children(index)
+            if len(children) > 2:
+                raise ValueError(f"call {self.label(*self.args[index])} made {len(children)} calls, a binary tree holds 2")
+            if visited:
+                child_indices = [indices.pop() if child in kept else NIL for child in reversed(children)]
+                left, right = (list(reversed(child_indices)) + [NIL, NIL])[:2]
+                indices.append(tree.add_node(self.label(*self.args[index]), left, right))
+                calls.append(index)
+            else:
+                stack.append((index, True))
+                stack.extend((child, False) for child in reversed(children) if child in kept)
+
+        return tree, calls
+
+
+class CallTracer:
+    """
+    Decorator recording the calls of recursive functions into a `CallTree`.
+
+    Calls past `max_nodes` recorded calls, or deeper than `max_depth`,
+    still run but are not recorded, and neither are the calls they make,
+    so tracing a large recursion only costs the visible part.
+    With a `cache`, the traced functions are memoized in it and
+    the calls answered by the cache are flagged `FLAG_HIT`.
+
+    For example::
+
+        tracer = CallTracer(max_depth=4)
+
+        @tracer.trace
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        fib(20)
+        tree, calls = tracer.tree.to_compact_tree()
+    """
+
+    def __init__(
+        self,
+        label: Optional[Callable[..., str]] = None,
+        cache: Optional[MemoCache] = None,
+        max_nodes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+    ):
+        self.tree = CallTree(label)
+        self.cache = cache
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.skipped = 0
+        # Index of each running call, `NIL` for unrecorded ones
+        self._running: List[int] = []
+
+    def _enter(self, args: Tuple) -> int:
+        depth = len(self._running)
+        parent = self._running[-1] if self._running else NIL
+        if (
+            (depth == 0 or parent != NIL)
+            and (self.max_depth is None or depth <= self.max_depth)
+            and (self.max_nodes is None or len(self.tree) < self.max_nodes)
+        ):
+            return self.tree.add_call(parent, depth, args)
+
+        self.skipped += 1
+        if parent != NIL:
+            self.tree.flags[parent] |= FLAG_TRUNCATED
+        return NIL
+
+    def trace(self, function: Callable) -> Callable:
+        """
+        Record the calls of a function.
+
+        Arguments:
+            function: The function, its positional arguments are recorded.
+
+        Returns:
+            The traced function.
+        """
+        tree = self.tree
+
+        @functools.wraps(function)
+        def wrapper(*args):
+            index = self._enter(args)
+            computed = False
+
+            def compute(*args):
+                nonlocal computed
+                computed = True
+                return function(*args)
+
+            self._running.append(index)
+            try:
+                if self.cache is None:
+                    result = function(*args)
+                else:
+                    result = self.cache.call(args[0] if len(args) == 1 else args, compute, *args)
+            finally:
+                self._running.pop()
+
+            if index != NIL:
+                tree.results[index] = result
+                if self.cache is not None and not computed:
+                    tree.flags[index] |= FLAG_HIT
+            return result
+
+        return wrapper
@@ -0,0 +1,267 @@
+from __future__ import annotations
+from array import array
+from typing import Optional, Dict, List
+import manim
+
+
+NIL = -1
+
+
+class CompactTree:
+    """
+    Binary tree stored as parallel arrays.
+
+    Each node is an index into the `left`, `right`, `parent` and
+    `label_ids` arrays, with the labels interned in `labels`.
+    The mobjects are only stored for the nodes that are drawn,
+    so a node costs a few ints instead of a whole object.
+
+    Nodes are usually added children first, so the last added node
+    is the root unless `root` is set explicitly.
+    """
+
+    __slots__ = (
+        "left",
+        "right",
+        "parent",
+        "label_ids",
+        "labels",
+        "label_index",
+        "root",
+        "mobjects",
+        "circles",
+        "left_arrows",
+        "right_arrows",
+    )
+
+    def __init__(self):
+        self.left = array("i")
+        self.right = array("i")
+        self.parent = array("i")
+        self.label_ids = array("i")
+        self.labels: List[str] = []
+        self.label_index: Dict[str, int] = {}
+        self.root: int = NIL
+
+        # Lazy mobject slots, filled by the BTree
+        self.mobjects: Dict[int, manim.VMobject] = {}
+        self.circles: Dict[int, manim.Circle] = {}
+        self.left_arrows: Dict[int, manim.Line] = {}
+        self.right_arrows: Dict[int, manim.Line] = {}
+
+    def __len__(self) -> int:
+        return len(self.label_ids)
+
+    def intern(self, label: str) -> int:
+        """
+        Get the id of the label, adding it to the label table if needed.
+
+        Arguments:
+            label: The label.
+
+        Returns:
+            The label id.
+        """
+        label_id = self.label_index.get(label)
+        if label_id is None:
+            label_id = len(self.labels)
+            self.labels.append(label)
+            self.label_index[label] = label_id
+        return label_id
+
+    def add_node(self, label: str, left: int = NIL, right: int = NIL) -> int:
+        """
+        Add a node, which becomes the root of the tree.
+
+        Arguments:
+            label: The label of the node.
+            left: The index of the left child.
+            right: The index of the right child.
+
+        Returns:
+            The index of the node.
+        """
+        index = len(self)
+        self.left.append(left)
+        self.right.append(right)
+        self.parent.append(NIL)
+        self.label_ids.append(self.intern(label))
+        if left != NIL:
+            self.parent[left] = index
+        if right != NIL:
+            self.parent[right] = index
+        self.root = index
+        return index
+
+    def set_left(self, index: int, child: int):
+        """
+        Set the left child of a node.
+
+        Arguments:
+            index: The index of the node.
+            child: The index of the left child.
+        """
+        self.left[index] = child
+        if child != NIL:
+            self.parent[child] = index
+
+    def set_right(self, index: int, child: int):
+        """
+        Set the right child of a node.
+
+        Arguments:
+            index: The index of the node.
+            child: The index of the right child.
+        """
+        self.right[index] = child
+        if child != NIL:
+            self.parent[child] = index
+
+    def label(self, index: int) -> str:
+        """
+        Get the label of a node.
+
+        Arguments:
+            index: The index of the node.
+
+        Returns:
+            The label.
+        """
+        return self.labels[self.label_ids[index]]
+
+    def node(self, index: int) -> Optional[CompactNode]:
+        """
+        Get a node view of the node at the index.
+
+        Arguments:
+            index: The index of the node.
+
+        Returns:
+            The node view, or None if the index is NIL.
+        """
+        if index == NIL:
+            return None
+        return CompactNode(self, index)
+
+    @staticmethod
+    def from_bnode(root) -> CompactTree:
+        """
+        Build a compact tree from a linked tree of `BNode`s.
+
+        Arguments:
+            root: The root of the linked tree.
+
+        Returns:
+            The compact tree.
+        """
+        tree = CompactTree()
+
+        # Post-order, so children are added before their parent
+        stack = [(root, False)]
+        indices = []
+        while stack:
+            node, visited = stack.pop()
+            if node is None:
+                indices.append(NIL)
+            elif visited:
+                right = indices.pop()
+                left = indices.pop()
+                indices.append(tree.add_node(node.label, left, right))
+            else:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+
+        return tree
+
+
+class CompactNode:
+    """
+    View of a node of a `CompactTree`, with the same interface as `BNode`.
+
+    Views are created on access, so compare them with `==`, not `is`.
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree: CompactTree, index: int):
+        self.tree = tree
+        self.index = index
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, CompactNode)
+            and self.tree is other.tree
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.tree), self.index))
+
+    @property
+    def label(self) -> str:
+        return self.tree.label(self.index)
+
+    @property
+    def left(self) -> Optional[CompactNode]:
+        return self.tree.node(self.tree.left[self.index])
+
+    @property
+    def right(self) -> Optional[CompactNode]:
+        return self.tree.node(self.tree.right[self.index])
+
+    @property
+    def parent(self) -> Optional[CompactNode]:
+        return self.tree.node(self.tree.parent[self.index])
+
+    @property
+    def mobject(self) -> Optional[manim.VMobject]:
+        return self.tree.mobjects.get(self.index)
+
+    @mobject.setter
+    def mobject(self, mobject: manim.VMobject):
+        self.tree.mobjects[self.index] = mobject
+
+    @property
+    def circle(self) -> Optional[manim.Circle]:
+        return self.tree.circles.get(self.index)
+
+    @circle.setter
+    def circle(self, circle: manim.Circle):
+        self.tree.circles[self.index] = circle
+
+    @property
+    def left_arrow(self) -> Optional[manim.Line]:
+        return self.tree.left_arrows.get(self.index)
+
+    @left_arrow.setter
+    def left_arrow(self, arrow: manim.Line):
+        self.tree.left_arrows[self.index] = arrow
+
+    @property
+    def right_arrow(self) -> Optional[manim.Line]:
+        return self.tree.right_arrows.get(self.index)
+
+    @right_arrow.setter
+    def right_arrow(self, arrow: manim.Line):
+        self.tree.right_arrows[self.index] = arrow
+
+    def get_mobject(self) -> manim.VMobject:
+        if self.mobject is None:
+            raise ValueError("mobject is None")
+        return self.mobject
+
+    def get_circle(self) -> manim.Circle:
+        if self.circle is None:
+            raise ValueError("circle is None")
+        return self.circle
+
+    def get_left_arrow(self) -> manim.Line:
+        if self.left_arrow is None:
+            raise ValueError("left_arrow is None")
+        return self.left_arrow
+
+    def get_right_arrow(self) -> manim.Line:
+        if self.right_arrow is None:
+            raise ValueError("right_arrow is None")
+        return self.right_arrow
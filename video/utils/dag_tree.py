@@ -0,0 +1,73 @@
+from __future__ import annotations
+from typing import Optional, Dict, Tuple
+
+# Module import, as btree imports this module back
+from utils import btree
+
+
+class DagTree:
+    """
+    Binary tree where structurally identical subtrees are built once and shared.
+
+    Nodes are hash-consed on their label and children, so building
+    a recursion tree costs one node per distinct subproblem.
+    Pass it to `BTree` to either draw the expanded tree or the collapsed DAG.
+
+    Nodes are usually added children first, so the last added node
+    is the root unless `root` is set explicitly.
+    """
+
+    def __init__(self):
+        self.table: Dict[Tuple[str, int, int], btree.BNode] = {}
+        self.root: Optional[btree.BNode] = None
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def node(
+        self,
+        label: str,
+        left: Optional[btree.BNode] = None,
+        right: Optional[btree.BNode] = None,
+    ) -> btree.BNode:
+        """
+        Get the node with the label and children, building it if needed.
+        The node becomes the root of the tree.
+
+        Arguments:
+            label: The label of the node.
+            left: The left child, a node of this tree.
+            right: The right child, a node of this tree.
+
+        Returns:
+            The shared node.
+        """
+        # Children are shared themselves, so identity is structure
+        key = (label, id(left), id(right))
+        node = self.table.get(key)
+        if node is None:
+            node = btree.BNode(label, left, right)
+            self.table[key] = node
+        self.root = node
+        return node
+
+    def expanded_size(self, root: Optional[btree.BNode] = None) -> int:
+        """
+        Count the nodes of the expanded tree without expanding it.
+
+        Arguments:
+            root: The root of the subtree to count, the tree root by default.
+
+        Returns:
+            The number of nodes.
+        """
+        sizes: Dict[btree.BNode, int] = {}
+
+        def size(node: Optional[btree.BNode]) -> int:
+            if node is None:
+                return 0
+            if node not in sizes:
+                sizes[node] = 1 + size(node.left) + size(node.right)
+            return sizes[node]
+
+        return size(root if root is not None else self.root)
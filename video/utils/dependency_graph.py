@@ -0,0 +1,331 @@
+from __future__ import annotations
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+import numpy as np
+import manim
+
+
+class DependencyGraph(manim.VGroup):
+    """
+    Batched set of straight edges between DP cells, replacing one
+    `manim.Line` per edge.
+
+    The endpoints of all the edges are kept in one array, with a color,
+    a visibility flag and a drawn fraction per edge. The edges are drawn
+    by one `manim.VMobject` per color, each a single path holding all the
+    visible edges of its color, so the object count does not depend on
+    the number of edges.
+
+    Edges are identified by a key of the caller's choice, like the DP cell
+    they lead to. Their endpoints are in scene coordinates: add the edges
+    once the table is in place, the graph is not meant to be moved.
+    """
+
+    def __init__(
+        self,
+        buff: float = 0,
+        color: str = manim.GREY,
+        stroke_width: float = manim.DEFAULT_STROKE_WIDTH,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.buff = buff
+        self.default_color = color
+        self.default_stroke_width = stroke_width
+
+        self.keys: Dict[Hashable, int] = {}
+        self.endpoints = np.zeros((0, 2, 3))
+        self.layer_ids = np.zeros(0, dtype=np.int32)
+        self.visible = np.zeros(0, dtype=bool)
+        self.progress = np.zeros(0)
+        self.size = 0
+
+        self.layers: List[manim.VMobject] = []
+        self._color_layers: Dict[str, int] = {}
+        self._free_layers: List[int] = []
+
+    def _reserve(self, count: int):
+        """
+        Grow the edge arrays to hold `count` more edges.
+        """
+        capacity = len(self.visible)
+        if self.size + count <= capacity:
+            return
+        capacity = max(self.size + count, 2 * capacity, 16)
+        grow = capacity - len(self.visible)
+        self.endpoints = np.concatenate([self.endpoints, np.zeros((grow, 2, 3))])
+        self.layer_ids = np.concatenate([self.layer_ids, np.zeros(grow, dtype=np.int32)])
+        self.visible = np.concatenate([self.visible, np.zeros(grow, dtype=bool)])
+        self.progress = np.concatenate([self.progress, np.zeros(grow)])
+
+    def _new_layer(self, color: str) -> int:
+        """
+        Get an empty layer of the given color, reusing a released one if any.
+        """
+        if self._free_layers:
+            layer_id = self._free_layers.pop()
+            self.layers[layer_id].set_stroke(color=color)
+            return layer_id
+        layer = manim.VMobject(
+            stroke_color=color,
+            stroke_width=self.default_stroke_width,
+            fill_opacity=0,
+        )
+        self.layers.append(layer)
+        self.add(layer)
+        return len(self.layers) - 1
+
+    def _layer_for(self, color: str) -> int:
+        """
+        Get the layer drawing the edges of a color.
+        """
+        hex_color = manim.rgb_to_hex(manim.color_to_rgb(color))
+        if hex_color not in self._color_layers:
+            self._color_layers[hex_color] = self._new_layer(color)
+        return self._color_layers[hex_color]
+
+    def _release_layer(self, layer_id: int):
+        """
+        Give back a temporary layer, which must not hold edges anymore.
+        """
+        self.layers[layer_id].set_points(np.zeros((0, 3)))
+        self._free_layers.append(layer_id)
+
+    def indices(self, keys: Iterable[Hashable]) -> np.ndarray:
+        """
+        Get the indices of edges from their keys.
+
+        Arguments:
+            keys: The keys of the edges.
+
+        Returns:
+            The indices of the edges, in the edge arrays.
+        """
+        return np.fromiter((self.keys[key] for key in keys), dtype=np.intp)
+
+    def add_edges(
+        self,
+        keys: Sequence[Hashable],
+        starts: np.ndarray,
+        ends: np.ndarray,
+        color: Optional[str] = None,
+        visible: bool = False,
+    ) -> np.ndarray:
+        """
+        Add edges, hidden by default so they can be animated in with `create`.
+        Adding an existing key moves that edge instead.
+
+        Arguments:
+            keys: The keys of the edges.
+            starts: The start points of the edges, of shape `(n, 3)`.
+            ends: The end points of the edges, of shape `(n, 3)`.
+            color: The color of the edges, the graph's color by default.
+            visible: Whether the edges are shown right away.
+
+        Returns:
+            The indices of the edges.
+        """
+        starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        self._reserve(len(keys))
+        indices = np.empty(len(keys), dtype=np.intp)
+        for n, key in enumerate(keys):
+            if key not in self.keys:
+                self.keys[key] = self.size
+                self.size += 1
+            indices[n] = self.keys[key]
+
+        # Shorten both ends by the buffer, like `manim.Line`
+        vectors = ends - starts
+        lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+        offsets = vectors * np.minimum(self.buff / np.maximum(lengths, 1e-12), 0.5)
+        self.endpoints[indices, 0] = starts + offsets
+        self.endpoints[indices, 1] = ends - offsets
+
+        # Only the layers showing a changed edge need a new path
+        changed = set(self.layer_ids[indices][self.visible[indices]].tolist())
+        new_layer = self._layer_for(self.default_color if color is None else color)
+        if visible:
+            changed.add(new_layer)
+        self.layer_ids[indices] = new_layer
+        self.visible[indices] = visible
+        self.progress[indices] = 1
+        self.refresh(changed)
+        return indices
+
+    def add_edge(
+        self,
+        key: Hashable,
+        start: np.ndarray,
+        end: np.ndarray,
+        color: Optional[str] = None,
+        visible: bool = False,
+    ) -> int:
+        """
+        Add an edge, see `add_edges`.
+
+        Returns:
+            The index of the edge.
+        """
+        return int(self.add_edges([key], start, end, color, visible)[0])
+
+    def refresh(self, layer_ids: Optional[Iterable[int]] = None):
+        """
+        Rebuild the paths of layers from the edge arrays.
+
+        Arguments:
+            layer_ids: The layers to rebuild, all by default.
+        """
+        if layer_ids is None:
+            layer_ids = range(len(self.layers))
+        size = self.size
+        # Anchors and handles at thirds, so every edge is its own subpath
+        t = np.linspace(0, 1, 4)[np.newaxis, :, np.newaxis]
+        for layer_id in layer_ids:
+            mask = self.visible[:size] & (self.layer_ids[:size] == layer_id)
+            starts = self.endpoints[:size, 0][mask]
+            vectors = (self.endpoints[:size, 1][mask] - starts) * self.progress[:size, np.newaxis][mask]
+            points = starts[:, np.newaxis] + t * vectors[:, np.newaxis]
+            self.layers[layer_id].set_points(points.reshape(-1, 3))
+
+    def show(self, keys: Iterable[Hashable]):
+        """
+        Show edges at once.
+
+        Arguments:
+            keys: The keys of the edges.
+        """
+        indices = self.indices(keys)
+        self.visible[indices] = True
+        self.progress[indices] = 1
+        self.refresh(set(self.layer_ids[indices].tolist()))
+
+    def hide(self, keys: Iterable[Hashable]):
+        """
+        Hide edges at once.
+
+        Arguments:
+            keys: The keys of the edges.
+        """
+        indices = self.indices(keys)
+        self.visible[indices] = False
+        self.refresh(set(self.layer_ids[indices].tolist()))
+
+    def set_edge_color(self, keys: Iterable[Hashable], color: str):
+        """
+        Recolor edges at once.
+
+        Arguments:
+            keys: The keys of the edges.
+            color: The new color.
+        """
+        indices = self.indices(keys)
+        old_layers = set(self.layer_ids[indices].tolist())
+        new_layer = self._layer_for(color)
+        self.layer_ids[indices] = new_layer
+        self.refresh(old_layers | {new_layer})
+
+    def create(self, keys: Iterable[Hashable], **kwargs) -> manim.Animation:
+        """
+        Animate edges being drawn from their start, all at the same pace.
+
+        Arguments:
+            keys: The keys of the edges.
+            kwargs: The arguments of the animation.
+
+        Returns:
+            The animation.
+        """
+        return CreateEdges(self, self.indices(keys), **kwargs)
+
+    def fade_to_color(
+        self, keys: Iterable[Hashable], color: str, **kwargs
+    ) -> manim.Animation:
+        """
+        Animate the color of edges, like `manim.FadeToColor` on each of them.
+
+        Arguments:
+            keys: The keys of the edges.
+            color: The new color.
+            kwargs: The arguments of the animation.
+
+        Returns:
+            The animation.
+        """
+        return FadeEdgesToColor(self, self.indices(keys), color, **kwargs)
+
+
+class CreateEdges(manim.Animation):
+    """
+    Draw edges of a `DependencyGraph` by growing them from their start.
+    """
+
+    def __init__(self, graph: DependencyGraph, indices: np.ndarray, **kwargs):
+        self.indices = indices
+        super().__init__(graph, **kwargs)
+
+    def begin(self):
+        graph = self.mobject
+        graph.visible[self.indices] = True
+        self.layer_ids = set(graph.layer_ids[self.indices].tolist())
+        super().begin()
+
+    def create_starting_mobject(self) -> manim.Mobject:
+        # The graph is animated in place, no copy of all its edges needed
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float):
+        graph = self.mobject
+        graph.progress[self.indices] = self.rate_func(alpha)
+        graph.refresh(self.layer_ids)
+
+
+class FadeEdgesToColor(manim.Animation):
+    """
+    Change the color of edges of a `DependencyGraph`.
+
+    During the animation, the edges of each old color are moved to a
+    temporary layer whose color is interpolated, and they join the layer
+    of the new color at the end.
+    """
+
+    def __init__(
+        self,
+        graph: DependencyGraph,
+        indices: np.ndarray,
+        color: str,
+        **kwargs,
+    ):
+        self.indices = indices
+        self.color = color
+        super().__init__(graph, **kwargs)
+
+    def begin(self):
+        graph = self.mobject
+        old_ids = graph.layer_ids[self.indices]
+        self.fades = []
+        for old_id in np.unique(old_ids).tolist():
+            old_color = graph.layers[old_id].get_stroke_color()
+            temp_id = graph._new_layer(old_color)
+            graph.layer_ids[self.indices[old_ids == old_id]] = temp_id
+            self.fades.append((temp_id, old_color))
+            graph.refresh([old_id, temp_id])
+        super().begin()
+
+    def create_starting_mobject(self) -> manim.Mobject:
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float):
+        graph = self.mobject
+        for temp_id, old_color in self.fades:
+            graph.layers[temp_id].set_stroke(
+                color=manim.interpolate_color(old_color, self.color, self.rate_func(alpha))
+            )
+
+    def finish(self):
+        super().finish()
+        graph = self.mobject
+        new_id = graph._layer_for(self.color)
+        graph.layer_ids[self.indices] = new_id
+        graph.refresh([new_id])
+        for temp_id, _ in self.fades:
+            graph._release_layer(temp_id)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, Tuple
+import numpy as np
+import manim
+
+from utils.tex_cache import math_tex
+
+
+class DPGrid(manim.VGroup):
+    """
+    Lightweight grid of DP values, for tables too large for `manim.MathTable`.
+
+    All the grid lines are one merged path, and the cell geometry is
+    computed with NumPy from the current corner and scale of that path,
+    so moving or scaling the grid costs nothing per cell. The values are
+    kept in an array, and the glyph of a cell is only built when the cell
+    is revealed, from one template per distinct value.
+
+    Positions are 1-indexed `(row, col)`, like `manim.Table.get_entries`.
+    The grid can be moved and scaled, but not rotated.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        cell_width: float = 0.6,
+        cell_height: float = 0.6,
+        element_to_mobject: Callable[..., manim.VMobject] = math_tex,
+        element_to_mobject_config: Dict[str, Any] = {},
+        line_config: Dict[str, Any] = {},
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rows = rows
+        self.cols = cols
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.element_to_mobject = element_to_mobject
+        self.element_to_mobject_config = element_to_mobject_config
+
+        self.values = np.full((rows, cols), None, dtype=object)
+        self._entries: Dict[Tuple[int, int], manim.VMobject] = {}
+        self._templates: Dict[str, manim.VMobject] = {}
+
+        self.lines = manim.VMobject(**{"stroke_width": 2, "stroke_color": manim.WHITE, **line_config})
+        self.lines.set_points(self._line_points())
+        self.entries = manim.VGroup()
+        self.add(self.lines, self.entries)
+        self.center()
+
+    def _line_points(self) -> np.ndarray:
+        """
+        Get the points of all the grid lines as one path of straight cubic curves,
+        the top left corner at the origin.
+        """
+        width, height = self.cols * self.cell_width, self.rows * self.cell_height
+        ys = -np.arange(self.rows + 1) * self.cell_height
+        xs = np.arange(self.cols + 1) * self.cell_width
+
+        starts = np.zeros((self.rows + self.cols + 2, 3))
+        ends = np.zeros((self.rows + self.cols + 2, 3))
+        starts[: self.rows + 1, 1] = ends[: self.rows + 1, 1] = ys
+        ends[: self.rows + 1, 0] = width
+        starts[self.rows + 1 :, 0] = ends[self.rows + 1 :, 0] = xs
+        ends[self.rows + 1 :, 1] = -height
+
+        # Anchors and handles at thirds, so every segment is its own subpath
+        t = np.linspace(0, 1, 4)[np.newaxis, :, np.newaxis]
+        return (starts[:, np.newaxis] + t * (ends - starts)[:, np.newaxis]).reshape(-1, 3)
+
+    @property
+    def cell_scale(self) -> float:
+        """
+        The current scale of the grid, relative to its cell size.
+        """
+        return self.lines.width / (self.cols * self.cell_width)
+
+    def cell_centers(self) -> np.ndarray:
+        """
+        Get the centers of all the cells.
+
+        Returns:
+            The centers, array of shape (rows, cols, 3), `[i - 1, j - 1]` for the position `(i, j)`.
+        """
+        corner = self.lines.get_corner(manim.UL)
+        scale = self.cell_scale
+        centers = np.zeros((self.rows, self.cols, 3))
+        centers[..., 0] = corner[0] + (np.arange(self.cols) + 0.5)[np.newaxis, :] * self.cell_width * scale
+        centers[..., 1] = corner[1] - (np.arange(self.rows) + 0.5)[:, np.newaxis] * self.cell_height * scale
+        centers[..., 2] = corner[2]
+        return centers
+
+    def get_cell_center(self, pos: Tuple[int, int]) -> np.ndarray:
+        """
+        Get the center of a cell.
+
+        Arguments:
+            pos: The position of the cell.
+
+        Returns:
+            The center, array of shape (3,).
+        """
+        scale = self.cell_scale
+        return self.lines.get_corner(manim.UL) + np.array(
+            [(pos[1] - 0.5) * self.cell_width * scale, -(pos[0] - 0.5) * self.cell_height * scale, 0]
+        )
+
+    def get_cell(self, pos: Tuple[int, int], **kwargs) -> manim.Rectangle:
+        """
+        Build a rectangle over a cell, e.g. to highlight it.
+
+        Arguments:
+            pos: The position of the cell.
+            kwargs: The keyword arguments of `manim.Rectangle`.
+
+        Returns:
+            The rectangle, not part of the grid.
+        """
+        scale = self.cell_scale
+        rectangle = manim.Rectangle(width=self.cell_width * scale, height=self.cell_height * scale, **kwargs)
+        return rectangle.move_to(self.get_cell_center(pos))
+
+    def set_values(self, values: np.ndarray, origin: Tuple[int, int] = (1, 1)):
+        """
+        Set the values of a block of cells, without building any glyph.
+        The glyphs already revealed in the block are dropped.
+
+        Arguments:
+            values: The values, None for empty cells, array of 2 dimensions.
+            origin: The position of `values[0, 0]`.
+        """
+        values = np.asarray(values, dtype=object)
+        r0, c0 = origin[0] - 1, origin[1] - 1
+        self.values[r0 : r0 + values.shape[0], c0 : c0 + values.shape[1]] = values
+        self.drop(range(origin[0], origin[0] + values.shape[0]), range(origin[1], origin[1] + values.shape[1]))
+
+    def set_value(self, pos: Tuple[int, int], value: Any):
+        """
+        Set the value of a cell, dropping its glyph if it was revealed.
+
+        Arguments:
+            pos: The position of the cell.
+            value: The value, None for an empty cell.
+        """
+        self.values[pos[0] - 1, pos[1] - 1] = value
+        self.drop(range(pos[0], pos[0] + 1), range(pos[1], pos[1] + 1))
+
+    def _template(self, text: str) -> manim.VMobject:
+        template = self._templates.get(text)
+        if template is None:
+            template = self.element_to_mobject(text, **self.element_to_mobject_config)
+            if template.width > self.cell_width * 0.9:
+                template.scale_to_fit_width(self.cell_width * 0.9)
+            if template.height > self.cell_height * 0.9:
+                template.scale_to_fit_height(self.cell_height * 0.9)
+            self._templates[text] = template
+        return template
+
+    def get_entries(self, pos: Tuple[int, int]) -> manim.VMobject:
+        """
+        Get the glyph of a cell, building it if it was not revealed yet.
+        A new glyph is part of the grid, so it shows on the next frame
+        unless it is animated in.
+
+        Arguments:
+            pos: The position of the cell.
+
+        Returns:
+            The glyph.
+
+        Raises:
+            ValueError: If the cell has no value.
+        """
+        pos = (int(pos[0]), int(pos[1]))
+        entry = self._entries.get(pos)
+        if entry is None:
+            value = self.values[pos[0] - 1, pos[1] - 1]
+            if value is None:
+                raise ValueError(f"cell {pos} has no value")
+            entry = self._template(str(value)).copy()
+            entry.scale(self.cell_scale)
+            entry.move_to(self.get_cell_center(pos))
+            self._entries[pos] = entry
+            self.entries.add(entry)
+        return entry
+
+    def reveal(self, rows: Iterable[int], cols: Iterable[int]) -> manim.VGroup:
+        """
+        Build the glyphs of the cells with a value in a window.
+
+        Arguments:
+            rows: The rows of the window, e.g. `range(1, 11)`.
+            cols: The columns of the window.
+
+        Returns:
+            The glyphs, e.g. to animate them in.
+        """
+        rows, cols = list(rows), list(cols)
+        values = self.values[np.ix_(np.array(rows) - 1, np.array(cols) - 1)]
+        return manim.VGroup(
+            *(
+                self.get_entries((i, j))
+                for i, row in zip(rows, values)
+                for j, value in zip(cols, row)
+                if value is not None
+            )
+        )
+
+    def drop(self, rows: Iterable[int], cols: Iterable[int]):
+        """
+        Remove the glyphs of a window, e.g. once it scrolled out of view.
+        They are built again when revealed.
+
+        Arguments:
+            rows: The rows of the window.
+            cols: The columns of the window.
+        """
+        rows, cols = set(rows), set(cols)
+        dropped = [pos for pos in self._entries if pos[0] in rows and pos[1] in cols]
+        if dropped:
+            self.entries.remove(*(self._entries.pop(pos) for pos in dropped))
@@ -0,0 +1,9 @@
+from .solution import DPSolution, NONE
+from .fibonacci import fibonacci, linear_recurrence, matrix_power
+from .stairs import count_stairs, min_cost_stairs_rows, solve_stairs, solve_min_cost_stairs, stairs_counts
+from .unique_paths import count_unique_paths, solve_min_path_sum, solve_unique_paths, unique_paths_rows
+from .edit_distance import edit_distance, solve_edit_distance
+from .alignment import Alignment, align
+from .memo import ArrayCache, DictCache, LRUCache, MemoCache, MemoLog, memoize
+from .knapsack import RollingKnapsack, knapsack_rows, solve_knapsack
+from .trace import Trace, TraceBlock, TraceStep, solution_blocks, solution_trace, write_trace
@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import List, Tuple
+import numpy as np
+
+from .edit_distance import MATCH, INSERT, REPLACE, DELETE, last_row, solve_edit_distance
+
+
+# Sub-problems with at most this many cells are solved with a full table
+BLOCK_CELLS = 4096
+
+
+class Alignment:
+    """
+    Optimal alignment of two words.
+
+    Attributes:
+        distance: The edit distance.
+        path: The cells of the path through the edit distance table,
+            from `(0, 0)` to `(len(x), len(y))`, array of shape (k, 2).
+        script: The move into each cell of the path after the first,
+            `MATCH`, `INSERT`, `REPLACE` or `DELETE`, array of shape (k - 1,).
+    """
+
+    def __init__(self, x: str, y: str, path: np.ndarray):
+        self.x = x
+        self.y = y
+        self.path = path
+
+        steps = np.diff(path, axis=0)
+        diagonal = (steps[:, 0] == 1) & (steps[:, 1] == 1)
+        sources = path[1:, 0] - 1
+        targets = path[1:, 1] - 1
+        xs = np.frombuffer(x.encode("utf-32-le"), dtype=np.uint32)
+        ys = np.frombuffer(y.encode("utf-32-le"), dtype=np.uint32)
+        same = np.zeros(len(steps), dtype=bool)
+        same[diagonal] = xs[sources[diagonal]] == ys[targets[diagonal]]
+
+        self.script = np.select(
+            [diagonal & same, diagonal, steps[:, 0] == 0],
+            [MATCH, REPLACE, INSERT],
+            DELETE,
+        ).astype(np.int8)
+        self.distance = int(np.count_nonzero(self.script != MATCH))
+
+    def edits(self) -> List[Tuple[int, str, str]]:
+        """
+        Get the edit script with the characters of each move.
+
+        Returns:
+            The moves with their source and target characters,
+            the empty string for the missing side of insertions and deletions.
+        """
+        edits = []
+        for (i, j), move in zip(self.path[1:].tolist(), self.script.tolist()):
+            source = self.x[i - 1] if move != INSERT else ""
+            target = self.y[j - 1] if move != DELETE else ""
+            edits.append((move, source, target))
+        return edits
+
+
+def align(x: str, y: str) -> Alignment:
+    """
+    Find an optimal alignment of two words in linear space,
+    with the divide and conquer algorithm of Hirschberg.
+
+    The middle row of `x` is aligned by adding the last row of the forward
+    table of its top half to the last row of the backward table of its bottom
+    half, and the best column splits `y`. Both rows take O(len(y)) memory,
+    and the halves are aligned in turn, for O(len(x) * len(y)) time overall.
+    Small sub-problems are solved with a full table.
+
+    Arguments:
+        x: The source word, along the rows.
+        y: The target word, along the columns.
+
+    Returns:
+        The alignment.
+    """
+    cells: List[Tuple[int, int]] = [(0, 0)]
+    _align(x, y, 0, 0, cells)
+    return Alignment(x, y, np.array(cells, dtype=np.intp).reshape(-1, 2))
+
+
+def _align(x: str, y: str, row: int, col: int, cells: List[Tuple[int, int]]):
+    """
+    Append the path of the alignment of `x` and `y` to `cells`,
+    offset by `(row, col)`, without its first cell.
+    """
+    m, n = len(x), len(y)
+    if m == 0:
+        cells.extend((row, col + j) for j in range(1, n + 1))
+        return
+    if n == 0:
+        cells.extend((row + i, col) for i in range(1, m + 1))
+        return
+    if (m + 1) * (n + 1) <= BLOCK_CELLS or m == 1:
+        path = solve_edit_distance(x, y).traceback()
+        cells.extend((row + i, col + j) for i, j in path[1:])
+        return
+
+    mid = m // 2
+    forward = last_row(x[:mid], y)
+    backward = last_row(x[mid:][::-1], y[::-1])[::-1]
+    split = int(np.argmin(forward + backward))
+
+    _align(x[:mid], y[:split], row, col, cells)
+    _align(x[mid:], y[split:], row + mid, col + split, cells)
@@ -0,0 +1,286 @@
+from __future__ import annotations
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+from .solution import DPSolution, NONE
+
+
+# Moves, from the top left `(i - 1, j - 1)`, the top `(i - 1, j)` or the left `(i, j - 1)`
+MATCH = 1
+INSERT = 2
+REPLACE = 3
+DELETE = 4
+
+OFFSETS = np.array(
+    [
+        [0, 0],  # NONE
+        [1, 1],  # MATCH
+        [0, 1],  # INSERT
+        [1, 1],  # REPLACE
+        [1, 0],  # DELETE
+    ],
+    dtype=np.intp,
+)
+
+
+def _codes(word: str) -> np.ndarray:
+    """
+    Get the code points of a word, to compare characters with NumPy.
+    """
+    return np.frombuffer(word.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _next_row(top: np.ndarray, i: int, xi: int, ys: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """
+    Compute a row of the table from the row above it.
+
+    The dependency on the left cell is a running minimum of `c[k] + (j - k)`,
+    where `c` is the best of the top and top left moves,
+    which is `np.minimum.accumulate(c - k) + j`.
+
+    Arguments:
+        top: The row above, `D[i - 1]`.
+        i: The index of the row.
+        xi: The code point of `x[i - 1]`.
+        ys: The code points of `y`.
+        columns: `np.arange(len(y) + 1)`.
+
+    Returns:
+        The row `D[i]`.
+    """
+    c = np.empty(len(top), dtype=np.int64)
+    c[0] = i
+    c[1:] = np.minimum(top[1:] + 1, top[:-1] + (xi != ys))
+    return np.minimum.accumulate(c - columns) + columns
+
+
+def last_row(x: str, y: str) -> np.ndarray:
+    """
+    Compute the last row of the table in linear space.
+
+    Arguments:
+        x: The source word, along the rows.
+        y: The target word, along the columns.
+
+    Returns:
+        The row `D[len(x)]`, the distances from `x` to every prefix of `y`.
+    """
+    xs, ys = _codes(x), _codes(y)
+    columns = np.arange(len(y) + 1)
+    row = columns.astype(np.int64)
+    for i, xi in enumerate(xs, start=1):
+        row = _next_row(row, i, xi, ys, columns)
+    return row
+
+
+def _moves(table: np.ndarray, match: np.ndarray) -> np.ndarray:
+    """
+    Get the winning move of every cell not in the first row or column of a table.
+
+    Arguments:
+        table: The values, array of shape (h + 1, w + 1).
+        match: Whether the characters of each cell match, array of shape (h, w).
+
+    Returns:
+        The moves, array of shape (h, w).
+    """
+    left, top_left, top = table[1:, :-1], table[:-1, :-1], table[:-1, 1:]
+    return np.select(
+        [
+            match,
+            (left <= top_left) & (left <= top),
+            top_left <= top,
+        ],
+        [MATCH, INSERT, REPLACE],
+        DELETE,
+    ).astype(np.int8)
+
+
+def _solution(table: np.ndarray, provenance: np.ndarray, origin: Tuple[int, int]) -> DPSolution:
+    """
+    Wrap a table in a solution, deriving the parents from the provenance.
+    """
+    cells = np.indices(table.shape).transpose(1, 2, 0) + np.array(origin, dtype=np.intp)
+    parents = cells - OFFSETS[provenance]
+    parents[provenance == NONE] = -1
+    return DPSolution(table, provenance, parents, origin)
+
+
+def _peq(word: str) -> Dict[str, int]:
+    """
+    Get the match bit vector of every character of a word,
+    bit `i` being set where `word[i]` is the character.
+    """
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(word):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def _bit_parallel_columns(x: str, y: str, stop: int):
+    """
+    Run the bit-parallel algorithm of Myers, in the formulation of Hyyrö,
+    one column of the table at a time.
+
+    Bit `i` of `pv` (`mv`) is set when `D[i + 1][j] - D[i][j]` is +1 (-1),
+    so a column is encoded in two integers of `len(x)` bits, and each step
+    is a few integer operations on them, O(len(x) / 64) machine words.
+
+    Arguments:
+        x: The word along the rows, encoded in the bits.
+        y: The word along the columns.
+        stop: The number of columns to compute.
+
+    Returns:
+        A generator of `(j, pv, mv, score)`, `score` being `D[len(x)][j]`,
+        starting from column 0.
+    """
+    m = len(x)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1) if m else 0
+    peq = _peq(x)
+    pv, mv, score = mask, 0, m
+
+    yield 0, pv, mv, score
+    for j in range(1, stop):
+        eq = peq.get(y[j - 1], 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # The first row grows by one per column
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        yield j, pv, mv, score
+
+
+def _decode_column(pv: int, mv: int, j: int, start: int, stop: int) -> np.ndarray:
+    """
+    Get the values `D[start:stop][j]` of a column encoded by `pv` and `mv`.
+    """
+    count = max(stop - 1, 0)
+    nbytes = (count + 7) // 8
+    bits = (1 << count) - 1
+
+    def unpack(vector: int) -> np.ndarray:
+        data = np.frombuffer((vector & bits).to_bytes(nbytes, "little"), dtype=np.uint8)
+        return np.unpackbits(data, count=count, bitorder="little").astype(np.int64)
+
+    values = np.empty(count + 1, dtype=np.int64)
+    values[0] = j
+    np.cumsum(unpack(pv) - unpack(mv), out=values[1:])
+    values[1:] += j
+    return values[start:stop]
+
+
+def edit_distance(x: str, y: str) -> int:
+    """
+    Find the minimum number of insertions, deletions and replacements
+    to turn `x` into `y`, with the bit-parallel algorithm of Myers and Hyyrö.
+
+    It takes O(len(x) * len(y) / 64) time and O(len(x) + len(y)) memory,
+    and builds no table.
+
+    Arguments:
+        x: The source word.
+        y: The target word.
+
+    Returns:
+        The distance.
+    """
+    # The distance is symmetric, and iterating over the shorter word takes fewer steps
+    if len(x) < len(y):
+        x, y = y, x
+    score = len(x)
+    for _, _, _, score in _bit_parallel_columns(x, y, len(y) + 1):
+        pass
+    return score
+
+
+def solve_edit_distance(
+    x: str,
+    y: str,
+    window: Optional[Tuple[slice, slice]] = None,
+) -> DPSolution:
+    """
+    Find the minimum number of insertions, deletions and replacements
+    to turn `x` into `y`.
+
+    Without a window, the whole table is filled one row at a time with NumPy.
+
+    With a window, only the cells of the window are computed, decoded from
+    the columns of the bit-parallel algorithm, so a window on words of
+    thousands of characters costs little more than `edit_distance`.
+
+    Arguments:
+        x: The source word, along the rows.
+        y: The target word, along the columns.
+        window: The rows and columns of the table to compute, e.g.
+            `(slice(100, 110), slice(200, 215))`, all of it by default.
+
+    Returns:
+        The solution, with `table[i, j]` the distance from `x[:i]` to `y[:j]`,
+        offset by `origin` for a window. Matches always take the top left move,
+        other ties go to `INSERT`, then `REPLACE`, then `DELETE`.
+    """
+    if window is not None:
+        return _solve_window(x, y, *window)
+
+    m, n = len(x), len(y)
+    xs, ys = _codes(x), _codes(y)
+    columns = np.arange(n + 1)
+
+    table = np.zeros((m + 1, n + 1), dtype=np.int64)
+    table[0] = columns
+    table[:, 0] = np.arange(m + 1)
+    for i in range(1, m + 1):
+        table[i] = _next_row(table[i - 1], i, xs[i - 1], ys, columns)
+
+    provenance = np.zeros((m + 1, n + 1), dtype=np.int8)
+    provenance[0, 1:] = INSERT
+    provenance[1:, 0] = DELETE
+    provenance[1:, 1:] = _moves(table, xs[:, np.newaxis] == ys[np.newaxis, :])
+    return _solution(table, provenance, (0, 0))
+
+
+def _solve_window(x: str, y: str, rows: slice, cols: slice) -> DPSolution:
+    """
+    Compute a window of the edit distance table with the bit-parallel algorithm.
+
+    Arguments:
+        x: The source word, along the rows.
+        y: The target word, along the columns.
+        rows: The rows of the window.
+        cols: The columns of the window.
+
+    Returns:
+        The solution of the window.
+    """
+    r0, r1, _ = rows.indices(len(x) + 1)
+    c0, c1, _ = cols.indices(len(y) + 1)
+    if r0 >= r1 or c0 >= c1:
+        raise ValueError("empty window")
+
+    # One more row and column above and left, to find the moves of the window cells
+    a, b = max(r0 - 1, 0), max(c0 - 1, 0)
+    values = np.empty((r1 - a, c1 - b), dtype=np.int64)
+    for j, pv, mv, _ in _bit_parallel_columns(x, y, c1):
+        if j >= b:
+            values[:, j - b] = _decode_column(pv, mv, j, a, r1)
+
+    provenance = np.zeros(values.shape, dtype=np.int8)
+    xs, ys = _codes(x[a:r1 - 1]), _codes(y[b:c1 - 1])
+    provenance[1:, 1:] = _moves(values, xs[:, np.newaxis] == ys[np.newaxis, :])
+    if a == 0:
+        provenance[0, 1:] = INSERT
+    if b == 0:
+        provenance[1:, 0] = DELETE
+
+    window = (slice(r0 - a, None), slice(c0 - b, None))
+    return _solution(values[window], provenance[window], (r0, c0))
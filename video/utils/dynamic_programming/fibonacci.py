@@ -0,0 +1,163 @@
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+Matrix = List[List[int]]
+
+
+def _reduce(value: int, mod: Optional[int]) -> int:
+    return value % mod if mod is not None else value
+
+
+def fib_naive(n: int, mod: Optional[int] = None) -> int:
+    """
+    Fibonacci by plain recursion, O(phi^n) calls, as in the tree of `dp_01_01`.
+    """
+    if n < 2:
+        return _reduce(n, mod)
+    return _reduce(fib_naive(n - 1, mod) + fib_naive(n - 2, mod), mod)
+
+
+def fib_memo(n: int, mod: Optional[int] = None) -> int:
+    """
+    Fibonacci by recursion with a memo, O(n) calls, as in the DAG of `dp_02_01`.
+
+    The recursion runs on an explicit stack, so large `n` do not hit
+    the interpreter recursion limit.
+    """
+    memo: Dict[int, int] = {0: _reduce(0, mod), 1: _reduce(1, mod)}
+    stack = [n]
+    while stack:
+        k = stack[-1]
+        if k in memo:
+            stack.pop()
+        elif k - 1 in memo and k - 2 in memo:
+            memo[k] = _reduce(memo[k - 1] + memo[k - 2], mod)
+            stack.pop()
+        else:
+            stack.extend(j for j in (k - 2, k - 1) if j not in memo)
+    return memo[n]
+
+
+def fib_bottom_up(n: int, mod: Optional[int] = None) -> int:
+    """
+    Fibonacci by filling a table of all values up to `n`, as in `dp_04_01`.
+    """
+    table = [0, 1]
+    for i in range(2, n + 1):
+        table.append(_reduce(table[i - 1] + table[i - 2], mod))
+    return _reduce(table[n], mod)
+
+
+def fib_rolling(n: int, mod: Optional[int] = None) -> int:
+    """
+    Fibonacci keeping only the last two values, as in `dp_04_02`.
+    """
+    prev, curr = 0, 1
+    for _ in range(n):
+        prev, curr = curr, _reduce(prev + curr, mod)
+    return _reduce(prev, mod)
+
+
+def fib_fast_doubling(n: int, mod: Optional[int] = None) -> int:
+    """
+    Fibonacci in O(log n) steps with the doubling identities
+    `F(2k) = F(k) (2 F(k + 1) - F(k))` and `F(2k + 1) = F(k)^2 + F(k + 1)^2`,
+    reading the bits of `n` from the highest.
+    """
+    a, b = 0, 1  # F(k), F(k + 1), with k the bits of n read so far
+    for bit in bin(n)[2:]:
+        a, b = _reduce(a * (2 * b - a), mod), _reduce(a * a + b * b, mod)
+        if bit == "1":
+            a, b = b, _reduce(a + b, mod)
+    return a
+
+
+def matrix_multiply(a: Matrix, b: Matrix, mod: Optional[int] = None) -> Matrix:
+    """
+    Multiply two square matrices of Python ints, exact or modulo `mod`.
+    """
+    columns = list(zip(*b))
+    return [[_reduce(sum(x * y for x, y in zip(row, column)), mod) for column in columns] for row in a]
+
+
+def matrix_power(matrix: Matrix, n: int, mod: Optional[int] = None) -> Matrix:
+    """
+    Raise a square matrix of Python ints to the power `n` by repeated squaring,
+    O(log n) multiplications.
+    """
+    size = len(matrix)
+    result = [[int(i == j) for j in range(size)] for i in range(size)]
+    while n:
+        if n & 1:
+            result = matrix_multiply(result, matrix, mod)
+        matrix = matrix_multiply(matrix, matrix, mod)
+        n >>= 1
+    return result
+
+
+def linear_recurrence(
+    coefficients: Sequence[int],
+    initial: Sequence[int],
+    n: int,
+    mod: Optional[int] = None,
+) -> int:
+    """
+    Get term `n` of `a(i) = c[0] a(i - 1) + ... + c[k - 1] a(i - k)`
+    with the power of its companion matrix, O(k^3 log n).
+
+    Arguments:
+        coefficients: The coefficients `c`.
+        initial: The first `k` terms `a(0), ..., a(k - 1)`.
+        n: The index of the term.
+        mod: The modulus, exact by default.
+
+    Returns:
+        The term `a(n)`.
+    """
+    k = len(coefficients)
+    if n < k:
+        return _reduce(initial[n], mod)
+
+    companion = [list(coefficients)] + [[int(j == i) for j in range(k)] for i in range(k - 1)]
+    power = matrix_power(companion, n - k + 1, mod)
+
+    # The state (a(i), ..., a(i - k + 1)) maps to (a(i + 1), ..., a(i - k + 2))
+    state = list(reversed(initial))
+    return _reduce(sum(x * y for x, y in zip(power[0], state)), mod)
+
+
+def fib_matrix(n: int, mod: Optional[int] = None) -> int:
+    """
+    Fibonacci in O(log n) steps with `[[1, 1], [1, 0]]^n = [[F(n + 1), F(n)], [F(n), F(n - 1)]]`.
+    """
+    return matrix_power([[1, 1], [1, 0]], n, mod)[0][1]
+
+
+METHODS: Dict[str, Callable[..., int]] = {
+    "naive": fib_naive,
+    "memo": fib_memo,
+    "bottom_up": fib_bottom_up,
+    "rolling": fib_rolling,
+    "fast_doubling": fib_fast_doubling,
+    "matrix": fib_matrix,
+}
+
+
+def fibonacci(n: int, method: str = "fast_doubling", mod: Optional[int] = None) -> int:
+    """
+    Get the Fibonacci number `F(n)`, with `F(0) = 0` and `F(1) = 1`.
+
+    Arguments:
+        n: The index, non-negative.
+        method: One of `METHODS`, `fast_doubling` by default.
+        mod: The modulus, exact by default.
+
+    Returns:
+        The number `F(n)`, modulo `mod` if given.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {', '.join(METHODS)}")
+    return METHODS[method](n, mod)
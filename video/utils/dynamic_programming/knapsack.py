@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import Generator, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .solution import DPSolution
+
+
+# Moves, from the previous item at the same capacity, or at the capacity minus the weight
+SKIP = 1
+TAKE = 2
+
+
+def knapsack_rows(
+    weights: Sequence[int],
+    values: Sequence[int],
+    capacity: int,
+) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
+    """
+    Compute the 0/1 knapsack table one row at a time, in a single rolling row.
+
+    Adding an item of weight `w` and value `v` is
+    `row[w:] = np.maximum(row[w:], row[:-w] + v)`, O(capacity) vectorized work.
+    The right hand side is computed before the assignment,
+    so every item is taken at most once.
+
+    Arguments:
+        weights: The weight of each item.
+        values: The value of each item.
+        capacity: The capacity of the knapsack.
+
+    Returns:
+        A generator of `(row, take)` after each item, `row[c]` being the maximum
+        value within capacity `c`, and `take[c]` whether the item was taken there.
+        `row` is updated in place by the next item, copy it to keep it.
+    """
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    for weight, value in zip(weights, values):
+        take = np.zeros(capacity + 1, dtype=bool)
+        if weight <= capacity:
+            candidates = row[: capacity + 1 - weight] + value
+            take[weight:] = candidates > row[weight:]
+            np.maximum(row[weight:], candidates, out=row[weight:])
+        yield row, take
+
+
+class RollingKnapsack:
+    """
+    Solved 0/1 knapsack, keeping only the last row of the table
+    and the take or skip decision of every cell as a bitset.
+
+    The decisions take one bit per cell, so a thousand items with a capacity
+    of a million fit in 125 MB, while the table would take 8 GB.
+
+    Attributes:
+        weights: The weight of each item.
+        values: The value of each item.
+        capacity: The capacity of the knapsack.
+        row: The last row of the table, the maximum value within each capacity.
+        decisions: Bit `c` of row `i` is set if item `i` is taken at capacity `c`,
+            packed little endian, array of shape (n, ceil((capacity + 1) / 8)).
+    """
+
+    def __init__(self, weights: Sequence[int], values: Sequence[int], capacity: int):
+        self.weights = list(weights)
+        self.values = list(values)
+        self.capacity = capacity
+
+        self.decisions = np.zeros((len(self.weights), (capacity + 8) // 8), dtype=np.uint8)
+        self.row = np.zeros(capacity + 1, dtype=np.int64)
+        for i, (row, take) in enumerate(knapsack_rows(self.weights, self.values, capacity)):
+            self.decisions[i] = np.packbits(take, bitorder="little")
+            self.row = row
+
+    @property
+    def value(self) -> int:
+        """
+        The maximum value within the capacity of the knapsack.
+        """
+        return int(self.row[self.capacity])
+
+    def took(self, item: int, capacity: int) -> bool:
+        """
+        Check whether an item is taken at a capacity.
+
+        Arguments:
+            item: The index of the item.
+            capacity: The capacity.
+
+        Returns:
+            True if the item is in the best choice of items up to it at the capacity.
+        """
+        return bool(self.decisions[item, capacity >> 3] >> (capacity & 7) & 1)
+
+    def items(self, capacity: Optional[int] = None) -> List[int]:
+        """
+        Reconstruct the items of the best choice.
+
+        Arguments:
+            capacity: The capacity, that of the knapsack by default.
+
+        Returns:
+            The indices of the items taken, in increasing order.
+        """
+        if capacity is None:
+            capacity = self.capacity
+        items = []
+        for item in reversed(range(len(self.weights))):
+            if self.took(item, capacity):
+                items.append(item)
+                capacity -= self.weights[item]
+        items.reverse()
+        return items
+
+
+def solve_knapsack(weights: Sequence[int], values: Sequence[int], capacity: int) -> DPSolution:
+    """
+    Find the maximum value of items fitting in a knapsack, each item
+    being taken at most once, keeping the whole table.
+
+    Arguments:
+        weights: The weight of each item.
+        values: The value of each item.
+        capacity: The capacity of the knapsack.
+
+    Returns:
+        The solution, with `table[i, c]` the maximum value of the first `i`
+        items within capacity `c`. Ties go to `SKIP`.
+    """
+    n = len(weights)
+    table = np.zeros((n + 1, capacity + 1), dtype=np.int64)
+    provenance = np.zeros((n + 1, capacity + 1), dtype=np.int8)
+    parents = np.full((n + 1, capacity + 1, 2), -1, dtype=np.intp)
+    capacities = np.arange(capacity + 1)
+
+    for i, (row, take) in enumerate(knapsack_rows(weights, values, capacity), start=1):
+        table[i] = row
+        provenance[i] = np.where(take, TAKE, SKIP)
+        parents[i, :, 0] = i - 1
+        parents[i, :, 1] = capacities - weights[i - 1] * take
+
+    return DPSolution(table, provenance, parents)
@@ -0,0 +1,260 @@
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generator, Hashable, List, NamedTuple, Tuple
+import functools
+
+
+# Kinds of the events of a `MemoLog`
+HIT = 0
+MISS = 1
+EVICT = 2
+
+NIL = -1
+
+_MISSING = object()
+
+
+class MemoEvent(NamedTuple):
+    """
+    Event of a `MemoLog`.
+    """
+
+    index: int
+    kind: int
+    key: Hashable
+    parent: int
+
+
+class MemoLog:
+    """
+    Log of the lookups of a memo cache, stored as parallel arrays.
+
+    Each event is an index into the `kinds`, `key_ids` and `parents` arrays,
+    with the keys interned in `keys`. The parent of a lookup is the miss
+    whose computation made it, so the hits and misses form the call tree,
+    in call order. The parent of an eviction is the miss that caused it.
+    """
+
+    __slots__ = ("kinds", "key_ids", "parents", "keys", "key_index")
+
+    def __init__(self):
+        self.kinds = array("b")
+        self.key_ids = array("i")
+        self.parents = array("i")
+        self.keys: List[Hashable] = []
+        self.key_index: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def add(self, kind: int, key: Hashable, parent: int) -> int:
+        """
+        Add an event.
+
+        Arguments:
+            kind: `HIT`, `MISS` or `EVICT`.
+            key: The key looked up or evicted.
+            parent: The index of the miss being computed, `NIL` at the top level.
+
+        Returns:
+            The index of the event.
+        """
+        key_id = self.key_index.get(key)
+        if key_id is None:
+            key_id = len(self.keys)
+            self.keys.append(key)
+            self.key_index[key] = key_id
+        self.kinds.append(kind)
+        self.key_ids.append(key_id)
+        self.parents.append(parent)
+        return len(self.kinds) - 1
+
+    def event(self, index: int) -> MemoEvent:
+        """
+        Get an event.
+
+        Arguments:
+            index: The index of the event.
+
+        Returns:
+            The event.
+        """
+        return MemoEvent(index, self.kinds[index], self.keys[self.key_ids[index]], self.parents[index])
+
+    def calls(self) -> Generator[MemoEvent, None, None]:
+        """
+        Get the hits and misses, the nodes of the call tree, in call order.
+
+        Returns:
+            The generator of the events.
+        """
+        for index, kind in enumerate(self.kinds):
+            if kind != EVICT:
+                yield self.event(index)
+
+    def nbytes(self) -> int:
+        """
+        Get the size of the event arrays, without the interned keys.
+        """
+        return sum(a.itemsize * len(a) for a in (self.kinds, self.key_ids, self.parents))
+
+
+class MemoCache:
+    """
+    Memo cache counting its hits, misses and evictions, and logging
+    the lookups in a `MemoLog` if `record` is set.
+
+    Subclasses store the values, with `_get`, returning `_MISSING`
+    for absent keys, and `_set`, returning the evicted keys.
+    """
+
+    def __init__(self, record: bool = True):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.log = MemoLog() if record else None
+        self._computing: List[int] = []
+
+    def _get(self, key: Hashable) -> Any:
+        raise NotImplementedError
+
+    def _set(self, key: Hashable, value: Any) -> Tuple[Hashable, ...]:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def call(self, key: Hashable, compute: Callable[..., Any], *args) -> Any:
+        """
+        Get the value of a key, computing and storing it on a miss.
+
+        Arguments:
+            key: The key.
+            compute: The function computing the value, which may look up other keys.
+            args: The arguments of `compute`.
+
+        Returns:
+            The value.
+        """
+        parent = self._computing[-1] if self._computing else NIL
+        value = self._get(key)
+        if value is not _MISSING:
+            self.hits += 1
+            if self.log is not None:
+                self.log.add(HIT, key, parent)
+            return value
+
+        self.misses += 1
+        event = self.log.add(MISS, key, parent) if self.log is not None else NIL
+        self._computing.append(event)
+        try:
+            value = compute(*args)
+        finally:
+            self._computing.pop()
+
+        for evicted in self._set(key, value):
+            self.evictions += 1
+            if self.log is not None:
+                self.log.add(EVICT, evicted, event)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the counters of the cache.
+
+        Returns:
+            The hits, misses, evictions and size.
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self)}
+
+
+class DictCache(MemoCache):
+    """
+    Unbounded memo cache in a dict.
+    """
+
+    def __init__(self, record: bool = True):
+        super().__init__(record)
+        self.values: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _get(self, key: Hashable) -> Any:
+        return self.values.get(key, _MISSING)
+
+    def _set(self, key: Hashable, value: Any) -> Tuple[Hashable, ...]:
+        self.values[key] = value
+        return ()
+
+
+class LRUCache(MemoCache):
+    """
+    Memo cache keeping the `maxsize` most recently used values.
+    """
+
+    def __init__(self, maxsize: int, record: bool = True):
+        super().__init__(record)
+        self.maxsize = maxsize
+        self.values: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _get(self, key: Hashable) -> Any:
+        value = self.values.get(key, _MISSING)
+        if value is not _MISSING:
+            self.values.move_to_end(key)
+        return value
+
+    def _set(self, key: Hashable, value: Any) -> Tuple[Hashable, ...]:
+        self.values[key] = value
+        if len(self.values) > self.maxsize:
+            return (self.values.popitem(last=False)[0],)
+        return ()
+
+
+class ArrayCache(MemoCache):
+    """
+    Memo cache for the keys `0` to `size - 1`, in a preallocated list.
+    """
+
+    def __init__(self, size: int, record: bool = True):
+        super().__init__(record)
+        self.values: List[Any] = [_MISSING] * size
+        self.filled = 0
+
+    def __len__(self) -> int:
+        return self.filled
+
+    def _get(self, key: Hashable) -> Any:
+        return self.values[key]  # type: ignore
+
+    def _set(self, key: Hashable, value: Any) -> Tuple[Hashable, ...]:
+        self.filled += self.values[key] is _MISSING  # type: ignore
+        self.values[key] = value  # type: ignore
+        return ()
+
+
+def memoize(cache: MemoCache) -> Callable[[Callable], Callable]:
+    """
+    Memoize a function in a cache. Its positional arguments are the key,
+    a single argument being its own key.
+
+    Arguments:
+        cache: The cache.
+
+    Returns:
+        The decorator, the decorated function has the cache as `cache`.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args):
+            return cache.call(args[0] if len(args) == 1 else args, function, *args)
+
+        wrapper.cache = cache  # type: ignore
+        return wrapper
+
+    return decorator
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+
+# Provenance of cells without a predecessor, like base cases
+NONE = 0
+
+
+class DPSolution:
+    """
+    Solved DP table, with the provenance of every cell.
+
+    Attributes:
+        table: The DP table.
+        provenance: Per cell code of the move the value came from, as defined
+            by the solver module, `NONE` for base cases. For counting problems,
+            where every predecessor contributes, a bitmask of the moves.
+        parents: Per cell coordinates of the predecessor the value came from,
+            array of shape `table.shape + (table.ndim,)`, -1 for base cases.
+            None for counting problems.
+        origin: The coordinates of `table[0, ...]` in the full table,
+            when the solution only covers a window of it. Cells and
+            parents are always in full table coordinates.
+    """
+
+    def __init__(
+        self,
+        table: np.ndarray,
+        provenance: np.ndarray,
+        parents: Optional[np.ndarray] = None,
+        origin: Optional[Sequence[int]] = None,
+    ):
+        self.table = table
+        self.provenance = provenance
+        self.parents = parents
+        self.origin = tuple(origin) if origin is not None else (0,) * table.ndim
+
+    def __getitem__(self, cell: Tuple[int, ...]):
+        """
+        Get the value of a cell, in full table coordinates.
+        """
+        return self.table[self._local(cell)]
+
+    def _local(self, cell: Tuple[int, ...]) -> Tuple[int, ...]:
+        return tuple(int(x) - o for x, o in zip(cell, self.origin))
+
+    def _contains(self, cell: Tuple[int, ...]) -> bool:
+        return all(0 <= x < size for x, size in zip(self._local(cell), self.table.shape))
+
+    @property
+    def value(self):
+        """
+        The value of the last cell, the answer of the problem
+        unless the solution only covers a window.
+        """
+        return self.table[(-1,) * self.table.ndim]
+
+    def parent(self, cell: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+        """
+        Get the predecessor the value of a cell came from.
+
+        Arguments:
+            cell: The coordinates of the cell.
+
+        Returns:
+            The coordinates of the predecessor, or None for base cases
+            and predecessors outside of the window.
+        """
+        if self.parents is None:
+            raise ValueError("counting problems have no single predecessor")
+        parent = tuple(int(x) for x in self.parents[self._local(cell)])
+        if parent[0] < 0 or not self._contains(parent):
+            return None
+        return parent
+
+    def traceback(self, cell: Optional[Tuple[int, ...]] = None) -> List[Tuple[int, ...]]:
+        """
+        Follow the predecessors from a cell back to a base case.
+
+        Arguments:
+            cell: The coordinates of the cell, the last cell by default.
+
+        Returns:
+            The cells of the path, from the base case, or the edge
+            of the window, to the cell.
+        """
+        if cell is None:
+            cell = tuple(o + size - 1 for o, size in zip(self.origin, self.table.shape))
+        path = [tuple(cell)]
+        parent = self.parent(path[-1])
+        while parent is not None:
+            path.append(parent)
+            parent = self.parent(parent)
+        path.reverse()
+        return path
@@ -0,0 +1,163 @@
+from __future__ import annotations
+from collections import deque
+from itertools import islice
+from typing import Deque, Generator, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .solution import DPSolution, NONE
+from .fibonacci import fibonacci, linear_recurrence
+
+
+# Moves, the step sizes, the provenance of `solve_stairs` is a bitmask of them
+ONE_STEP = 1
+TWO_STEPS = 2
+
+
+def _check_steps(steps: Sequence[int]) -> List[int]:
+    steps = sorted(set(steps))
+    if not steps or steps[0] < 1:
+        raise ValueError("steps must be positive")
+    return steps
+
+
+def stairs_counts(steps: Sequence[int] = (ONE_STEP, TWO_STEPS), mod: Optional[int] = None) -> Generator[int, None, None]:
+    """
+    Stream the number of ways to climb 0, 1, 2, ... stairs, with steps of the given sizes.
+
+    Arguments:
+        steps: The sizes of the steps.
+        mod: The modulus, exact by default.
+
+    Returns:
+        The endless generator of the counts, keeping only the last `max(steps)` of them.
+    """
+    steps = _check_steps(steps)
+    last: Deque[int] = deque([0] * steps[-1], maxlen=steps[-1])
+    count = 1
+    while True:
+        yield count
+        last.append(count)
+        count = sum(last[-step] for step in steps)
+        if mod is not None:
+            count %= mod
+
+
+def solve_stairs(n: int, steps: Sequence[int] = (ONE_STEP, TWO_STEPS)) -> DPSolution:
+    """
+    Count the ways to climb `n` stairs, with steps of the given sizes.
+
+    Arguments:
+        n: The number of stairs.
+        steps: The sizes of the steps, one or two by default.
+
+    Returns:
+        The solution, with `table[i]` the number of ways to climb `i` stairs.
+        The provenance is a bitmask of the steps contributing to each cell,
+        `1 << (step - 1)`, so `ONE_STEP` and `TWO_STEPS` for the default steps.
+    """
+    steps = _check_steps(steps)
+    if steps[-1] > 63:
+        raise ValueError("the provenance bitmask holds steps up to 63")
+
+    counts = list(islice(stairs_counts(steps), n + 1))
+    # Counts past 2^63 overflow int64
+    table = np.array(counts, dtype=np.int64 if counts[-1] < 2**63 else object)
+
+    provenance = np.zeros(n + 1, dtype=np.int8 if steps[-1] < 8 else np.int64)
+    for step in steps:
+        provenance[step:] |= 1 << (step - 1)
+    return DPSolution(table, provenance)
+
+
+def count_stairs(n: int, steps: Sequence[int] = (ONE_STEP, TWO_STEPS), mod: Optional[int] = None) -> int:
+    """
+    Count the ways to climb `n` stairs with steps of the given sizes, in O(log n)
+    multiplications. With one or two steps, it is the Fibonacci number `F(n + 1)`,
+    otherwise it is a linear recurrence with the coefficients `c[step - 1] = 1`.
+
+    Arguments:
+        n: The number of stairs.
+        steps: The sizes of the steps, one or two by default.
+        mod: The modulus, exact by default.
+
+    Returns:
+        The number of ways.
+    """
+    steps = _check_steps(steps)
+    if steps == [ONE_STEP, TWO_STEPS]:
+        return fibonacci(n + 1, mod=mod)
+
+    coefficients = [int(i + 1 in steps) for i in range(steps[-1])]
+    initial = list(islice(stairs_counts(steps, mod), steps[-1]))
+    return linear_recurrence(coefficients, initial, n, mod)
+
+
+def min_cost_stairs_rows(cost: Iterable[int], max_step: int = TWO_STEPS) -> Generator[Tuple[int, int], None, None]:
+    """
+    Stream the minimum costs to reach each stair, with steps of one to `max_step`
+    stairs, starting from any of the first `max_step` stairs and paying the cost
+    of every stair stepped from.
+
+    The candidates `table[j] + cost[j]` of the last `max_step` stairs are kept in
+    a monotone deque, increasing from the front, so each stair costs amortized O(1)
+    whatever the step size.
+
+    Arguments:
+        cost: The costs of the stairs, in order, from any iterable.
+        max_step: The largest step.
+
+    Returns:
+        The generator of `(table[i], step)` for each stair `i`, the last one being the top,
+        with `step` the step reaching it or `NONE` for the starting stairs.
+        Each is yielded as soon as the costs it depends on are read. Ties go to the smallest step.
+    """
+    if max_step < 1:
+        raise ValueError("max_step must be positive")
+
+    # (j, table[j] + cost[j]), the later index wins ties
+    window: Deque[Tuple[int, int]] = deque()
+    current = 0
+    yield current, NONE
+    for i, stair_cost in enumerate(cost, start=1):
+        candidate = current + stair_cost
+        while window and window[-1][1] >= candidate:
+            window.pop()
+        window.append((i - 1, candidate))
+        if window[0][0] < i - max_step:
+            window.popleft()
+
+        if i < max_step:
+            yield current, NONE
+        else:
+            current = window[0][1]
+            yield current, i - window[0][0]
+
+
+def solve_min_cost_stairs(cost: Sequence[int], max_step: int = TWO_STEPS) -> DPSolution:
+    """
+    Find the minimum cost to climb past the last stair, with steps of one to
+    `max_step` stairs, starting from any of the first `max_step` stairs and
+    paying the cost of every stair stepped from.
+
+    Arguments:
+        cost: The cost of each stair.
+        max_step: The largest step, two by default.
+
+    Returns:
+        The solution, with `table[i]` the minimum cost to reach stair `i`,
+        `table[len(cost)]` being the top, and the provenance the step reaching it.
+        Ties go to the smallest step.
+    """
+    cost = np.asarray(cost)
+    n = len(cost)
+    table = np.zeros(n + 1, dtype=cost.dtype if n else np.int64)
+    provenance = np.zeros(n + 1, dtype=np.int8 if max_step < 128 else np.int64)
+
+    # Each cell depends on the previous ones, so the recurrence is sequential
+    for i, (value, step) in enumerate(min_cost_stairs_rows(cost.tolist(), max_step)):
+        table[i] = value
+        provenance[i] = step
+
+    parents = np.arange(n + 1) - provenance
+    parents[provenance == NONE] = -1
+    return DPSolution(table, provenance, parents[:, np.newaxis])
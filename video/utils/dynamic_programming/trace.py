@@ -0,0 +1,281 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+import json
+import struct
+
+import numpy as np
+
+from .solution import DPSolution
+
+
+# Version of both trace formats, bumped on incompatible changes
+VERSION = 1
+
+# Start of the binary columnar format, NDJSON traces start with `{`
+MAGIC = b"DPTRACE\x00"
+
+# Steps per block of the columnar format, and per chunk when reading a solution
+BLOCK_STEPS = 4096
+
+# Column types of the columnar format, values get the type of the table
+CELL_DTYPE = np.dtype("<i4")
+MOVE_DTYPE = np.dtype("<i4")
+VALUE_DTYPES = {"i": np.dtype("<i8"), "u": np.dtype("<i8"), "b": np.dtype("<i8"), "f": np.dtype("<f8")}
+
+_LENGTH = struct.Struct("<I")
+
+
+class TraceStep(NamedTuple):
+    """
+    One cell of a DP table, when it is filled.
+
+    Attributes:
+        cell: The coordinates of the cell, in full table coordinates.
+        value: The value of the cell.
+        move: The provenance code of the value, see `DPSolution.provenance`.
+        parent: The coordinates of the predecessor the value came from,
+            None for base cases and counting problems.
+    """
+
+    cell: Tuple[int, ...]
+    value: Any
+    move: int
+    parent: Optional[Tuple[int, ...]]
+
+
+class TraceBlock(NamedTuple):
+    """
+    Consecutive steps of a trace, as columns.
+
+    Attributes:
+        cells: The coordinates of the cells, array of shape (n, ndim).
+        values: The values of the cells, array of shape (n,).
+        moves: The provenance codes, array of shape (n,).
+        parents: The coordinates of the predecessors, array of shape (n, ndim),
+            -1 where there is none.
+    """
+
+    cells: np.ndarray
+    values: np.ndarray
+    moves: np.ndarray
+    parents: np.ndarray
+
+    def steps(self) -> Iterator[TraceStep]:
+        """
+        Get the steps of the block.
+
+        Returns:
+            A generator of the steps, in order.
+        """
+        cells = [tuple(cell) for cell in self.cells.tolist()]
+        parents = [tuple(parent) if parent[0] >= 0 else None for parent in self.parents.tolist()]
+        yield from map(TraceStep, cells, self.values.tolist(), self.moves.tolist(), parents)
+
+
+def trace_header(solution: DPSolution, **metadata) -> Dict[str, Any]:
+    """
+    Describe the trace of a solution.
+
+    Arguments:
+        solution: The solution.
+        metadata: Extra JSON entries, like the problem and its inputs.
+
+    Returns:
+        The header of the trace, as written by `write_trace`.
+    """
+    return {
+        **metadata,
+        "version": VERSION,
+        "shape": list(solution.table.shape),
+        "origin": list(solution.origin),
+        "counting": solution.parents is None,
+    }
+
+
+def solution_blocks(solution: DPSolution, block_steps: int = BLOCK_STEPS) -> Iterator[TraceBlock]:
+    """
+    Read the cells of a solution in the order they are filled, row by row.
+
+    Only one block of columns is built at a time, as views of the solution
+    arrays where possible.
+
+    Arguments:
+        solution: The solution.
+        block_steps: The number of steps per block.
+
+    Returns:
+        A generator of the blocks.
+    """
+    table = solution.table
+    values = table.reshape(-1)
+    moves = solution.provenance.reshape(-1)
+    parents = solution.parents.reshape(-1, table.ndim) if solution.parents is not None else None
+    origin = np.array(solution.origin, dtype=np.int64)
+    for start in range(0, values.size, block_steps):
+        stop = min(start + block_steps, values.size)
+        cells = np.stack(np.unravel_index(np.arange(start, stop), table.shape), axis=1) + origin
+        yield TraceBlock(
+            cells,
+            values[start:stop],
+            moves[start:stop],
+            parents[start:stop] if parents is not None else np.full((stop - start, table.ndim), -1),
+        )
+
+
+def solution_trace(solution: DPSolution) -> Iterator[TraceStep]:
+    """
+    Replay the filling of a solution one cell at a time.
+
+    Arguments:
+        solution: The solution.
+
+    Returns:
+        A generator of the steps, row by row.
+    """
+    for block in solution_blocks(solution):
+        yield from block.steps()
+
+
+def write_trace(path: Union[str, Path], solution: DPSolution, columnar: bool = False, **metadata):
+    """
+    Write the trace of a solution, streaming it block by block.
+
+    The NDJSON format is a header object on the first line, then one
+    `[cell, value, move, parent]` array per line, `parent` being null
+    where there is none. It keeps integers of any size.
+
+    The columnar format is `MAGIC`, the length and bytes of the JSON header,
+    then blocks of steps, each the number of steps and the columns
+    `cells`, `values`, `moves` and `parents` one after the other,
+    ending with an empty block. The types of the columns are in the header.
+    Values must fit 64 bits.
+
+    Arguments:
+        path: The path of the trace.
+        solution: The solution.
+        columnar: Whether to use the columnar format instead of NDJSON.
+        metadata: Extra entries of the header.
+    """
+    header = trace_header(solution, **metadata)
+    if not columnar:
+        with open(path, "w") as f:
+            f.write(json.dumps({"format": "ndjson", **header}) + "\n")
+            for step in solution_trace(solution):
+                f.write(json.dumps(step, separators=(",", ":")) + "\n")
+        return
+
+    kind = solution.table.dtype.kind
+    if kind not in VALUE_DTYPES:
+        raise ValueError(f"values of type {solution.table.dtype} do not fit the columnar format")
+    dtypes = {"cells": CELL_DTYPE, "values": VALUE_DTYPES[kind], "moves": MOVE_DTYPE, "parents": CELL_DTYPE}
+    header = {"format": "columnar", **header, "dtypes": {name: dtype.str for name, dtype in dtypes.items()}}
+    encoded = json.dumps(header).encode()
+    with open(path, "wb") as f:
+        f.write(MAGIC + _LENGTH.pack(len(encoded)) + encoded)
+        for block in solution_blocks(solution):
+            f.write(_LENGTH.pack(len(block.values)))
+            for name, dtype in dtypes.items():
+                f.write(np.ascontiguousarray(getattr(block, name), dtype=dtype).tobytes())
+        f.write(_LENGTH.pack(0))
+
+
+class Trace:
+    """
+    Trace written by `write_trace`, in either format.
+
+    Only the header is read when opening it. The steps are read from
+    the file lazily every time the trace is iterated.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self.columnar = f.read(len(MAGIC)) == MAGIC
+            if self.columnar:
+                (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                self.header: Dict[str, Any] = json.loads(f.read(length))
+            else:
+                f.seek(0)
+                self.header = json.loads(f.readline())
+        if self.header["version"] != VERSION:
+            raise ValueError(f"unsupported trace version {self.header['version']}")
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(self.header["shape"])
+
+    def __iter__(self) -> Iterator[TraceStep]:
+        if self.columnar:
+            for block in self.blocks():
+                yield from block.steps()
+            return
+
+        with open(self.path) as f:
+            f.readline()
+            for line in f:
+                cell, value, move, parent = json.loads(line)
+                yield TraceStep(tuple(cell), value, move, tuple(parent) if parent is not None else None)
+
+    def blocks(self) -> Iterator[TraceBlock]:
+        """
+        Read a columnar trace one block at a time.
+
+        Returns:
+            A generator of the blocks.
+        """
+        if not self.columnar:
+            raise ValueError("NDJSON traces have no blocks, iterate the steps")
+        ndim = len(self.header["shape"])
+        dtypes = {name: np.dtype(dtype) for name, dtype in self.header["dtypes"].items()}
+        with open(self.path, "rb") as f:
+            f.seek(len(MAGIC))
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            f.seek(length, 1)
+            while True:
+                (count,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                if count == 0:
+                    return
+                yield TraceBlock(
+                    _read_column(f, dtypes["cells"], count * ndim).reshape(count, ndim),
+                    _read_column(f, dtypes["values"], count),
+                    _read_column(f, dtypes["moves"], count),
+                    _read_column(f, dtypes["parents"], count * ndim).reshape(count, ndim),
+                )
+
+    def to_solution(self) -> DPSolution:
+        """
+        Load the whole trace into a solution.
+
+        Returns:
+            The solution, with the cells of the trace.
+        """
+        shape = self.shape
+        origin = np.array(self.header["origin"], dtype=np.int64)
+        # NDJSON values can be integers of any size
+        dtype = np.dtype(self.header["dtypes"]["values"]) if self.columnar else object
+        table = np.zeros(shape, dtype=dtype)
+        provenance = np.zeros(shape, dtype=MOVE_DTYPE)
+        parents = None if self.header["counting"] else np.full(shape + (len(shape),), -1, dtype=np.int64)
+        if self.columnar:
+            for block in self.blocks():
+                local = tuple((block.cells - origin).T)
+                table[local] = block.values
+                provenance[local] = block.moves
+                if parents is not None:
+                    parents[local] = block.parents
+        else:
+            for step in self:
+                local = tuple(np.array(step.cell) - origin)
+                table[local] = step.value
+                provenance[local] = step.move
+                if parents is not None and step.parent is not None:
+                    parents[local] = step.parent
+        return DPSolution(table, provenance, parents, origin=tuple(origin.tolist()))
+
+
+def _read_column(f: BinaryIO, dtype: np.dtype, count: int) -> np.ndarray:
+    data = f.read(dtype.itemsize * count)
+    if len(data) != dtype.itemsize * count:
+        raise ValueError("truncated trace")
+    return np.frombuffer(data, dtype=dtype)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+from typing import Generator, Optional, Tuple
+import math
+import numpy as np
+
+from .solution import DPSolution, NONE
+
+
+# Moves, the provenance is a bitmask of them
+FROM_TOP = 1
+FROM_LEFT = 2
+
+
+def count_unique_paths(rows: int, cols: int, mod: Optional[int] = None) -> int:
+    """
+    Count the paths from the top left to the bottom right of a grid without
+    obstacles, moving right or down, with the binomial `C(rows + cols - 2, rows - 1)`.
+
+    Arguments:
+        rows: The number of rows.
+        cols: The number of columns.
+        mod: A prime modulus, exact by default.
+
+    Returns:
+        The number of paths, modulo `mod` if given.
+    """
+    if rows < 1 or cols < 1:
+        return 0
+    n, k = rows + cols - 2, min(rows, cols) - 1
+    if mod is None:
+        return math.comb(n, k)
+
+    # Lucas' theorem, one base `mod` digit at a time
+    result = 1
+    while n or k:
+        n_digit, k_digit = n % mod, k % mod
+        if k_digit > n_digit:
+            return 0
+        numerator = denominator = 1
+        for i in range(min(k_digit, n_digit - k_digit)):
+            numerator = numerator * (n_digit - i) % mod
+            denominator = denominator * (i + 1) % mod
+        result = result * numerator * pow(denominator, mod - 2, mod) % mod
+        n, k = n // mod, k // mod
+    return result
+
+
+def _dtype(rows: int, cols: int, mod: Optional[int]):
+    # Counts overflow int64 past C(66, 33), and a row of residues sums below cols * mod
+    if mod is not None:
+        return np.int64 if mod * cols < 2**63 else object
+    return np.int64 if rows + cols < 66 else object
+
+
+def unique_paths_rows(
+    rows: int,
+    cols: int,
+    obstacles: Optional[np.ndarray] = None,
+    mod: Optional[int] = None,
+) -> Generator[np.ndarray, None, None]:
+    """
+    Stream the rows of unique path counts, overwriting a single row
+    as in `dp_06_03`.
+
+    Each row is the running sum of the row above, restarted after each obstacle,
+    so it is one `np.cumsum` and, with obstacles, one `np.maximum.accumulate`.
+
+    Arguments:
+        rows: The number of rows.
+        cols: The number of columns, only the first ones can be asked for.
+        obstacles: A boolean mask of the blocked cells, of at least `(rows, cols)`.
+        mod: The modulus, exact by default.
+
+    Returns:
+        The generator of the rows, the same array updated in place.
+    """
+    dtype = _dtype(rows, cols, mod)
+    columns = np.arange(cols)
+
+    # A virtual row above the grid, entering it at the top left
+    row = np.zeros(cols, dtype=dtype)
+    row[:1] = 1
+    for i in range(rows):
+        np.cumsum(row, out=row)
+        if obstacles is not None:
+            blocked = np.asarray(obstacles[i, :cols], dtype=bool)
+            if blocked.any():
+                # Sums from the last obstacle to the left, of the cells above
+                last = np.maximum.accumulate(np.where(blocked, columns, -1))
+                row -= np.where(last >= 0, row[last], 0)
+                row[blocked] = 0
+        if mod is not None:
+            row %= mod
+        yield row
+
+
+def _provenance(open_cells: np.ndarray, r0: int, c0: int) -> np.ndarray:
+    """
+    Find the moves into each cell, given the mask of open cells
+    from one row and column before the window when there is one.
+    """
+    provenance = np.zeros(open_cells.shape, dtype=np.int8)
+    provenance[1:, :] |= np.where(open_cells[1:] & open_cells[:-1], FROM_TOP, NONE).astype(np.int8)
+    provenance[:, 1:] |= np.where(open_cells[:, 1:] & open_cells[:, :-1], FROM_LEFT, NONE).astype(np.int8)
+    return provenance[int(r0 > 0) :, int(c0 > 0) :]
+
+
+def solve_unique_paths(
+    rows: int,
+    cols: int,
+    obstacles: Optional[np.ndarray] = None,
+    mod: Optional[int] = None,
+    window: Optional[Tuple[slice, slice]] = None,
+) -> DPSolution:
+    """
+    Count the paths from the top left to each cell of a grid,
+    moving right or down and avoiding obstacles.
+
+    Only the rows and columns up to the window are computed, and only
+    the window is kept, so with a modulus a window on a grid of 10^4 x 10^4
+    costs 10^4 vectorized row updates.
+
+    Arguments:
+        rows: The number of rows.
+        cols: The number of columns.
+        obstacles: A boolean mask of the blocked cells, of shape `(rows, cols)`.
+        mod: The modulus, exact by default.
+        window: The rows and columns of the table to compute, e.g.
+            `(slice(100, 110), slice(200, 215))`, all of it by default.
+
+    Returns:
+        The solution, with `table[i, j]` the number of paths to cell `(i, j)`,
+        offset by `origin` for a window. The provenance is a bitmask of the moves
+        contributing to each cell, `NONE` for the top left cell and the obstacles.
+    """
+    r0, r1, _ = (window[0] if window else slice(None)).indices(rows)
+    c0, c1, _ = (window[1] if window else slice(None)).indices(cols)
+    if r0 >= r1 or c0 >= c1:
+        raise ValueError("empty window")
+
+    table = np.zeros((r1 - r0, c1 - c0), dtype=_dtype(rows, cols, mod))
+    for i, row in enumerate(unique_paths_rows(r1, c1, obstacles, mod)):
+        if i >= r0:
+            table[i - r0] = row[c0:]
+
+    # The cells of the window, and the row and column before it
+    cells = (slice(max(r0 - 1, 0), r1), slice(max(c0 - 1, 0), c1))
+    if obstacles is None:
+        open_cells = np.ones((cells[0].stop - cells[0].start, cells[1].stop - cells[1].start), dtype=bool)
+    else:
+        open_cells = ~np.asarray(obstacles[cells], dtype=bool)
+    return DPSolution(table, _provenance(open_cells, r0, c0), origin=(r0, c0))
+
+
+def solve_min_path_sum(cost: np.ndarray) -> DPSolution:
+    """
+    Find the minimum sum of the costs along a path from the top left
+    to each cell of a grid, moving right or down.
+
+    Each row follows from the row above at once: with `S` the running sum
+    of the costs of the row, `row[j] = S[j] + min over k <= j of (above[k] - S[k - 1])`,
+    one `np.minimum.accumulate`.
+
+    Arguments:
+        cost: The costs of the cells, of shape `(rows, cols)`.
+
+    Returns:
+        The solution, with `table[i, j]` the minimum sum to reach cell `(i, j)`,
+        its own cost included. Ties go to `FROM_TOP`.
+    """
+    cost = np.asarray(cost)
+    rows, cols = cost.shape
+    table = np.zeros((rows, cols), dtype=cost.dtype)
+    provenance = np.zeros((rows, cols), dtype=np.int8)
+
+    table[0] = np.cumsum(cost[0])
+    provenance[0, 1:] = FROM_LEFT
+    for i in range(1, rows):
+        sums = np.cumsum(cost[i])
+        table[i] = sums + np.minimum.accumulate(table[i - 1] - sums + cost[i])
+        provenance[i] = FROM_TOP
+        provenance[i, 1:][table[i, :-1] < table[i - 1, 1:]] = FROM_LEFT
+
+    parents = np.stack(np.indices((rows, cols)), axis=-1)
+    parents[..., 0] -= provenance == FROM_TOP
+    parents[..., 1] -= provenance == FROM_LEFT
+    parents[provenance == NONE] = -1
+    return DPSolution(table, provenance, parents)
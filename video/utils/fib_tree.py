@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from utils.btree import BNode
+from utils.dag_tree import DagTree
+
+
+def build_fib_tree(n: int) -> BNode:
+    """
+    Build a Fibonacci tree with `f(n)` as root.
+
+    Arguments:
+        n: the Fibonacci number
+    Returns:
+        root: root of the tree
+    """
+    if n == 0:
+        return BNode(f"f({n})")
+    elif n == 1:
+        return BNode(f"f({n})")
+    else:
+        root = BNode(f"f({n})")
+        root.left = build_fib_tree(n - 1)
+        root.right = build_fib_tree(n - 2)
+        return root
+
+
+def build_fib_dag(n: int) -> DagTree:
+    """
+    Build a Fibonacci tree with `f(n)` as root, sharing repeated subproblems.
+
+    Arguments:
+        n: the Fibonacci number
+    Returns:
+        dag: the tree, with one node per `f(i)`
+    """
+    dag = DagTree()
+    prev = dag.node("f(0)")
+    if n == 0:
+        return dag
+    curr = dag.node("f(1)")
+    for i in range(2, n + 1):
+        prev, curr = curr, dag.node(f"f({i})", curr, prev)
+    return dag
@@ -1,6 +1,8 @@
 from typing import Iterable
 from manim import *
 
+from utils.mobject_cache import cached_mobject
+
 class LinkedList(VGroup):
     def __init__(
         self,
@@ -27,7 +29,7 @@ class LinkedList(VGroup):
         self.nodes = VGroup()
         self.circles = VGroup()
         for i, data in enumerate(self.data):
-            node: VMobject = self.element_to_mobject(data, **self.element_to_mobject_config)
+            node: VMobject = cached_mobject(self.element_to_mobject, data, **self.element_to_mobject_config)
             if i > 0:
                 node.next_to(self.nodes[i - 1], RIGHT * self.buff)
             self.nodes.add(node)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+import numpy as np
+import manim
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert a value to a hashable equivalent, to be used in a cache key.
+
+    Arguments:
+        value: The value, lists, tuples, sets, dicts and arrays are converted recursively.
+
+    Returns:
+        The hashable value.
+
+    Raises:
+        TypeError: If the value cannot be made hashable.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    hash(value)
+    return value
+
+
+class MobjectCache:
+    """
+    Least recently used cache of mobjects by factory, arguments and config.
+
+    The first call builds a template mobject, and every call
+    returns a copy of it, so the template is never animated.
+    Copying skips the LaTeX and SVG work of mobjects like `manim.MathTex`.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.templates: OrderedDict[Tuple, manim.Mobject] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def get(self, factory: Callable[..., manim.Mobject], *args, **config) -> manim.Mobject:
+        """
+        Get a copy of the mobject built by `factory(*args, **config)`.
+
+        Arguments:
+            factory: The mobject factory, e.g. `manim.MathTex`.
+            args: The positional arguments of the factory.
+            config: The keyword arguments of the factory.
+
+        Returns:
+            A new mobject. If the arguments cannot be hashed,
+            the factory is called without caching.
+        """
+        try:
+            key = (factory, freeze(args), freeze(config))
+        except TypeError:
+            return factory(*args, **config)
+
+        template = self.templates.get(key)
+        if template is None:
+            self.misses += 1
+            template = factory(*args, **config)
+            self.templates[key] = template
+            if len(self.templates) > self.maxsize:
+                self.templates.popitem(last=False)
+        else:
+            self.hits += 1
+            self.templates.move_to_end(key)
+
+        return template.copy()
+
+    def clear(self):
+        """
+        Remove all the templates and reset the statistics.
+        """
+        self.templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+mobject_cache = MobjectCache()
+
+
+def cached_mobject(factory: Callable[..., manim.Mobject], *args, **config) -> manim.Mobject:
+    """
+    Get a copy of the mobject built by `factory(*args, **config)` from the shared cache.
+
+    Arguments:
+        factory: The mobject factory, e.g. `manim.MathTex`.
+        args: The positional arguments of the factory.
+        config: The keyword arguments of the factory.
+
+    Returns:
+        A new mobject.
+    """
+    return mobject_cache.get(factory, *args, **config)
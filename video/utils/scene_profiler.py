@@ -0,0 +1,199 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+import csv
+import json
+import os
+import sys
+import time
+import manim
+
+
+class PlayRecord(NamedTuple):
+    """
+    Measurements of one `play` or `wait` call.
+    """
+
+    index: int
+    kind: str
+    line: int
+    description: str
+    wall_time: float
+    frames: int
+    skipped: bool
+    scene_mobjects: int
+    scene_family: int
+    animated_family: int
+
+
+def describe_animations(args) -> str:
+    """
+    Describe the animations of a `play` call, e.g. `Create(Line), FadeIn(MathTex)`.
+
+    Arguments:
+        args: The positional arguments of `play`.
+
+    Returns:
+        The description.
+    """
+    parts = []
+    for arg in args:
+        mobject = getattr(arg, "mobject", None)
+        if isinstance(arg, manim.Animation):
+            name = type(arg).__name__
+        else:
+            # `mobject.animate` builders
+            name = "animate"
+        parts.append(f"{name}({type(mobject).__name__})" if mobject is not None else name)
+    return ", ".join(parts)
+
+
+def count_animated(args) -> int:
+    """
+    Count the mobjects animated by a `play` call, submobjects included.
+
+    Arguments:
+        args: The positional arguments of `play`.
+
+    Returns:
+        The number of mobjects in the families of the animated mobjects.
+    """
+    return sum(
+        len(arg.mobject.get_family())
+        for arg in args
+        if getattr(arg, "mobject", None) is not None
+    )
+
+
+class ProfiledScene:
+    """
+    Mixin recording, for every `play` and `wait` of a scene, the wall time,
+    the frames produced and the number of mobjects in the scene and animated.
+
+    Put it before the scene class, e.g. `class dp_08_01(ProfiledScene, manim.Scene)`.
+    After the render, the profile is written to `profiles/<Scene>.json` and
+    `profiles/<Scene>.csv` in the media directory, and the slowest calls are printed.
+    Set the `SCENE_PROFILE` environment variable to `0` to disable it,
+    and `SCENE_PROFILE_TOP` to the number of calls to print.
+    """
+
+    def setup(self):
+        super().setup()
+        self.profile: List[PlayRecord] = []
+        self._profile_depth = 0
+        self.profile_enabled = os.environ.get("SCENE_PROFILE", "1") != "0"
+
+    def play(self, *args, **kwargs):
+        if not self.profile_enabled or self._profile_depth:
+            return super().play(*args, **kwargs)
+        return self._record("play", describe_animations(args), count_animated(args), super().play, args, kwargs)
+
+    def wait(self, *args, **kwargs):
+        # `wait` plays a `Wait` animation, which is not recorded twice
+        if not self.profile_enabled or self._profile_depth:
+            return super().wait(*args, **kwargs)
+        return self._record("wait", "Wait", 0, super().wait, args, kwargs)
+
+    def _record(self, kind: str, description: str, animated_family: int, call, args, kwargs):
+        """
+        Call `play` or `wait` and record its measurements.
+
+        Arguments:
+            kind: `play` or `wait`.
+            description: The description of the animations.
+            animated_family: The number of animated mobjects.
+            call: The method of the scene class.
+            args: The positional arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        # Line of the call in `construct`, or wherever the scene calls it from
+        line = sys._getframe(2).f_lineno
+        start_time = getattr(self.renderer, "time", 0)
+
+        self._profile_depth += 1
+        start = time.perf_counter()
+        try:
+            result = call(*args, **kwargs)
+        finally:
+            self._profile_depth -= 1
+        wall_time = time.perf_counter() - start
+
+        frames = round((getattr(self.renderer, "time", 0) - start_time) * manim.config.frame_rate)
+        self.profile.append(
+            PlayRecord(
+                index=len(self.profile),
+                kind=kind,
+                line=line,
+                description=description,
+                wall_time=wall_time,
+                frames=frames,
+                skipped=bool(getattr(self.renderer, "skip_animations", False)),
+                scene_mobjects=len(self.mobjects),
+                scene_family=len(self.get_mobject_family_members()),
+                animated_family=animated_family,
+            )
+        )
+        return result
+
+    def render(self, *args, **kwargs):
+        result = super().render(*args, **kwargs)
+        if self.profile_enabled:
+            self.write_profile()
+            print(self.profile_report(int(os.environ.get("SCENE_PROFILE_TOP", 10))))
+        return result
+
+    def write_profile(self, directory: Optional[Path] = None):
+        """
+        Write the profile as JSON and CSV.
+
+        Arguments:
+            directory: The directory, `profiles` in the media directory by default.
+        """
+        if directory is None:
+            directory = Path(manim.config.get_dir("media_dir")) / "profiles"
+        directory.mkdir(parents=True, exist_ok=True)
+        name = type(self).__name__
+
+        with open(directory / f"{name}.json", "w") as f:
+            json.dump(
+                {
+                    "scene": name,
+                    "frame_rate": manim.config.frame_rate,
+                    "wall_time": sum(record.wall_time for record in self.profile),
+                    "calls": [record._asdict() for record in self.profile],
+                },
+                f,
+                indent=2,
+            )
+
+        with open(directory / f"{name}.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(PlayRecord._fields)
+            writer.writerows(self.profile)
+
+    def profile_report(self, top: int = 10) -> str:
+        """
+        Format the slowest calls as a table.
+
+        Arguments:
+            top: The number of calls.
+
+        Returns:
+            The table.
+        """
+        total = sum(record.wall_time for record in self.profile) or 1
+        hottest = sorted(self.profile, key=lambda record: -record.wall_time)[:top]
+        lines = [
+            f"{type(self).__name__}: {len(self.profile)} calls, {total:.2f}s, top {len(hottest)}:",
+            f"{'#':>5} {'line':>5} {'time':>8} {'share':>6} {'frames':>6} {'scene':>6} {'animated':>8}  animations",
+        ]
+        for record in hottest:
+            lines.append(
+                f"{record.index:>5} {record.line:>5} {record.wall_time:>7.3f}s {record.wall_time / total:>6.1%} "
+                f"{record.frames:>6} {record.scene_family:>6} {record.animated_family:>8}  "
+                f"{record.kind}: {record.description[:80]}"
+            )
+        return "\n".join(lines)
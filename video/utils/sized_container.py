@@ -1,14 +1,30 @@
 from __future__ import annotations
+import numpy as np
 import manim
 
 
 class SizedContainer(manim.VGroup):
+    """
+    Group holding a mobject in a box of a given size, so table cells
+    keep the same size whatever their content.
+
+    By default the box is the container's own points, one straight curve
+    between two opposite corners, so it needs no extra submobject and
+    follows every shift, scale and `Transform` of the container. Being
+    the path of a `VMobject`, it is still passed to the renderer like any
+    other path, it is only kept transparent whatever style the container
+    gets. With `show_outline`, the box is drawn as a `manim.Rectangle`.
+    With `outline_rectangle`, an invisible rectangle is added instead,
+    like older versions did, for scenes relying on that submobject.
+    """
+
     def __init__(
         self,
         width: float,
         height: float,
         mobject: manim.VMobject,
         show_outline: bool = False,
+        outline_rectangle: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -16,21 +32,55 @@ class SizedContainer(manim.VGroup):
         self.target_height = height
         self.element = mobject
         self.outline = 1 if show_outline else 0
+        self.outline_rectangle = show_outline or outline_rectangle
         self.setup()
 
     def setup(self):
         self.add(self.element)
-        self.add(
-            manim.Rectangle(
-                width=self.target_width,
-                height=self.target_height,
-                stroke_width=self.outline,
-                stroke_opacity=self.outline,
+        if self.outline_rectangle:
+            self.add(
+                manim.Rectangle(
+                    width=self.target_width,
+                    height=self.target_height,
+                    stroke_width=self.outline,
+                    stroke_opacity=self.outline,
+                )
             )
-        )
+        else:
+            # One straight curve between opposite corners, centered on the element
+            corner = np.array([self.target_width / 2, self.target_height / 2, 0])
+            center = self.element.get_center()
+            self.set_points(np.linspace(center - corner, center + corner, 4))
+            self._hide_box()
 
         self.center()
 
+    def _hide_box(self):
+        """
+        Keep the box itself transparent, whatever style the container gets.
+        """
+        # Style set before `setup`, by the base class
+        if getattr(self, "outline_rectangle", True):
+            return
+        self.stroke_width = 0
+        self.background_stroke_width = 0
+        self.fill_rgbas = self.fill_rgbas.copy()
+        self.fill_rgbas[:, 3] = 0
+
+    def set_stroke(self, *args, **kwargs):
+        super().set_stroke(*args, **kwargs)
+        self._hide_box()
+        return self
+
+    def set_fill(self, *args, **kwargs):
+        super().set_fill(*args, **kwargs)
+        self._hide_box()
+        return self
+
+    def interpolate_color(self, *args, **kwargs):
+        super().interpolate_color(*args, **kwargs)
+        self._hide_box()
+
     def set_opacity(self, opacity: float):
         self.element.set_opacity(opacity)
         return self
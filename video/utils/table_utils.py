@@ -1,6 +1,40 @@
-from typing import Sequence
+from __future__ import annotations
+from typing import Any, Callable, Dict, Mapping, Sequence, Tuple
+import weakref
+import numpy as np
 import manim
 
+from utils.tex_cache import math_tex
+
+
+def _entry_offset(table: manim.Table) -> int:
+    """
+    Get the offset of the flat index of an entry in `table.elements`,
+    which has no top left entry when the table has both labels but no `top_left_entry`.
+    """
+    if (
+        table.row_labels is not None
+        and table.col_labels is not None
+        and table.top_left_entry is None
+    ):
+        return 2
+    return 1
+
+
+def entry_indices(table: manim.Table, positions: np.ndarray) -> np.ndarray:
+    """
+    Get the flat indices in `table.elements` of the entries at the given positions.
+
+    Arguments:
+        table: the table
+        positions: the positions of the entries, 1-indexed like `get_entries`, array of shape (n, 2)
+
+    Returns:
+        the indices, array of shape (n,)
+    """
+    positions = np.asarray(positions, dtype=int).reshape(-1, 2)
+    return len(table.mob_table[0]) * (positions[:, 0] - 1) + positions[:, 1] - _entry_offset(table)
+
 
 def set_table_mobject(table: manim.Table, pos: Sequence[int], mobject: manim.VMobject):
     """
@@ -12,13 +46,191 @@ def set_table_mobject(table: manim.Table, pos: Sequence[int], mobject: manim.VMo
         mobject: the mobject to set
     """
     mobject.move_to(table.get_entries(pos))
-    if (
-        table.row_labels is not None
-        and table.col_labels is not None
-        and table.top_left_entry is None
-    ):
-        index = len(table.mob_table[0]) * (pos[0] - 1) + pos[1] - 2
-        table.elements[index] = mobject
-    else:
-        index = len(table.mob_table[0]) * (pos[0] - 1) + pos[1] - 1
-        table.elements[index] = mobject
+    index = len(table.mob_table[0]) * (pos[0] - 1) + pos[1] - _entry_offset(table)
+    table.elements[index] = mobject
+
+
+def _place_entries(
+    table: manim.Table,
+    positions: np.ndarray,
+    mobjects: Sequence[manim.VMobject],
+    centers: np.ndarray,
+):
+    """
+    Move mobjects of known centers to the cells at the given positions,
+    and splice them into `table.elements` without its checks.
+    """
+    indices = entry_indices(table, positions)
+    # Positions past the end of a row wrap to the next one, like in `get_entries`
+    rows, cols = np.divmod(indices + _entry_offset(table) - 1, len(table.mob_table[0]))
+    targets = table_geometry(table).centers[rows, cols]
+    elements = table.elements.submobjects
+    for index, shift, mobject in zip(indices.tolist(), targets - centers, mobjects):
+        mobject.shift(shift)
+        elements[index] = mobject
+
+
+def set_table_mobjects(table: manim.Table, mobjects: Mapping[Tuple[int, int], manim.VMobject]):
+    """
+    Set many mobjects in the table at once, like `set_table_mobject` for each of them.
+
+    The targets are the cached cell centers of `table_geometry`, so the entries
+    being replaced are not measured, and the flat indices and the shifts are
+    computed for all the positions together.
+
+    Arguments:
+        table: the table to set the mobjects in
+        mobjects: the mobject of each position
+    """
+    if not mobjects:
+        return
+    centers = np.array([mobject.get_center() for mobject in mobjects.values()])
+    _place_entries(table, np.array(list(mobjects.keys())), list(mobjects.values()), centers)
+
+
+def set_table_values(
+    table: manim.Table,
+    values: Mapping[Tuple[int, int], Any] | np.ndarray,
+    origin: Tuple[int, int] = (1, 1),
+    to_mobject: Callable[[str], manim.VMobject] = math_tex,
+) -> Dict[Tuple[int, int], manim.VMobject]:
+    """
+    Set the mobjects of many values in the table at once.
+
+    Each distinct value is built and measured once by `to_mobject`, and every
+    other entry showing it gets a copy, moved by the shift of its own cell.
+
+    Arguments:
+        table: the table to set the values in
+        values: the value of each position, or an array of values,
+            None values being skipped
+        origin: the position of `values[0, 0]` when the values are an array
+        to_mobject: the function building the mobject of the text of a value
+
+    Returns:
+        the mobject of each position, e.g. to animate them
+    """
+    if isinstance(values, np.ndarray):
+        rows, cols = np.indices(values.shape[:2])
+        values = {
+            (int(i) + origin[0], int(j) + origin[1]): value
+            for i, j, value in zip(rows.ravel(), cols.ravel(), values.ravel())
+            if value is not None
+        }
+    if not values:
+        return {}
+
+    templates: Dict[str, Tuple[manim.VMobject, np.ndarray]] = {}
+    mobjects: Dict[Tuple[int, int], manim.VMobject] = {}
+    centers = np.empty((len(values), 3))
+    for n, (pos, value) in enumerate(values.items()):
+        text = str(value)
+        if text in templates:
+            template, centers[n] = templates[text]
+            mobjects[pos] = template.copy()
+        else:
+            mobjects[pos] = to_mobject(text)
+            centers[n] = mobjects[pos].get_center()
+            templates[text] = mobjects[pos], centers[n].copy()
+
+    _place_entries(table, np.array(list(mobjects.keys())), list(mobjects.values()), centers)
+    return mobjects
+
+
+def _placement(table: manim.Table) -> np.ndarray:
+    """
+    Get a few points that move with the table, to find out whether it moved or scaled:
+    the ends of its first horizontal and vertical lines, or its corners without lines.
+    """
+    lines = [group[0] for group in (table.get_horizontal_lines(), table.get_vertical_lines()) if len(group)]
+    if len(lines) == 2:
+        return np.concatenate([line.points[[0, -1]] for line in lines])
+    return np.array([table.get_corner(manim.UL), table.get_corner(manim.DR)])
+
+
+class TableGeometry:
+    """
+    Cell geometry of a table as arrays, the same as `table.get_cell` gives
+    without building a `manim.Polygon` per call.
+
+    Attributes:
+        centers: the center of each cell, array of shape (rows, cols, 3),
+            `[i - 1, j - 1]` for the position `(i, j)`
+        widths: the width of each cell, array of shape (rows, cols)
+        heights: the height of each cell, array of shape (rows, cols)
+    """
+
+    def __init__(self, table: manim.Table):
+        self.placement = _placement(table)
+
+        # Bounds of each entry, measured once for its row and its column
+        shape = (len(table.mob_table), len(table.mob_table[0]))
+        lows = np.full(shape + (3,), np.inf)
+        highs = np.full(shape + (3,), -np.inf)
+        for i, row in enumerate(table.mob_table):
+            for j, entry in enumerate(row):
+                points = entry.get_points_defining_boundary()
+                if len(points):
+                    lows[i, j] = points.min(axis=0)
+                    highs[i, j] = points.max(axis=0)
+
+        # Bounds of the rows and columns, with the buffers, as in `get_cell`
+        tops = highs[..., 1].max(axis=1) + table.v_buff / 2
+        bottoms = lows[..., 1].min(axis=1) - table.v_buff / 2
+        lefts = lows[..., 0].min(axis=0) - table.h_buff / 2
+        rights = highs[..., 0].max(axis=0) + table.h_buff / 2
+
+        self.centers = np.zeros(shape + (3,))
+        self.centers[..., 0] = (lefts + rights)[np.newaxis, :] / 2
+        self.centers[..., 1] = (tops + bottoms)[:, np.newaxis] / 2
+        self.widths = np.broadcast_to((rights - lefts)[np.newaxis, :], shape)
+        self.heights = np.broadcast_to((tops - bottoms)[:, np.newaxis], shape)
+
+    def is_current(self, table: manim.Table) -> bool:
+        """
+        Check whether the table did not move or scale since the geometry was computed.
+
+        Arguments:
+            table: the table of the geometry
+
+        Returns:
+            True if the geometry still holds
+        """
+        placement = _placement(table)
+        return placement.shape == self.placement.shape and np.allclose(placement, self.placement)
+
+
+_geometries: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def table_geometry(table: manim.Table) -> TableGeometry:
+    """
+    Get the cell geometry of a table, computed again only when the table moved or scaled.
+
+    Entries replaced by `set_table_mobject` are centered on the entries they replace,
+    so as long as they fit in their cells, the geometry holds.
+
+    Arguments:
+        table: the table
+
+    Returns:
+        the geometry
+    """
+    geometry = _geometries.get(table)
+    if geometry is None or not geometry.is_current(table):
+        geometry = _geometries[table] = TableGeometry(table)
+    return geometry
+
+
+def cell_center(table: manim.Table, pos: Sequence[int]) -> np.ndarray:
+    """
+    Get the center of a cell, like `table.get_cell(pos).get_center()`.
+
+    Arguments:
+        table: the table
+        pos: the position of the cell, array of shape (2,)
+
+    Returns:
+        the center, array of shape (3,)
+    """
+    return table_geometry(table).centers[pos[0] - 1, pos[1] - 1].copy()
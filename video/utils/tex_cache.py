@@ -0,0 +1,321 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+import manim
+from manim.utils.color import rgb_to_color
+
+from utils.mobject_cache import cached_mobject
+
+
+# Keyword arguments whose effect is fully captured by the stored geometry and style
+SUPPORTED_KWARGS = {
+    "font_size",
+    "color",
+    "arg_separator",
+    "tex_environment",
+    "substrings_to_isolate",
+    "tex_template",
+}
+
+# Attributes set by the constructors of `SingleStringMathTex` and `MathTex`
+TEX_ATTRIBUTES = [
+    "tex_string",
+    "tex_environment",
+    "_font_size",
+    "organize_left_to_right",
+    "initial_height",
+    "should_center",
+    "svg_height",
+    "svg_width",
+]
+MATH_TEX_ATTRIBUTES = [
+    *TEX_ATTRIBUTES,
+    "tex_strings",
+    "arg_separator",
+    "substrings_to_isolate",
+    "brace_notation_split_occurred",
+]
+
+
+class TexGeometryCache:
+    """
+    Persistent cache of the geometry of `manim.MathTex` and `manim.Tex` mobjects.
+
+    Each entry is addressed by a hash of the class, the tex strings,
+    the keyword arguments, the tex template and the manim version, and holds
+    the points of every glyph and the style of every submobject as `.npy` files,
+    with the submobject structure as JSON. Loading an entry memory-maps the arrays
+    and rebuilds the mobject without running LaTeX or parsing SVG.
+    """
+
+    def __init__(self, directory: Optional[str | os.PathLike] = None):
+        self._directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self) -> Path:
+        """
+        The cache directory, `tex_geometry` in the media directory by default.
+        """
+        if self._directory is None:
+            return Path(manim.config.get_dir("media_dir")) / "tex_geometry"
+        return self._directory
+
+    def get(self, cls: Type[manim.MathTex], *tex_strings, **kwargs) -> manim.MathTex:
+        """
+        Get the mobject `cls(*tex_strings, **kwargs)`, from the cache if possible.
+
+        Arguments:
+            cls: `manim.MathTex` or `manim.Tex`.
+            tex_strings: The tex strings.
+            kwargs: The keyword arguments, others than `SUPPORTED_KWARGS`
+                bypass the cache.
+
+        Returns:
+            The mobject.
+        """
+        if not set(kwargs) <= SUPPORTED_KWARGS:
+            return cls(*tex_strings, **kwargs)
+
+        key = self.key(cls, *tex_strings, **kwargs)
+        path = self.directory / key
+        if path.with_suffix(".json").exists():
+            try:
+                mobject = self.load(cls, path, **kwargs)
+                self.hits += 1
+                return mobject
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self.misses += 1
+        mobject = cls(*tex_strings, **kwargs)
+        self.store(mobject, path)
+        return mobject
+
+    @staticmethod
+    def key(cls: Type[manim.MathTex], *tex_strings, **kwargs) -> str:
+        """
+        Get the content address of the mobject `cls(*tex_strings, **kwargs)`.
+
+        Arguments:
+            cls: `manim.MathTex` or `manim.Tex`.
+            tex_strings: The tex strings.
+            kwargs: The keyword arguments.
+
+        Returns:
+            The hex digest.
+        """
+        tex_template = kwargs.pop("tex_template", None) or manim.config["tex_template"]
+        content = {
+            "class": cls.__name__,
+            "tex_strings": [str(tex) for tex in tex_strings],
+            "kwargs": {k: str(v) for k, v in sorted(kwargs.items())},
+            "tex_template": getattr(tex_template, "body", repr(tex_template)),
+            "renderer": str(manim.config.renderer),
+            "manim": manim.__version__,
+        }
+        return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+    def store(self, mobject: manim.MathTex, path: Path):
+        """
+        Store the geometry of the mobject.
+
+        The files are written to temporary files and then renamed,
+        so concurrent renders never read a partial entry.
+
+        Arguments:
+            mobject: The mobject, as constructed.
+            path: The path of the entry, without suffix.
+        """
+        points: List[np.ndarray] = []
+        styles: List[np.ndarray] = []
+        parts = []
+        styles.append(self._get_style(mobject))
+        for part in mobject.submobjects:
+            styles.append(self._get_style(part))
+            leaves = []
+            for leaf in part.submobjects:
+                styles.append(self._get_style(leaf))
+                points.append(leaf.points)
+                leaves.append(
+                    [isinstance(leaf, manim.VectorizedPoint), len(leaf.points)]
+                )
+            parts.append(
+                {
+                    "attributes": {
+                        attribute: getattr(part, attribute)
+                        for attribute in TEX_ATTRIBUTES
+                        if hasattr(part, attribute)
+                    },
+                    "leaves": leaves,
+                }
+            )
+
+        meta = {
+            "attributes": {
+                attribute: getattr(mobject, attribute)
+                for attribute in MATH_TEX_ATTRIBUTES
+                if hasattr(mobject, attribute)
+            },
+            "parts": parts,
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write(path.with_suffix(".points.npy"), lambda f: np.save(f, np.concatenate(points or [np.zeros((0, 3))])))
+        self._write(path.with_suffix(".style.npy"), lambda f: np.save(f, np.array(styles)))
+        self._write(path.with_suffix(".json"), lambda f: f.write(json.dumps(meta, default=float).encode()))
+
+    def load(self, cls: Type[manim.MathTex], path: Path, **kwargs) -> manim.MathTex:
+        """
+        Rebuild a mobject from its stored geometry.
+
+        Arguments:
+            cls: `manim.MathTex` or `manim.Tex`.
+            path: The path of the entry, without suffix.
+            kwargs: The keyword arguments the mobject was constructed with.
+
+        Returns:
+            The mobject.
+        """
+        meta = json.loads(path.with_suffix(".json").read_text())
+        points = np.load(path.with_suffix(".points.npy"), mmap_mode="r")
+        styles = np.load(path.with_suffix(".style.npy"), mmap_mode="r")
+        tex_template = kwargs.get("tex_template") or manim.config["tex_template"]
+
+        mobject = self._skeleton(cls, meta["attributes"], tex_template)
+        mobject.tex_to_color_map = {}
+        style_index = 0
+        self._set_style(mobject, styles[style_index])
+
+        start = 0
+        for part_meta in meta["parts"]:
+            style_index += 1
+            part = self._skeleton(manim.SingleStringMathTex, part_meta["attributes"], tex_template)
+            self._set_style(part, styles[style_index])
+            for is_point, count in part_meta["leaves"]:
+                style_index += 1
+                leaf_points = np.array(points[start:start + count])
+                start += count
+                if is_point:
+                    leaf = manim.VectorizedPoint(leaf_points[0])
+                else:
+                    leaf = manim.VMobject()
+                    leaf.set_points(leaf_points)
+                self._set_style(leaf, styles[style_index])
+                part.add(leaf)
+            mobject.add(part)
+
+        return mobject
+
+    @staticmethod
+    def _skeleton(cls: Type[manim.VMobject], attributes: Dict[str, Any], tex_template) -> Any:
+        """
+        Create a mobject of the class without running its constructor,
+        which would compile the LaTeX.
+
+        Arguments:
+            cls: The class.
+            attributes: The attributes set by the constructor.
+            tex_template: The tex template.
+
+        Returns:
+            The empty mobject.
+        """
+        mobject = cls.__new__(cls)
+        manim.VMobject.__init__(mobject)
+        mobject.__dict__.update(attributes)
+        mobject.tex_template = tex_template
+        mobject.file_name = None
+        return mobject
+
+    @staticmethod
+    def _get_style(mobject: manim.VMobject) -> np.ndarray:
+        """
+        Get the style of the mobject itself.
+
+        Arguments:
+            mobject: The mobject.
+
+        Returns:
+            The fill rgba, stroke rgba and stroke width, array of shape (9,).
+        """
+        return np.array(
+            [
+                *mobject.get_fill_rgbas()[0],
+                *mobject.get_stroke_rgbas()[0],
+                mobject.get_stroke_width(),
+            ]
+        )
+
+    @staticmethod
+    def _set_style(mobject: manim.VMobject, style: np.ndarray):
+        """
+        Set the style of the mobject itself.
+
+        Arguments:
+            mobject: The mobject.
+            style: The style, as given by `_get_style`.
+        """
+        mobject.set_fill(rgb_to_color(style[0:3]), opacity=float(style[3]), family=False)
+        mobject.set_stroke(
+            rgb_to_color(style[4:7]),
+            width=float(style[8]),
+            opacity=float(style[7]),
+            family=False,
+        )
+        mobject.color = rgb_to_color(style[0:3])
+
+    @staticmethod
+    def _write(path: Path, write):
+        """
+        Write a file atomically.
+
+        Arguments:
+            path: The path of the file.
+            write: The function writing the content to a binary file object.
+        """
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+
+tex_geometry_cache = TexGeometryCache()
+
+
+def math_tex(*tex_strings, **kwargs) -> manim.MathTex:
+    """
+    Get a `manim.MathTex`, from memory or from the persistent geometry cache.
+
+    Arguments:
+        tex_strings: The tex strings.
+        kwargs: The keyword arguments of `manim.MathTex`.
+
+    Returns:
+        The mobject.
+    """
+    return cached_mobject(tex_geometry_cache.get, manim.MathTex, *tex_strings, **kwargs)
+
+
+def tex(*tex_strings, **kwargs) -> manim.Tex:
+    """
+    Get a `manim.Tex`, from memory or from the persistent geometry cache.
+
+    Arguments:
+        tex_strings: The tex strings.
+        kwargs: The keyword arguments of `manim.Tex`.
+
+    Returns:
+        The mobject.
+    """
+    return cached_mobject(tex_geometry_cache.get, manim.Tex, *tex_strings, **kwargs)
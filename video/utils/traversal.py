@@ -0,0 +1,259 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Dict, Generator, List, Tuple
+import numpy as np
+
+
+def bfs(root: Any) -> Generator[Any, None, None]:
+    """
+    Breadth-first search the tree, yielding one node at a time,
+    left to right.
+
+    Arguments:
+        root: The root node of the tree, with `left` and `right` children.
+
+    Returns:
+        A generator of nodes.
+    """
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left is not None:
+            queue.append(node.left)
+        if node.right is not None:
+            queue.append(node.right)
+
+
+def bfs_layer_by_layer(root: Any) -> Generator[List[Any], None, None]:
+    """
+    Breadth-first search the tree, yielding one layer at a time.
+
+    Arguments:
+        root: The root node of the tree, with `left` and `right` children.
+
+    Returns:
+        A generator of layers.
+    """
+    layer = [root]
+    while layer:
+        yield layer
+        next_layer = []
+        for node in layer:
+            if node.left is not None:
+                next_layer.append(node.left)
+            if node.right is not None:
+                next_layer.append(node.right)
+        layer = next_layer
+
+
+def dfs(root: Any) -> Generator[Any, None, None]:
+    """
+    Depth-first search the tree, yielding one node at a time,
+    left to right.
+
+    Arguments:
+        root: The root node of the tree, with `left` and `right` children.
+
+    Returns:
+        A generator of nodes.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+
+
+def dfs_right_to_left(root: Any) -> Generator[Any, None, None]:
+    """
+    Depth-first search the tree, yielding one node at a time,
+    right to left.
+
+    Arguments:
+        root: The root node of the tree, with `left` and `right` children.
+
+    Returns:
+        A generator of nodes.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.left is not None:
+            stack.append(node.left)
+        if node.right is not None:
+            stack.append(node.right)
+
+
+class LevelIndex:
+    """
+    Nodes of a tree in BFS order, indexed by level.
+
+    It is built in one pass, after which the depth, the breadth
+    and the nodes of each level are plain lookups.
+
+    Attributes:
+        order: The nodes in BFS order.
+        level_starts: The index in `order` where each level starts,
+            with one extra entry for the end of the last level.
+        parents: The index in `order` of the parent of each node,
+            the root being its own parent.
+        directions: -1 for left children, 1 for right children, 0 for the root.
+        edges: The (parent, child) indices in `order` of each edge, array of shape (m, 2).
+        edge_directions: -1 for edges to left children, 1 for right children.
+    """
+
+    def __init__(self, root: Any):
+        self.order: List[Any] = []
+        self.level_starts: List[int] = []
+        parents = [0]
+        directions = [0]
+
+        for layer in bfs_layer_by_layer(root):
+            self.level_starts.append(len(self.order))
+            for node in layer:
+                index = len(self.order)
+                self.order.append(node)
+                if node.left is not None:
+                    parents.append(index)
+                    directions.append(-1)
+                if node.right is not None:
+                    parents.append(index)
+                    directions.append(1)
+        self.level_starts.append(len(self.order))
+
+        self.parents = np.array(parents, dtype=np.intp)
+        self.directions = np.array(directions, dtype=np.intp)
+        self.edges = np.stack(
+            [self.parents[1:], np.arange(1, len(self.order), dtype=np.intp)], axis=1
+        )
+        self.edge_directions = self.directions[1:]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of levels of the tree.
+        """
+        return len(self.level_starts) - 1
+
+    @property
+    def breadth(self) -> int:
+        """
+        The number of nodes in the widest level of the tree.
+        """
+        return int(np.diff(self.level_starts).max(initial=0))
+
+    def level_slice(self, level: int) -> slice:
+        """
+        Get the slice of `order` holding the nodes of the level.
+
+        Arguments:
+            level: The level, 0 being the root.
+
+        Returns:
+            The slice.
+        """
+        return slice(self.level_starts[level], self.level_starts[level + 1])
+
+    def layer(self, level: int) -> List[Any]:
+        """
+        Get the nodes of the level, left to right.
+
+        Arguments:
+            level: The level, 0 being the root.
+
+        Returns:
+            The nodes.
+        """
+        return self.order[self.level_slice(level)]
+
+    def layers(self) -> Generator[List[Any], None, None]:
+        """
+        Iterate the levels, yielding one layer at a time.
+
+        Returns:
+            A generator of layers.
+        """
+        for level in range(self.depth):
+            yield self.layer(level)
+
+    def levels(self) -> np.ndarray:
+        """
+        Get the level of each node, in BFS order.
+
+        Returns:
+            The levels, array of shape (n,).
+        """
+        return np.repeat(np.arange(self.depth), np.diff(self.level_starts))
+
+
+class DagLevelIndex(LevelIndex):
+    """
+    Nodes of a DAG with binary children, in level order, indexed by level.
+
+    Shared nodes appear once. A node's level is its longest distance
+    from the root, so every edge points down at least one level.
+    `parents` and `directions` describe the edge each node was first
+    reached by, while `edges` holds all of them.
+    """
+
+    def __init__(self, root: Any):
+        # Distinct nodes in pre-order, and a topological order (reverse post-order)
+        discovered: Dict[Any, int] = {}
+        preorder: List[Any] = []
+        postorder: List[Any] = []
+        stack = [(root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                postorder.append(node)
+                continue
+            if node in discovered:
+                continue
+            discovered[node] = len(preorder)
+            preorder.append(node)
+            stack.append((node, True))
+            for child in [node.right, node.left]:
+                if child is not None and child not in discovered:
+                    stack.append((child, False))
+
+        # Longest path layering
+        level = {root: 0}
+        first_parent: Dict[Any, Tuple[Any, int]] = {}
+        for node in reversed(postorder):
+            for child, direction in [(node.left, -1), (node.right, 1)]:
+                if child is None:
+                    continue
+                if level.get(child, -1) < level[node] + 1:
+                    level[child] = level[node] + 1
+                first_parent.setdefault(child, (node, direction))
+
+        self.order = sorted(preorder, key=lambda node: (level[node], discovered[node]))
+        index = {node: i for i, node in enumerate(self.order)}
+
+        depth = level[self.order[-1]] + 1
+        levels = np.array([level[node] for node in self.order], dtype=np.intp)
+        self.level_starts = np.searchsorted(levels, np.arange(depth + 1)).tolist()
+
+        self.parents = np.zeros(len(self.order), dtype=np.intp)
+        self.directions = np.zeros(len(self.order), dtype=np.intp)
+        for node, (parent, direction) in first_parent.items():
+            self.parents[index[node]] = index[parent]
+            self.directions[index[node]] = direction
+
+        edges = []
+        edge_directions = []
+        for i, node in enumerate(self.order):
+            for child, direction in [(node.left, -1), (node.right, 1)]:
+                if child is not None:
+                    edges.append((i, index[child]))
+                    edge_directions.append(direction)
+        self.edges = np.array(edges, dtype=np.intp).reshape(-1, 2)
+        self.edge_directions = np.array(edge_directions, dtype=np.intp)
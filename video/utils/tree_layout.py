@@ -0,0 +1,230 @@
+from __future__ import annotations
+from typing import List
+import numpy as np
+
+from utils.traversal import LevelIndex
+
+
+class TreeLayout:
+    """
+    Layout engine of a `BTree`.
+
+    A layout computes the position of every node relative to the root,
+    in units of the horizontal and vertical buffers of the tree,
+    which the tree then applies to its mobjects in one batch.
+    """
+
+    def compute(self, levels: LevelIndex) -> np.ndarray:
+        """
+        Compute the position of every node relative to the root.
+
+        Arguments:
+            levels: The nodes of the tree, indexed by level.
+
+        Returns:
+            The offsets in the order of `levels.order`, array of shape (n, 3).
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _level_offsets(levels: LevelIndex) -> np.ndarray:
+        """
+        Get offsets with each node one unit below the previous level,
+        and horizontally at the root.
+
+        Arguments:
+            levels: The nodes of the tree, indexed by level.
+
+        Returns:
+            The offsets, array of shape (n, 3).
+        """
+        offsets = np.zeros((len(levels), 3))
+        offsets[:, 1] = -levels.levels()
+        return offsets
+
+
+class HalvingLayout(TreeLayout):
+    """
+    Layout of a tree as if it were complete.
+
+    A child is positioned at the middle of its half of the parent's
+    width, and the root's width is the breadth of a complete tree
+    of the same depth.
+    """
+
+    def compute(self, levels: LevelIndex) -> np.ndarray:
+        offsets = self._level_offsets(levels)
+        breadth = 2 ** (levels.depth - 1)
+
+        # Parents of a level are all in the previous level
+        for depth in range(1, levels.depth):
+            level = levels.level_slice(depth)
+            offsets[level, 0] = (
+                offsets[levels.parents[level], 0]
+                + levels.directions[level] * breadth / 2 ** (depth + 1)
+            )
+
+        return offsets
+
+
+class LayeredLayout(TreeLayout):
+    """
+    Layout of a collapsed DAG, level by level.
+
+    The nodes of a level are spaced one unit apart around the root,
+    and every other level is staggered by half a unit, so that
+    edges skipping levels do not run through the nodes in between.
+    """
+
+    def compute(self, levels: LevelIndex) -> np.ndarray:
+        offsets = self._level_offsets(levels)
+
+        for depth in range(levels.depth):
+            level = levels.level_slice(depth)
+            count = level.stop - level.start
+            offsets[level, 0] = np.arange(count) - (count - 1) / 2 + 0.5 * (depth % 2)
+
+        return offsets
+
+
+class TidyLayout(TreeLayout):
+    """
+    Compact layout of a tree, by the Reingold-Tilford algorithm
+    in the linear time formulation of Walker, as fixed by Buchheim et al.
+
+    Subtrees are packed as close as `distance` allows, and a parent
+    is centered above its children. A single child is put half of
+    `distance` to its side, so left and right children stay distinguishable.
+    """
+
+    def __init__(self, distance: float = 1):
+        self.distance = distance
+
+    def compute(self, levels: LevelIndex) -> np.ndarray:
+        n = len(levels)
+        distance = self.distance
+
+        parents = levels.parents.tolist()
+        children: List[List[int]] = [[] for _ in range(n)]
+        single_side = [0] * n
+        for (i, j), direction in zip(levels.edges.tolist(), levels.edge_directions.tolist()):
+            children[i].append(j)
+            single_side[i] = direction
+
+        # Position among siblings, 1-based, and the leftmost sibling
+        number = [1] * n
+        leftmost = list(range(n))
+        for i in range(n):
+            for k, j in enumerate(children[i]):
+                number[j] = k + 1
+                leftmost[j] = children[i][0]
+
+        prelim = [0.0] * n
+        mod = [0.0] * n
+        change = [0.0] * n
+        shift = [0.0] * n
+        thread = [-1] * n
+        ancestor = list(range(n))
+
+        def next_left(v: int) -> int:
+            return children[v][0] if children[v] else thread[v]
+
+        def next_right(v: int) -> int:
+            return children[v][-1] if children[v] else thread[v]
+
+        def left_brother(v: int) -> int:
+            return -1 if number[v] == 1 else children[parents[v]][number[v] - 2]
+
+        def place(v: int):
+            brother = left_brother(v) if v != 0 else -1
+            if not children[v]:
+                prelim[v] = prelim[brother] + distance if brother != -1 else 0.0
+                return
+
+            if len(children[v]) == 1:
+                midpoint = prelim[children[v][0]] - single_side[v] * distance / 2
+            else:
+                midpoint = (prelim[children[v][0]] + prelim[children[v][-1]]) / 2
+            if brother != -1:
+                prelim[v] = prelim[brother] + distance
+                mod[v] = prelim[v] - midpoint
+            else:
+                prelim[v] = midpoint
+
+        def move_subtree(wl: int, wr: int, amount: float):
+            subtrees = number[wr] - number[wl]
+            change[wr] -= amount / subtrees
+            shift[wr] += amount
+            change[wl] += amount / subtrees
+            prelim[wr] += amount
+            mod[wr] += amount
+
+        def apportion(v: int, default_ancestor: int) -> int:
+            brother = left_brother(v)
+            if brother == -1:
+                return default_ancestor
+
+            vir = vor = v
+            vil = brother
+            vol = leftmost[v]
+            sir = sor = mod[v]
+            sil = mod[vil]
+            sol = mod[vol]
+            while next_right(vil) != -1 and next_left(vir) != -1:
+                vil = next_right(vil)
+                vir = next_left(vir)
+                vol = next_left(vol)
+                vor = next_right(vor)
+                ancestor[vor] = v
+                amount = (prelim[vil] + sil) - (prelim[vir] + sir) + distance
+                if amount > 0:
+                    a = ancestor[vil] if parents[ancestor[vil]] == parents[v] else default_ancestor
+                    move_subtree(a, v, amount)
+                    sir += amount
+                    sor += amount
+                sil += mod[vil]
+                sir += mod[vir]
+                sol += mod[vol]
+                sor += mod[vor]
+
+            if next_right(vil) != -1 and next_right(vor) == -1:
+                thread[vor] = next_right(vil)
+                mod[vor] += sil - sor
+            else:
+                if next_left(vir) != -1 and next_left(vol) == -1:
+                    thread[vol] = next_left(vir)
+                    mod[vol] += sir - sol
+                default_ancestor = v
+            return default_ancestor
+
+        def execute_shifts(v: int):
+            total_shift = total_change = 0.0
+            for w in reversed(children[v]):
+                prelim[w] += total_shift
+                mod[w] += total_shift
+                total_change += change[w]
+                total_shift += shift[w] + total_change
+
+        # First walk, children before parents, so deepest level first
+        for v in reversed(range(n)):
+            if not children[v]:
+                continue
+            default_ancestor = children[v][0]
+            for w in children[v]:
+                place(w)
+                default_ancestor = apportion(w, default_ancestor)
+            execute_shifts(v)
+        place(0)
+
+        # Second walk, accumulating the modifiers of the ancestors level by level
+        offsets = self._level_offsets(levels)
+        prelim_array = np.array(prelim)
+        mod_array = np.array(mod)
+        acc = np.zeros(n)
+        for depth in range(1, levels.depth):
+            level = levels.level_slice(depth)
+            acc[level] = acc[levels.parents[level]] + mod_array[levels.parents[level]]
+        offsets[:, 0] = prelim_array + acc
+        offsets[:, 0] -= offsets[0, 0]
+
+        return offsets